@@ -0,0 +1,93 @@
+"""
+Compare how fast material histories are rebuilt from an API response.
+
+The old approach serialized the response to a json string and parsed it back with the GEMD
+json support; the new one builds the objects in a single walk over the response. Run with
+
+    python scripts/benchmark_history_build.py [steps] [repeats]
+
+where `steps` is the number of process steps in the synthetic history.
+"""
+import json
+import sys
+from time import perf_counter
+from uuid import uuid4
+
+from gemd.entity.attribute import Condition, Property
+from gemd.entity.value import NominalReal
+from gemd.json import GEMDEncoder
+from gemd.util import writable_sort_order
+
+from citrine.resources.ingredient_run import IngredientRun
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.measurement_run import MeasurementRun
+from citrine.resources.process_run import ProcessRun
+
+
+def history_payload(steps: int) -> dict:
+    """A material-history response for a linear chain of `steps` processes."""
+    previous = None
+    for step in range(steps):
+        process = ProcessRun("step {}".format(step), uids={'id': str(uuid4())},
+                             conditions=[Condition("temperature",
+                                                   value=NominalReal(300 + step, "K"))])
+        if previous is not None:
+            IngredientRun(uids={'id': str(uuid4())}, material=previous, process=process,
+                          mass_fraction=NominalReal(0.5, ""))
+        material = MaterialRun("material {}".format(step), uids={'id': str(uuid4())},
+                               process=process, tags=["step::{}".format(step)])
+        MeasurementRun("measurement {}".format(step), uids={'id': str(uuid4())},
+                       material=material,
+                       properties=[Property("density", value=NominalReal(1.0 + step, "g/cm^3"))])
+        previous = material
+
+    dumped = json.loads(MaterialRun.get_json_support().dumps(previous))
+    root_uid = previous.uids['id']
+    root = next(obj for obj in dumped['context'] if obj['uids'].get('id') == root_uid)
+    return {'root': root, 'context': [obj for obj in dumped['context'] if obj is not root]}
+
+
+def _blob(data: dict) -> dict:
+    blob = dict()
+    blob["context"] = sorted(data['context'] + [data['root']],
+                             key=lambda x: writable_sort_order(x["type"]))
+    blob["object"] = {'type': 'link_by_uid', 'scope': 'id', 'id': data['root']['uids']['id']}
+    return blob
+
+
+def build_with_round_trip(data: dict) -> MaterialRun:
+    """The previous implementation of get_history."""
+    return MaterialRun.get_json_support().loads(
+        json.dumps(_blob(data), cls=GEMDEncoder, sort_keys=True))
+
+
+def build_directly(data: dict) -> MaterialRun:
+    """The current implementation of get_history."""
+    return MaterialRun.get_json_support().build(_blob(data))["object"]
+
+
+def objects_per_second(build, data: dict, repeats: int) -> float:
+    """Time `build` over `data`, returning the best rate over `repeats` runs."""
+    count = len(data['context']) + 1
+    best = float('inf')
+    for _ in range(repeats):
+        start = perf_counter()
+        build(data)
+        best = min(best, perf_counter() - start)
+    return count / best
+
+
+def main(steps: int = 200, repeats: int = 5):
+    """Print the objects per second of each approach."""
+    data = history_payload(steps)
+    assert build_directly(data).dump() == build_with_round_trip(data).dump()
+    before = objects_per_second(build_with_round_trip, data, repeats)
+    after = objects_per_second(build_directly, data, repeats)
+    print("{} objects in the history".format(len(data['context']) + 1))
+    print("json round-trip: {:10.0f} objects/sec".format(before))
+    print("direct build:    {:10.0f} objects/sec".format(after))
+    print("speed-up:        {:10.2f}x".format(after / before))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,109 @@
+"""
+Measure how long it takes to prepare the payload of a batch registration.
+
+The old approach populated uids with a throwaway GEMD json dump, dumped each model with its
+linked objects nested in full, scrubbed None values, replaced the nested objects with links
+and finally walked the whole graph again to strip temporary uids. The new one prepares each
+payload in a single walk. Run with
+
+    python scripts/benchmark_register_payload.py [objects] [repeats]
+
+where `objects` is the approximate number of data objects in the batch. Times are reported
+per 10k objects; the default batch is smaller because the old approach takes minutes on 10k.
+"""
+import sys
+from time import perf_counter
+from uuid import uuid4
+
+from gemd.entity.attribute import Condition, Property
+from gemd.entity.bounds import RealBounds
+from gemd.entity.value import NominalReal
+from gemd.json import GEMDJson
+from gemd.util import recursive_foreach
+
+from citrine._serialization.payload import PayloadWriter
+from citrine._utils.functions import replace_objects_with_links, scrub_none
+from citrine.resources.condition_template import ConditionTemplate
+from citrine.resources.ingredient_run import IngredientRun
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.material_spec import MaterialSpec
+from citrine.resources.measurement_run import MeasurementRun
+from citrine.resources.process_run import ProcessRun
+from citrine.resources.process_spec import ProcessSpec
+from citrine.resources.property_template import PropertyTemplate
+
+
+def batch(size: int, history_length: int = 5) -> list:
+    """
+    A batch of about `size` data objects, making up material histories of a few steps each.
+
+    Each step is a process, the material it makes, a measurement of that material and an
+    ingredient that feeds the previous material of the same history into the process. The
+    old approach walks the whole connected graph for every model, so long histories make
+    it quadratically slower.
+    """
+    temperature = ConditionTemplate("temperature", bounds=RealBounds(0, 1000, "K"),
+                                    uids={'id': str(uuid4())})
+    density = PropertyTemplate("density", bounds=RealBounds(0, 100, "g/cm^3"),
+                               uids={'id': str(uuid4())})
+    process_spec = ProcessSpec("mixing", uids={'id': str(uuid4())})
+    material_spec = MaterialSpec("mixture", process=process_spec, uids={'id': str(uuid4())})
+    models = []
+    previous = None
+    for step in range(size // 4):
+        process = ProcessRun("step {}".format(step), spec=process_spec, tags=["step"],
+                             conditions=[Condition("temperature", template=temperature,
+                                                   value=NominalReal(300 + step, "K"))])
+        material = MaterialRun("material {}".format(step), process=process, spec=material_spec)
+        measurement = MeasurementRun(
+            "measurement {}".format(step), material=material,
+            properties=[Property("density", template=density,
+                                 value=NominalReal(1.0 + step, "g/cm^3"))])
+        models.extend([process, material, measurement])
+        if previous is not None:
+            models.append(IngredientRun(material=previous, process=process))
+        previous = material if (step + 1) % history_length else None
+    return models
+
+
+def prepare_in_passes(models: list) -> list:
+    """The previous implementation, for a dry run."""
+    temp_scope = str(uuid4())
+    json = GEMDJson(scope=temp_scope)
+    [json.dumps(x) for x in models]
+    objects = [replace_objects_with_links(scrub_none(model.dump())) for model in models]
+    recursive_foreach(models, lambda x: x.uids.pop(temp_scope, None))
+    return objects
+
+
+def prepare_in_one_walk(models: list) -> list:
+    """The current implementation, for a dry run."""
+    writer = PayloadWriter(scope=str(uuid4()))
+    objects = [writer.dump(model) for model in models]
+    writer.remove_assigned_uids()
+    return objects
+
+
+def seconds_per_10k(prepare, models: list, repeats: int) -> float:
+    """Time `prepare` over `models`, returning the best time over `repeats` runs per 10k."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = perf_counter()
+        prepare(models)
+        best = min(best, perf_counter() - start)
+    return best / len(models) * 10000
+
+
+def main(size: int = 1000, repeats: int = 3):
+    """Print the payload preparation time of each approach."""
+    models = batch(size)
+    before = seconds_per_10k(prepare_in_passes, models, repeats)
+    after = seconds_per_10k(prepare_in_one_walk, models, repeats)
+    print("{} objects in the batch".format(len(models)))
+    print("separate passes: {:8.3f} s per 10k objects".format(before))
+    print("single walk:     {:8.3f} s per 10k objects".format(after))
+    print("speed-up:        {:8.2f}x".format(before / after))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -33,6 +33,9 @@ setup(name='citrine',
       extras_require={
           "builders": [
               "pandas>=1.1.0,<2"
+          ],
+          "async": [
+              "aiohttp>=3.7.4,<4"
           ]
       },
       classifiers=[
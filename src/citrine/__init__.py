@@ -1,5 +1,5 @@
 # TODO: Add a docstring here
-from citrine.citrine import Citrine  # noqa: F401
+from citrine.citrine import Citrine, AsyncCitrine  # noqa: F401
 import logging
 import warnings
 from .__version__ import __version__  # noqa: F401
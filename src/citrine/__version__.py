@@ -1 +1 @@
-__version__ = '1.6.1'
+__version__ = '1.30.0'
@@ -0,0 +1,314 @@
+import asyncio
+from os import environ
+from typing import Optional, Callable, AsyncIterator, Awaitable
+from logging import getLogger
+from datetime import datetime
+from json import loads
+from urllib.parse import urlunsplit
+
+from urllib3.util.retry import Retry, RequestHistory
+
+from citrine._session import Session, EXPIRATION_BUFFER_MILLIS, RETRY_STATUS_FORCELIST
+from citrine._utils.functions import format_escaped_url
+from citrine.exceptions import UnauthorizedRefreshToken
+
+import jwt
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+logger = getLogger(__name__)
+
+
+class AsyncResponse:
+    """
+    A fully-read response to a request made by an :class:`AsyncSession`.
+
+    It exposes the subset of the :class:`requests.Response` interface that is used to
+    interpret responses, so that the same status-code to exception mapping applies.
+    """
+
+    def __init__(self, *, status_code: int, reason: Optional[str], headers, content: bytes,
+                 request=None):
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.request = request
+
+    @property
+    def text(self) -> str:
+        """The body of the response, decoded as text."""
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        """Decode the body of the response as json."""
+        return loads(self.content)
+
+
+class AsyncSession:
+    """
+    An asyncio-native counterpart to :class:`~citrine._session.Session`.
+
+    Requests are issued with aiohttp, so a single event loop can keep many requests in
+    flight without dedicating a thread to each one. The session is refresh-token and schema
+    aware in the same way as the synchronous session, and maps HTTP status codes onto the
+    same exceptions.
+
+    The session must be closed when it is no longer needed, either by awaiting
+    :func:`close` or by using it as an async context manager.
+    """
+
+    def __init__(self,
+                 refresh_token: str = environ.get('CITRINE_API_KEY'),
+                 scheme: str = 'https',
+                 host: str = environ.get('CITRINE_API_HOST'),
+                 port: Optional[str] = None,
+                 *,
+                 max_connections: int = 100):
+        if aiohttp is None:  # pragma: no cover
+            raise ImportError('aiohttp is a requirement for the AsyncSession. '
+                              'Install it with `pip install citrine[async]`')
+        self.scheme: str = scheme
+        self.authority = ':'.join(([host] if host else []) + ([port] if port else []))
+        self.refresh_token: str = refresh_token
+        self.access_token: Optional[str] = None
+        self.access_token_expiration: datetime = datetime.utcnow()
+        self.headers = {"Content-Type": "application/json"}
+        self.max_connections = max_connections
+
+        # Mirror the retry policy that the synchronous session mounts on its HTTPAdapter
+        self.retries = Retry(total=10,
+                             connect=5,
+                             read=5,
+                             status=5,
+                             backoff_factor=0.25,
+                             status_forcelist=RETRY_STATUS_FORCELIST)
+        self.retry_errs = (ConnectionError, aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+        # Both of these bind to the running event loop, so they are created on first use
+        self._client: Optional['aiohttp.ClientSession'] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self) -> 'AsyncSession':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def _get_client(self) -> 'aiohttp.ClientSession':
+        if self._client is None or self._client.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._client = aiohttp.ClientSession(connector=connector, headers=self.headers)
+        return self._client
+
+    def _versioned_base_url(self, version: str = 'v1'):
+        return urlunsplit((
+            self.scheme,
+            self.authority,
+            format_escaped_url('api/{}/', version),
+            '',  # query string
+            ''  # fragment
+        ))
+
+    def _is_access_token_expired(self):
+        return self.access_token_expiration - EXPIRATION_BUFFER_MILLIS <= datetime.utcnow()
+
+    async def _refresh_access_token(self, stale_token: Optional[str] = None) -> None:
+        """
+        Refresh our access token, unless another task has already done so.
+
+        Concurrent callers share a single refresh request. If `stale_token` is given, the
+        refresh only happens if it is still the current access token.
+        """
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if stale_token is None and not self._is_access_token_expired():
+                return
+            if stale_token is not None and stale_token != self.access_token:
+                return
+            data = {'refresh_token': self.refresh_token}
+            response = await self._request_with_retry(
+                'POST', self._versioned_base_url() + 'tokens/refresh', json=data)
+
+            if response.status_code != 200:
+                raise UnauthorizedRefreshToken()
+            self.access_token = response.json()['access_token']
+            self.access_token_expiration = datetime.utcfromtimestamp(
+                jwt.decode(self.access_token, verify=False)['exp']
+            )
+
+    @staticmethod
+    def _encode_params(params: Optional[dict]) -> Optional[list]:
+        """Encode query parameters the way requests does, which aiohttp does not do for us."""
+        if params is None:
+            return None
+        encoded = []
+        for key, value in params.items():
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            encoded.extend((key, str(v)) for v in values if v is not None)
+        return encoded
+
+    async def _send(self, method: str, uri: str, **kwargs) -> AsyncResponse:
+        """Issue a single request and read its body."""
+        if 'params' in kwargs:
+            kwargs['params'] = self._encode_params(kwargs['params'])
+        headers = dict(kwargs.pop('headers', None) or {})
+        if self.access_token is not None:
+            headers["Authorization"] = "Bearer " + self.access_token
+        async with self._get_client().request(method, uri, headers=headers, **kwargs) as resp:
+            content = await resp.read()
+            return AsyncResponse(status_code=resp.status,
+                                 reason=resp.reason,
+                                 headers=resp.headers,
+                                 content=content,
+                                 request=resp.request_info)
+
+    async def _request_with_retry(self, method, uri, **kwargs) -> AsyncResponse:
+        """
+        Issue a request, retrying on connection errors and on retryable status codes.
+
+        This follows the same policy as the urllib3 `Retry` used by the synchronous session,
+        including honoring the Retry-After header.
+        """
+        retries = self.retries
+        while True:
+            try:
+                response = await self._send(method, uri, **kwargs)
+            except self.retry_errs as e:
+                retries = self._increment(retries, method, uri, error=e)
+                if retries is None:
+                    raise
+                logger.warning('{} seen, retrying request'.format(repr(e)))
+                await asyncio.sleep(retries.get_backoff_time())
+                continue
+
+            has_retry_after = 'Retry-After' in response.headers
+            if not retries.is_retry(method, response.status_code, has_retry_after):
+                return response
+            retries = self._increment(retries, method, uri, status=response.status_code)
+            if retries is None:
+                return response
+            retry_after = self._parse_retry_after(response) if has_retry_after else None
+            await asyncio.sleep(
+                retry_after if retry_after is not None else retries.get_backoff_time())
+
+    @staticmethod
+    def _increment(retries: Retry, method: str, uri: str, *,
+                   error: Optional[Exception] = None,
+                   status: Optional[int] = None) -> Optional[Retry]:
+        """Return the retry policy after one more attempt, or None once it is exhausted."""
+        history = retries.history + (RequestHistory(method, uri, error, status, None),)
+        if error is not None:
+            new_retries = retries.new(total=retries.total - 1,
+                                      connect=retries.connect - 1,
+                                      history=history)
+        else:
+            new_retries = retries.new(total=retries.total - 1,
+                                      status=retries.status - 1,
+                                      history=history)
+        return None if new_retries.is_exhausted() else new_retries
+
+    @staticmethod
+    def _parse_retry_after(response: AsyncResponse) -> Optional[float]:
+        try:
+            return max(float(response.headers['Retry-After']), 0.0)
+        except ValueError:
+            return None
+
+    async def checked_request(self, method: str, path: str,
+                              version: str = 'v1', **kwargs) -> AsyncResponse:
+        """Check response status code and throw an exception if relevant."""
+        if self._is_access_token_expired():
+            await self._refresh_access_token()
+        uri = self._versioned_base_url(version) + path.lstrip('/')
+        used_token = self.access_token
+
+        response = await self._request_with_retry(method, uri, **kwargs)
+
+        try:
+            if response.status_code == 401 and response.json().get("reason") == "invalid-token":
+                await self._refresh_access_token(stale_token=used_token)
+                response = await self._request_with_retry(method, uri, **kwargs)
+        except AttributeError:
+            # Catch AttributeErrors and log response
+            # The 401 status will be handled further down
+            logger.error("Failed to decode json from response: {}".format(response.text))
+        except ValueError:
+            # Ignore ValueErrors thrown by attempting to decode json bodies. This
+            # might occur if we get a 401 response without a JSON body
+            pass
+
+        if 200 <= response.status_code <= 299:
+            logger.info('%s %s %s', response.status_code, method, path)
+            return response
+        else:
+            Session._raise_for_status(response, method, path)
+
+    async def get_resource(self, path: str, **kwargs) -> dict:
+        """GET a particular resource as JSON."""
+        response = await self.checked_get(path, **kwargs)
+        return Session._extract_response_json(path, response)
+
+    async def post_resource(self, path: str, json: dict, **kwargs) -> dict:
+        """POST to a particular resource as JSON."""
+        response = await self.checked_post(path, json=json, **kwargs)
+        return Session._extract_response_json(path, response)
+
+    async def put_resource(self, path: str, json: dict, **kwargs) -> dict:
+        """PUT data given by some JSON at a particular resource."""
+        response = await self.checked_put(path, json=json, **kwargs)
+        return Session._extract_response_json(path, response)
+
+    async def delete_resource(self, path: str, **kwargs) -> dict:
+        """DELETE a particular resource as JSON."""
+        response = await self.checked_delete(path, **kwargs)
+        return Session._extract_response_json(path, response)
+
+    @staticmethod
+    async def cursor_paged_resource(base_method: Callable[..., Awaitable[dict]], path: str,
+                                    forward: bool = True, per_page: int = 100,
+                                    version: str = 'v2', **kwargs) -> AsyncIterator[dict]:
+        """
+        Returns a flat async generator of results for an API query.
+
+        Results are fetched in chunks of size `per_page` and loaded lazily.
+        """
+        params = kwargs.get('params', {})
+        params['forward'] = forward
+        params['ascending'] = forward
+        params['per_page'] = per_page
+        kwargs['params'] = params
+        while True:
+            response_json = await base_method(path, version=version, **kwargs)
+            for obj in response_json['contents']:
+                yield obj
+            cursor = response_json.get('next')
+            if cursor is None:
+                break
+            params['cursor'] = cursor
+
+    async def checked_post(self, path: str, json: dict, **kwargs) -> AsyncResponse:
+        """Execute a POST request to a URL and utilize error filtering on the response."""
+        return await self.checked_request('POST', path, json=json, **kwargs)
+
+    async def checked_put(self, path: str, json: dict, **kwargs) -> AsyncResponse:
+        """Execute a PUT request to a URL and utilize error filtering on the response."""
+        return await self.checked_request('PUT', path, json=json, **kwargs)
+
+    async def checked_delete(self, path: str, **kwargs) -> AsyncResponse:
+        """Execute a DELETE request to a URL and utilize error filtering on the response."""
+        return await self.checked_request('DELETE', path, **kwargs)
+
+    async def checked_get(self, path: str, **kwargs) -> AsyncResponse:
+        """Execute a GET request to a URL and utilize error filtering on the response."""
+        return await self.checked_request('GET', path, **kwargs)
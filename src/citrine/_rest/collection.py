@@ -8,6 +8,7 @@ from citrine._rest.pageable import Pageable
 from citrine._rest.paginator import Paginator
 from citrine._rest.resource import ResourceRef
 from citrine._utils.functions import format_escaped_url
+from citrine.deduplication import Deduplicator
 from citrine.exceptions import ModuleRegistrationFailedException, NonRetryableException
 from citrine.resources.response import Response
 
@@ -73,7 +74,9 @@ class Collection(Generic[ResourceType], Pageable):
 
     def list(self, *,
              page: Optional[int] = None,
-             per_page: int = 100) -> Iterator[ResourceType]:
+             per_page: int = 100,
+             max_workers: int = 1,
+             deduplicate: Union[bool, Deduplicator] = True) -> Iterator[ResourceType]:
         """
         Paginate over the elements of the collection.
 
@@ -89,6 +92,16 @@ class Collection(Generic[ResourceType], Pageable):
             Max number of results to return per page. Default is 100.  This parameter
             is used when making requests to the backend service.  If the page parameter
             is specified it limits the maximum number of elements in the response.
+        max_workers: int, optional
+            Number of pages to fetch concurrently. Default is 1, which fetches one page at a
+            time. Larger values fetch a sliding window of pages in parallel, which speeds up
+            listing long collections at the cost of a few requests past the final page.
+        deduplicate: Union[bool, Deduplicator], optional
+            How to skip elements that appear more than once, such as when an element moves
+            across a page boundary while listing. Default is True, which remembers every uid
+            yielded. A :class:`~citrine.deduplication.WindowDeduplicator` or
+            :class:`~citrine.deduplication.BloomDeduplicator` bounds the memory used for
+            very long listings. False yields every element as received.
 
         Returns
         -------
@@ -100,7 +113,9 @@ class Collection(Generic[ResourceType], Pageable):
         return self._paginator.paginate(page_fetcher=self._fetch_page,
                                         collection_builder=self._build_collection_elements,
                                         page=page,
-                                        per_page=per_page)
+                                        per_page=per_page,
+                                        max_workers=max_workers,
+                                        deduplicate=deduplicate)
 
     def update(self, model: CreationType) -> CreationType:
         """Update a particular element of the collection."""
@@ -1,6 +1,9 @@
 import warnings
-from typing import TypeVar, Generic, Callable, Optional, Iterable, Any, Tuple, Iterator
-from uuid import uuid4
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar, Generic, Callable, Optional, Iterable, Any, Tuple, Iterator, Union
+
+from citrine.deduplication import Deduplicator, ExactDeduplicator
 
 ResourceType = TypeVar('ResourceType')
 
@@ -19,7 +22,8 @@ class Paginator(Generic[ResourceType]):
                  page: Optional[int] = None,
                  per_page: int = 100,
                  search_params: Optional[dict] = None,
-                 deduplicate: bool = True) -> Iterator[ResourceType]:
+                 deduplicate: Union[bool, Deduplicator] = True,
+                 max_workers: int = 1) -> Iterator[ResourceType]:
         """
         A generic support class to paginate requests into an iterable of a built object.
 
@@ -47,9 +51,19 @@ class Paginator(Generic[ResourceType]):
             page_fetcher function should have a key word argument "search_params" should it
             pass a request body to the target endpoint. If no search_params are supplied,
             no search_params argument will get passed to the page_fetcher function.
-        deduplicate: bool, optional
+        deduplicate: Union[bool, Deduplicator], optional
             Whether or not to deduplicate the yielded resources by their uid.  The default
-            is true.
+            is true, which remembers every uid yielded.  Pass a fresh
+            :class:`~citrine.deduplication.Deduplicator` such as a
+            :class:`~citrine.deduplication.WindowDeduplicator` or
+            :class:`~citrine.deduplication.BloomDeduplicator` to bound the memory used
+            when listing very large collections.
+        max_workers: int, optional
+            Number of pages to fetch concurrently.  The default of 1 fetches one page at a
+            time.  Larger values keep a sliding window of that many page requests in flight,
+            which are yielded in page order; up to ``max_workers - 1`` requests may be made
+            past the last page.  The page_fetcher must be safe to call from several threads.
+            Ignored if page is specified.
 
         Returns
         -------
@@ -65,58 +79,93 @@ class Paginator(Generic[ResourceType]):
             warnings.warn("The page parameter is deprecated, default is automatic pagination",
                           DeprecationWarning)
 
-        first_entity = None
-        page_idx = page
-        uids = set()
-
-        while True:
-            subset_collection, next_uri = page_fetcher(page=page_idx, per_page=per_page,
-                                                       **search_params)
+        if page is None and max_workers > 1:
+            pages = self._fetch_concurrently(page_fetcher, per_page, search_params, max_workers)
+        else:
+            pages = self._fetch_serially(page_fetcher, page, per_page, search_params)
 
-            subset = collection_builder(subset_collection)
+        if deduplicate is True:
+            deduplicate = ExactDeduplicator()
 
-            count = 0
-            for idx, element in enumerate(subset):
+        first_entity = None
 
-                # escaping from infinite loops where page/per_page are not
-                # honored and are returning the same results regardless of page:
-                current_entity = self._comparison_fields(element)
-                if first_entity is not None and \
-                        first_entity == current_entity:
-                    # TODO: raise an exception once the APIs that ignore pagination are fixed
+        try:
+            for subset_collection, next_uri in pages:
+                subset = collection_builder(subset_collection)
+                if deduplicate:
+                    deduplicate.start_page()
+
+                count = 0
+                for idx, element in enumerate(subset):
+
+                    # escaping from infinite loops where page/per_page are not
+                    # honored and are returning the same results regardless of page:
+                    current_entity = self._comparison_fields(element)
+                    if first_entity is not None and \
+                            first_entity == current_entity:
+                        # TODO: raise an exception once the APIs that ignore pagination are fixed
+                        break
+
+                    # Only return new uids.  This way, if an element shows up at the end of one
+                    # page and then at the beginning of the next one because a new resource in
+                    # the same collection was created, it is only returned from the list method
+                    # once.  uids are unique, so this should be safe.  Elements without a uid
+                    # are never deduplicated.
+                    uid = getattr(element, "uid", None)
+                    if not deduplicate or uid is None or deduplicate.add(uid):
+                        yield element
+
+                    if first_entity is None:
+                        first_entity = current_entity
+
+                    count += 1
+
+                # If the page number is specified we exit to disable auto-paginating
+                if page is not None:
                     break
 
-                # Only return new uids.  This way, if an element shows up at the end of one page
-                # and then at the beginning of the next one because a new resource in the same
-                # collection was created, it is only returned from the list method once.  uids are
-                # unique, so this should be safe.  If a user is listing enough elements that the
-                # size of uids is too big, there will be other problems first. This could be
-                # replaced by a deque with a fixed size if memory is really an issue, at the cost
-                # of slower lookups.  Or something more complex for both :-)
-                # If no uid is available, create one, which will never deduplicate
-                uid = getattr(element, "uid", uuid4())
-                if not deduplicate or uid not in uids:
-                    uids.add(uid)
-                    yield element
-
-                if first_entity is None:
-                    first_entity = current_entity
-
-                count += 1
-
-            # If the page number is specified we exit to disable auto-paginating
-            if page is not None:
-                break
-
-            # Handle the case where we get an unexpected number of results (i.e., the last page)
-            if next_uri == "" and count < per_page:
-                break
-
+                # Handle the case where we get an unexpected number of results (i.e., the last
+                # page)
+                if next_uri == "" and count < per_page:
+                    break
+        finally:
+            pages.close()
+
+    @staticmethod
+    def _fetch_serially(page_fetcher: Callable[..., Tuple[Iterable[dict], str]],
+                        page: Optional[int],
+                        per_page: int,
+                        search_params: dict) -> Iterator[Tuple[Iterable[dict], str]]:
+        """Fetch one page at a time, only when the previous page has been consumed."""
+        page_idx = page
+        while True:
+            yield page_fetcher(page=page_idx, per_page=per_page, **search_params)
             if page_idx is None:
                 page_idx = 2
             else:
                 page_idx += 1
 
+    @staticmethod
+    def _fetch_concurrently(page_fetcher: Callable[..., Tuple[Iterable[dict], str]],
+                            per_page: int,
+                            search_params: dict,
+                            max_workers: int) -> Iterator[Tuple[Iterable[dict], str]]:
+        """Fetch pages in order, keeping a window of `max_workers` requests in flight."""
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        in_flight = deque()
+        next_page = 1
+        try:
+            while True:
+                while len(in_flight) < max_workers:
+                    in_flight.append(executor.submit(
+                        page_fetcher, page=next_page, per_page=per_page, **search_params))
+                    next_page += 1
+                yield in_flight.popleft().result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def _comparison_fields(self, entity: ResourceType) -> Any:
         """
         Extract the uniquely identifying attributes for equality comparison.
@@ -0,0 +1,111 @@
+"""Build GEMD objects directly from deserialized json, without a round-trip through a string."""
+import inspect
+from logging import getLogger
+from typing import Any, Optional
+
+from gemd.entity.base_entity import BaseEntity
+from gemd.entity.dict_serializable import DictSerializable
+from gemd.json import GEMDJson
+
+logger = getLogger(__name__)
+
+_GENERIC_FROM_DICT = DictSerializable.from_dict.__func__
+
+# The names a class's constructor accepts, by class
+_constructor_args = {}
+
+
+def is_generic_from_dict(from_dict) -> bool:
+    """Whether a bound from_dict method is the one defined by :class:`DictSerializable`."""
+    return getattr(from_dict, '__func__', None) is _GENERIC_FROM_DICT
+
+
+def construct(clazz: type, d: dict) -> DictSerializable:
+    """
+    Do the same as :meth:`DictSerializable.from_dict`, looking up the signature once per class.
+
+    The generic from_dict inspects the signature of the constructor on every call, which
+    costs more than constructing most objects.
+    """
+    arg_names = _constructor_args.get(clazz)
+    if arg_names is None:
+        spec = inspect.getfullargspec(clazz.__init__)
+        arg_names = _constructor_args[clazz] = frozenset(spec.args + spec.kwonlyargs)
+    kwargs = {}
+    for name, arg in d.items():
+        if name in arg_names:
+            kwargs[name] = arg
+        elif name != 'type':
+            logger.warning('Ignoring unexpected keyword argument in {}: {}'.format(
+                clazz.__name__, name))
+    return clazz(**kwargs)
+
+
+class _NotJson(Exception):
+    """Raised when a value can't have come from parsing json, such as a GEMD object."""
+
+
+class GEMDBuilder(GEMDJson):
+    """
+    A GEMD json support object that can also build objects straight from dictionaries.
+
+    :meth:`build` gives the same result as ``loads(dumps(data))`` on dictionaries parsed from
+    a json response, in a single walk over the data. Objects are built bottom-up, in the
+    order a json decoder would build them from the sorted output of :meth:`dumps`, and links
+    to objects that have already been built are replaced by those objects.
+
+    Classes that use the generic :meth:`DictSerializable.from_dict`, such as values, bounds
+    and attributes, are built with :func:`construct` instead.
+    """
+
+    def build(self, data: Any, *, index: Optional[dict] = None) -> Any:
+        """
+        Build GEMD objects from data parsed from json, such as an API response.
+
+        The data is not modified. Anything that could not have come from parsing json, such
+        as a GEMD object, is copied with a round-trip through a string instead.
+
+        Parameters
+        ----------
+        data: Any
+            A dictionary or list of plain json values, possibly nested, in which
+            dictionaries with a ``type`` key represent GEMD objects.
+        index: Optional[dict]
+            Objects that links may be replaced by, keyed by lower-case scope and uid, which
+            is added to as objects are built. Pass the same index to several builds to link
+            them to each other's objects.
+
+        Returns
+        -------
+        Any
+            A copy of `data` with those dictionaries replaced by GEMD objects.
+
+        """
+        try:
+            return self._build(data, {} if index is None else index)
+        except _NotJson:
+            return self.copy(data)
+
+    def _build(self, value: Any, index: dict) -> Any:
+        if isinstance(value, dict):
+            if not all(isinstance(key, str) for key in value):
+                raise _NotJson
+            # Children are built before their parent and in sorted key order, like the object
+            # hook in loads, so that the same links get substituted
+            built = {key: self._build(value[key], index) for key in sorted(value)}
+            return self._load(built, index)
+        elif isinstance(value, (list, tuple)):
+            return [self._build(item, index) for item in value]
+        elif value is None or isinstance(value, (str, int, float)):
+            return value
+        raise _NotJson
+
+    def _load(self, d: dict, index: dict) -> Any:
+        clazz = self._clazz_index.get(d.get('type'))
+        if clazz is None or not is_generic_from_dict(clazz.from_dict):
+            return self._load_and_index(d, index, substitute=True)
+        obj = construct(clazz, d)
+        if isinstance(obj, BaseEntity):
+            for (scope, uid) in obj.uids.items():
+                index[(scope.lower(), uid)] = obj
+        return obj
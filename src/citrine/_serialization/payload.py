@@ -0,0 +1,81 @@
+"""Prepare data concepts objects to be written to the API, in a single walk over each."""
+from threading import Lock
+from typing import Any, List
+from uuid import uuid4
+
+from gemd.entity.base_entity import BaseEntity
+from gemd.entity.dict_serializable import DictSerializable
+from gemd.enumeration.base_enumeration import BaseEnumeration
+
+from citrine._serialization import properties
+from citrine._serialization.serializable import Serializable
+
+# Batches may be prepared concurrently, and can link to the same objects
+_uid_lock = Lock()
+
+
+class PayloadWriter:
+    """
+    Dumps objects for writing, with the objects they point to replaced by links.
+
+    This gives the same result as populating uids with ``GEMDJson(scope).dumps(model)``, then
+    ``replace_objects_with_links(scrub_none(model.dump()))``, but in one walk over the model
+    that never dumps the objects it links to. Objects without any uids are given one in
+    `scope` as they are reached, and are recorded so that temporary uids can be removed again.
+
+    Parameters
+    ----------
+    scope: str
+        The scope of the uids given to objects that have none
+
+    """
+
+    def __init__(self, scope: str):
+        self.scope = scope
+        self.assigned: List[BaseEntity] = []
+
+    def dump(self, model: BaseEntity) -> dict:
+        """Dump a model as the body of a request that writes it."""
+        self.ensure_uid(model)
+        if not isinstance(model, Serializable):
+            # A gemd-python object, which has no properties to dump it with
+            return self.encode(model.as_dict())
+        with properties.writing_payload(self):
+            return model.dump()
+
+    def ensure_uid(self, entity: BaseEntity) -> None:
+        """Give an entity a uid in this writer's scope if it has none."""
+        if entity.uids:
+            return
+        with _uid_lock:
+            if not entity.uids:
+                entity.add_uid(self.scope, str(uuid4()))
+                self.assigned.append(entity)
+
+    def link(self, entity: BaseEntity) -> dict:
+        """Serialize a link to an entity, preferring its Citrine id."""
+        from citrine.resources.data_concepts import CITRINE_SCOPE
+        self.ensure_uid(entity)
+        uids = entity.uids
+        scope = CITRINE_SCOPE if CITRINE_SCOPE in uids else next(iter(uids))
+        return {'type': 'link_by_uid', 'scope': scope, 'id': uids[scope]}
+
+    def encode(self, value: Any) -> Any:
+        """Serialize a gemd object that has no citrine-python properties, such as an attribute."""
+        if isinstance(value, BaseEntity):
+            return self.link(value)
+        if isinstance(value, DictSerializable):
+            value = value.as_dict()
+        if isinstance(value, dict):
+            return {key: self.encode(item) for key, item in value.items() if item is not None}
+        if isinstance(value, (list, tuple)):
+            return [self.encode(item) for item in value]
+        if isinstance(value, BaseEnumeration):
+            return value.value
+        return value
+
+    def remove_assigned_uids(self) -> None:
+        """Remove the uids this writer gave to objects, once they are no longer needed."""
+        for entity in self.assigned:
+            entity.uids.pop(self.scope, None)
+        self.assigned = []
@@ -9,6 +9,8 @@ SelfType = TypeVar('SelfType', bound='Resource')
 class PolymorphicSerializable(Generic[SelfType]):
     """A Wrapper class for Polymorphic deserialization of Serializable objects."""
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def get_type(cls, data) -> Type[Serializable]:
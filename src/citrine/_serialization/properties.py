@@ -1,5 +1,7 @@
 """Property objects for typed setting and ser/de."""
 from abc import abstractmethod
+from contextlib import contextmanager
+import threading
 import typing
 from typing import Optional
 from datetime import datetime
@@ -8,6 +10,7 @@ import uuid
 import arrow
 
 from gemd.enumeration.base_enumeration import BaseEnumeration
+from gemd.entity.base_entity import BaseEntity
 from gemd.entity.link_by_uid import LinkByUID
 from gemd.entity.dict_serializable import DictSerializable
 from citrine._serialization.serializable import Serializable
@@ -36,6 +39,15 @@ class Property(typing.Generic[DeserializedType, SerializedType]):
         # Distinguish between no default being provided and the default being None
         self.optional = False
         self.override = override
+        # Resolved on first use, since they only depend on the class of the objects involved
+        self._base_classes: typing.Dict[type, typing.Optional[type]] = {}
+        self._underlying_types = None
+
+    def __set_name__(self, owner: type, name: str):
+        # Compact classes declare a slot for each property with `slots`; store the value there
+        slot = _slot_name(name)
+        if slot in owner.__dict__.get('__slots__', ()):
+            self._key = slot
 
     @property
     @abstractmethod
@@ -114,27 +126,51 @@ class Property(typing.Generic[DeserializedType, SerializedType]):
             _data[fields[-1]] = self.serialize(value, base_class=base_class)
             return data
 
+    def _base_class(self, obj) -> typing.Optional[type]:
+        """The base class of obj that has this property's path as an attribute, cached by class."""
+        clazz = obj.__class__
+        try:
+            return self._base_classes[clazz]
+        except KeyError:
+            base_class = self._base_classes[clazz] = \
+                _find_base_class(clazz, self.serialization_path)
+            return base_class
+
+    def _is_deserialized(self, value) -> bool:
+        """Whether value already has one of the underlying types, which are looked up once."""
+        if self._underlying_types is None:
+            self._underlying_types = self.underlying_types
+        return issubclass(type(value), self._underlying_types)
+
     def __get__(self, obj, objtype=None) -> DeserializedType:
         """Property getter, deferring to the getter of the parent class, if applicable."""
-        base_class = _get_base_class(obj, self.serialization_path)
-        if base_class is not None and self.override:
-            return getattr(base_class, self.serialization_path).fget(obj)
-        else:
-            return getattr(obj, self._key, self.default)
+        if self.override:
+            base_class = self._base_class(obj)
+            if base_class is not None:
+                return getattr(base_class, self.serialization_path).fget(obj)
+        value = getattr(obj, self._key, self.default)
+        if type(value) is _Deferred:
+            # Left raw by a lazy build; deserialize it now and keep the result
+            value = value.resolve()
+            setattr(obj, self._key, value)
+        return value
 
     def __set__(self, obj, value: typing.Union[SerializedType, DeserializedType]):
         """Property setter, deferring to the setter of the parent class, if applicable."""
-        base_class = _get_base_class(obj, self.serialization_path)
-        if issubclass(type(value), self.underlying_types):
+        if self._is_deserialized(value):
             value_to_set = value
         else:
             # if value is not an underlying type, set its deserialized version.
-            value_to_set = self.deserialize(value, base_class=base_class)
+            value_to_set = self.deserialize(value, base_class=self._base_class(obj))
+        self._set_value(obj, value_to_set)
 
-        if base_class is not None and self.override:
-            getattr(base_class, self.serialization_path).fset(obj, value_to_set)
-        else:
-            setattr(obj, self._key, value_to_set)
+    def _set_value(self, obj, value_to_set):
+        if self.override:
+            base_class = self._base_class(obj)
+            if base_class is not None:
+                getattr(base_class, self.serialization_path).fset(obj, value_to_set)
+                return
+        setattr(obj, self._key, value_to_set)
 
     def __str__(self):
         return '<Property {!r}>'.format(self.serialization_path)
@@ -148,17 +184,12 @@ class PropertyCollection(Property[DeserializedType, SerializedType]):
 
         This setter defers to the subclass to implement the `_set_elements` logic
         """
-        base_class = _get_base_class(obj, self.serialization_path)
-        if issubclass(type(value), self.underlying_types):
+        if self._is_deserialized(value):
             value_to_set = self._set_elements(value)
         else:
             # if value is not an underlying type, set its deserialized version.
-            value_to_set = self.deserialize(value, base_class=base_class)
-
-        if base_class is not None and self.override:
-            getattr(base_class, self.serialization_path).fset(obj, value_to_set)
-        else:
-            setattr(obj, self._key, value_to_set)
+            value_to_set = self.deserialize(value, base_class=self._base_class(obj))
+        self._set_value(obj, value_to_set)
 
     @abstractmethod
     def _set_elements(self, value: typing.Union[SerializedType, DeserializedType]):
@@ -169,6 +200,32 @@ class PropertyCollection(Property[DeserializedType, SerializedType]):
         """
 
 
+def slots(*names: str) -> typing.Tuple[str, ...]:
+    """
+    Return the `__slots__` of a compact class, which stores its properties without a __dict__.
+
+    The names are those of the class's properties. Every base class must also have
+    `__slots__`, which :class:`Serializable` and :class:`PolymorphicSerializable` do, and
+    the class can then hold no attributes other than the named properties.
+
+    Examples
+    --------
+    .. code:: python
+
+        class Point(Serializable['Point']):
+            __slots__ = properties.slots('x', 'y')
+
+            x = properties.Float('x')
+            y = properties.Float('y')
+
+    """
+    return tuple(_slot_name(name) for name in names)
+
+
+def _slot_name(name: str) -> str:
+    return '_slot_' + name
+
+
 def _get_base_class(obj: object, key: str) -> type:
     """
     Return the base class that has key as an attribute, if it exists.
@@ -176,7 +233,12 @@ def _get_base_class(obj: object, key: str) -> type:
     If there are no base classes with key as an attribute, OR if there are multiple base classes
     with key as an attribute, return None.
     """
-    base_classes = obj.__class__.__bases__  # Tuple of all base classes of obj
+    return _find_base_class(obj.__class__, key)
+
+
+def _find_base_class(clazz: type, key: str) -> typing.Optional[type]:
+    """Return the only direct base class of clazz that has key as an attribute, if any."""
+    base_classes = clazz.__bases__  # Tuple of all base classes of clazz
     try:
         classes_with_key = [base_class for base_class in base_classes if hasattr(base_class, key)]
     except TypeError:
@@ -632,6 +694,27 @@ class Object(PropertyCollection[typing.Any, dict]):
             {k: v for k, v in self.klass.__dict__.items() if isinstance(v, Property)})
         self.polymorphic = "get_type" in self.klass.__dict__ and\
                            issubclass(self.klass, PolymorphicSerializable)
+        self._plan = None
+
+    @classmethod
+    def of(cls, klass: typing.Type[typing.Any]) -> 'Object':
+        """
+        Return a shared, unnamed Object property for a class.
+
+        Building the property scans the class for fields, so :class:`Serializable` reuses one
+        per class instead of building a new one for every object it builds or dumps.
+        """
+        prop = _class_objects.get(klass)
+        if prop is None:
+            prop = _class_objects[klass] = cls(klass)
+        return prop
+
+    @property
+    def plan(self) -> '_ObjectPlan':
+        """The fields of the class, compiled into the steps to build and dump an instance."""
+        if self._plan is None:
+            self._plan = _ObjectPlan(self.fields)
+        return self._plan
 
     @property
     def underlying_types(self):
@@ -652,10 +735,17 @@ class Object(PropertyCollection[typing.Any, dict]):
                                  " explicitly serializable class".format(self.klass))
 
         instance = self.klass.__new__(self.klass, {})
-        for property_name, field in self.fields.items():
-            if field.deserializable:
-                value = field.deserialize_from_dict(data)
-                setattr(instance, property_name, value)
+        if getattr(_lazy_state, 'enabled', False):
+            for property_name, read in self.plan.readers:
+                defer = self.plan.deferrable.get(property_name)
+                raw = _MISSING if defer is None else defer.read_raw(data)
+                if raw is _MISSING:
+                    setattr(instance, property_name, read(data))
+                else:
+                    setattr(instance, defer.field._key, _Deferred(defer.field, raw))
+            return instance
+        for property_name, read in self.plan.readers:
+            setattr(instance, property_name, read(data))
         return instance
 
     def _serialize(self, obj: typing.Any) -> dict:
@@ -665,21 +755,29 @@ class Object(PropertyCollection[typing.Any, dict]):
             # that may have more fields, so defer to them by calling the dump method
             # it must have as a Serializable
             return obj.dump()
+        payload = getattr(_payload_state, 'writer', None)
         if not self.fields:
             # There are two types of objects that we expect to not have fields.
             # One is a PolymorphicSerializable, which is handled above.
             # The other possibility is that obj is a gemd object that is not reproduced in
             # citrine-python (attribute, value, bounds, etc.). These are all DictSerializable,
             # and have a dump() method that uses the gemd json encoder client.
+            if payload is not None and isinstance(obj, DictSerializable):
+                return payload.encode(obj)
             try:
                 return obj.dump()
             except AttributeError:
                 raise AttributeError("Tried to serialize object {!r} of type {}, which has "
                                      "neither fields not a dump() method.".format(obj, type(obj)))
-        for property_name, field in self.fields.items():
-            if field.serializable:
+        if payload is not None:
+            # Requests leave out null fields
+            for property_name, write in self.plan.writers:
                 value = getattr(obj, property_name)
-                serialized = field.serialize_to_dict(serialized, value)
+                if value is not None:
+                    write(serialized, value)
+            return serialized
+        for property_name, write in self.plan.writers:
+            write(serialized, getattr(obj, property_name))
         return serialized
 
     def __str__(self):
@@ -692,6 +790,169 @@ class Object(PropertyCollection[typing.Any, dict]):
             return self.deserialize(value)
 
 
+# Shared Object properties, by the class they build
+_class_objects: typing.Dict[type, Object] = {}
+
+
+class _ObjectPlan:
+    """
+    The fields of a class, flattened into closures that read and write each one.
+
+    The closures do the same as :meth:`Property.deserialize_from_dict` and
+    :meth:`Property.serialize_to_dict`, but split each serialization path once, skip the
+    fields that are not (de)serializable, and skip looking up a base class, which is only
+    ever found for objects and never for the dictionaries those methods are given.
+    """
+
+    def __init__(self, fields: typing.Dict[str, Property]):
+        self.readers = [(name, _compile_reader(field))
+                        for name, field in fields.items() if field.deserializable]
+        self.writers = [(name, _compile_writer(field))
+                        for name, field in fields.items() if field.serializable]
+        # The fields a lazy build may leave raw, by name
+        self.deferrable = {name: _DeferrableField(field)
+                           for name, field in fields.items()
+                           if field.deserializable and _is_deferrable(field)}
+
+
+_MISSING = object()
+
+# Whether objects are being built lazily, by thread
+_lazy_state = threading.local()
+
+
+@contextmanager
+def lazy_deserialization():
+    """
+    Build objects lazily within this context.
+
+    Nested :class:`Object`, :class:`List`, :class:`Set` and :class:`Mapping` fields of the
+    objects built keep their raw data, and are only deserialized (lazily in turn) the first
+    time they are read, after which the result is kept. Reading one value out of a large
+    nested payload then only deserializes the path to that value.
+
+    Errors in the raw data of a nested field are raised when it is first read rather than
+    when its parent is built.
+    """
+    previous = getattr(_lazy_state, 'enabled', False)
+    _lazy_state.enabled = True
+    try:
+        yield
+    finally:
+        _lazy_state.enabled = previous
+
+
+# The PayloadWriter that objects are being dumped for, by thread
+_payload_state = threading.local()
+
+
+@contextmanager
+def writing_payload(writer):
+    """
+    Dump objects as the body of a write request within this context.
+
+    Objects with uids that are pointed to by the objects dumped are serialized as links by
+    `writer`, which also serializes gemd objects without properties, and null fields are
+    left out. See :class:`~citrine._serialization.payload.PayloadWriter`.
+    """
+    previous = getattr(_payload_state, 'writer', None)
+    _payload_state.writer = writer
+    try:
+        yield
+    finally:
+        _payload_state.writer = previous
+
+
+class _Deferred:
+    """The raw value of a field, stored in place of its deserialized value by a lazy build."""
+
+    __slots__ = ('field', 'raw')
+
+    def __init__(self, field: Property, raw: typing.Any):
+        self.field = field
+        self.raw = raw
+
+    def resolve(self) -> typing.Any:
+        with lazy_deserialization():
+            return self.field.deserialize(self.raw)
+
+
+def deferred_data(obj: typing.Any, name: str) -> typing.Any:
+    """
+    Return the raw data of a property that a lazy build has not deserialized yet.
+
+    This lets an object read its own data in bulk without deserializing it. Returns None if
+    the property has been deserialized.
+    """
+    field = Object.of(type(obj)).fields[name]
+    value = getattr(obj, field._key, None)
+    return value.raw if type(value) is _Deferred else None
+
+
+def _is_deferrable(field: Property) -> bool:
+    """Whether a field can be left raw: a nested container that isn't set through a parent."""
+    if field.override or field.serialization_path is None or \
+            type(field).deserialize_from_dict is not Property.deserialize_from_dict:
+        return False
+    if isinstance(field, Optional):
+        field = field.prop
+    return isinstance(field, (Object, List, Set, Mapping))
+
+
+class _DeferrableField:
+    """Reads the raw value of a deferrable field, or _MISSING if it needs its default."""
+
+    def __init__(self, field: Property):
+        self.field = field
+        self.keys = field.serialization_path.split('.')
+
+    def read_raw(self, data: dict) -> typing.Any:
+        value = data
+        for key in self.keys:
+            value = value.get(key)
+            if value is None:
+                return _MISSING
+        return value
+
+
+def _compile_reader(field: Property) -> typing.Callable[[dict], typing.Any]:
+    if field.serialization_path is None or \
+            type(field).deserialize_from_dict is not Property.deserialize_from_dict:
+        return field.deserialize_from_dict
+    keys = field.serialization_path.split('.')
+    deserialize = field.deserialize
+
+    def read(data: dict) -> typing.Any:
+        value = data
+        for key in keys:
+            next_value = value.get(key)
+            if next_value is None:
+                if field.default is None and not field.optional:
+                    msg = "Unable to deserialize {} into {}, missing a required field: {}".format(
+                        data, field.underlying_types, key)
+                    raise RuntimeError(msg)
+                return deserialize(field.serialize(field.default))
+            value = next_value
+        return deserialize(value)
+
+    return read
+
+
+def _compile_writer(field: Property) -> typing.Callable[[dict, typing.Any], None]:
+    if field.serialization_path is None or \
+            type(field).serialize_to_dict is not Property.serialize_to_dict:
+        return field.serialize_to_dict
+    *parents, last = field.serialization_path.split('.')
+    serialize = field.serialize
+
+    def write(data: dict, value: typing.Any) -> None:
+        for key in parents:
+            data = data.setdefault(key, {})
+        data[last] = serialize(value)
+
+    return write
+
+
 class LinkOrElse(PropertyCollection[typing.Union[Serializable, LinkByUID], dict]):
     """
     A property that can either be a serializable object with IDs or a LinkByUID object.
@@ -731,6 +992,9 @@ class LinkOrElse(PropertyCollection[typing.Union[Serializable, LinkByUID], dict]
         if isinstance(value, LinkByUID):
             return value.as_dict()
         elif isinstance(value, Serializable):
+            payload = getattr(_payload_state, 'writer', None)
+            if payload is not None and isinstance(value, BaseEntity):
+                return payload.link(value)
             return value.dump()
 
     def _deserialize(self, value: dict):
@@ -7,6 +7,8 @@ Self = TypeVar('Self', bound='Serializable')
 class Serializable(Generic[Self]):
     """A Serializable object."""
 
+    __slots__ = ()
+
     @classmethod
     def _pre_build(cls, data: dict) -> dict:
         """Run data modification before building."""
@@ -17,12 +19,12 @@ class Serializable(Generic[Self]):
         """Build an instance of this object from given data."""
         from citrine._serialization import properties
         pre_built = cls._pre_build(data)
-        return properties.Object(cls).deserialize(pre_built)
+        return properties.Object.of(cls).deserialize(pre_built)
 
     def dump(self) -> dict:
         """Dump this instance."""
         from citrine._serialization import properties
-        serialized = properties.Object(type(self)).serialize(self)
+        serialized = properties.Object.of(type(self)).serialize(self)
         return self._post_dump(serialized)
 
     def _post_dump(self, data: dict) -> dict:
@@ -1,16 +1,24 @@
 from os import environ
-from typing import Optional, Callable, Iterator
-from logging import getLogger
+from threading import Lock, Thread
+from typing import Optional, Callable, List, Tuple
+from logging import getLogger, DEBUG
+from time import perf_counter
 from datetime import datetime, timedelta
 
 from requests import Response
 from json.decoder import JSONDecodeError
 from urllib.parse import urlunsplit
+from urllib3.exceptions import ResponseError
 from urllib3.util.retry import Retry
 
+from citrine._utils.cursor import Checkpoint, CursorIterator, PathType
 from citrine._utils.functions import format_escaped_url
+from citrine._utils.prefetch import prefetch as prefetch_pages
+from citrine.instrumentation import RequestEvent, route_template
 from citrine.exceptions import (
+    GatewayTimeout,
     NotFound,
+    PayloadTooLarge,
     Unauthorized,
     UnauthorizedRefreshToken,
     WorkflowConflictException,
@@ -24,6 +32,14 @@ import requests.auth
 # Choose a 5 second buffer so that there's no chance of the access token
 # expiring during the check for expiration
 EXPIRATION_BUFFER_MILLIS: timedelta = timedelta(milliseconds=5000)
+# Start refreshing the access token in the background once it is this close to expiring, so
+# that requests do not have to wait on a token round-trip
+PROACTIVE_REFRESH_WINDOW: timedelta = timedelta(seconds=60)
+# HTTP status codes to retry on in addition to the defaults of [503, 413, 429], focusing on
+# specific CloudFlare 5XX errors.
+RETRY_STATUS_FORCELIST = [500, 502, 504, 520, 521, 522, 524, 527]
+# The reason urllib3 gives once a request has been answered with 504 on every retry
+_GATEWAY_TIMEOUT_RETRIES = ResponseError.SPECIFIC_ERROR.format(status_code=504)
 logger = getLogger(__name__)
 
 
@@ -34,13 +50,20 @@ class Session(requests.Session):
                  refresh_token: str = environ.get('CITRINE_API_KEY'),
                  scheme: str = 'https',
                  host: str = environ.get('CITRINE_API_HOST'),
-                 port: Optional[str] = None):
+                 port: Optional[str] = None,
+                 *,
+                 pool_connections: int = requests.adapters.DEFAULT_POOLSIZE,
+                 pool_maxsize: int = requests.adapters.DEFAULT_POOLSIZE,
+                 pool_block: bool = requests.adapters.DEFAULT_POOLBLOCK):
         super().__init__()
         self.scheme: str = scheme
         self.authority = ':'.join(([host] if host else []) + ([port] if port else []))
         self.refresh_token: str = refresh_token
         self.access_token: Optional[str] = None
         self.access_token_expiration: datetime = datetime.utcnow()
+        # Held while a token refresh is in flight, so that only one happens at a time
+        self._refresh_lock = Lock()
+        self._background_refresh: Optional[Thread] = None
 
         # Following scheme:[//authority]path[?query][#fragment] (https://en.wikipedia.org/wiki/URL)
         self.headers.update({"Content-Type": "application/json"})
@@ -54,6 +77,10 @@ class Session(requests.Session):
         # in a future release.
         self.use_idempotent_dataset_put = False
 
+        # Cache of material histories, reused by MaterialRunCollection.get_history if set
+        # to a HistoryCache.
+        self.history_cache = None
+
         # Custom adapter so we can use custom retry parameters. The default HTTP status
         # codes for retries are [503, 413, 429]. We're using status_force list to add
         # additional codes to retry on, focusing on specific CloudFlare 5XX errors.
@@ -62,8 +89,15 @@ class Session(requests.Session):
                         read=5,
                         status=5,
                         backoff_factor=0.25,
-                        status_forcelist=[500, 502, 504, 520, 521, 522, 524, 527])
-        adapter = requests.adapters.HTTPAdapter(max_retries=retries)
+                        status_forcelist=RETRY_STATUS_FORCELIST)
+        # The pool parameters control how many hosts have a cached pool (pool_connections),
+        # how many connections are kept per host (pool_maxsize), and whether requests wait
+        # for a free connection rather than opening a throwaway one (pool_block). Concurrent
+        # workloads should set pool_maxsize to at least the number of threads.
+        adapter = requests.adapters.HTTPAdapter(max_retries=retries,
+                                                pool_connections=pool_connections,
+                                                pool_maxsize=pool_maxsize,
+                                                pool_block=pool_block)
         self.mount('https://', adapter)
         self.mount('http://', adapter)
 
@@ -74,6 +108,38 @@ class Session(requests.Session):
                            requests.exceptions.ConnectionError,
                            requests.exceptions.ChunkedEncodingError)
 
+        # Callables that receive instrumentation events; see subscribe()
+        self.subscribers: List[Callable[[object], None]] = []
+
+    def pool_stats(self) -> List['PoolStats']:
+        """
+        Report the state of the connection pool for each host this session has contacted.
+
+        Use this to size `pool_maxsize`: a reuse ratio well below 1 under steady load, or
+        many more new connections than `maxsize`, means connections are being discarded
+        because the pool is too small.
+
+        Returns
+        -------
+        List[PoolStats]
+            One entry per (scheme, host, port) with a live connection pool.
+
+        """
+        stats = []
+        adapters = {id(adapter): adapter for adapter in self.adapters.values()}
+        for adapter in adapters.values():
+            pools = getattr(getattr(adapter, 'poolmanager', None), 'pools', None)
+            if pools is None:
+                continue
+            for key in pools.keys():
+                try:
+                    pool = pools[key]
+                except KeyError:  # pragma: no cover
+                    continue  # evicted by another thread since listing the keys
+                if pool.pool is not None:
+                    stats.append(PoolStats.from_pool(pool))
+        return stats
+
     def _versioned_base_url(self, version: str = 'v1'):
         return urlunsplit((
             self.scheme,
@@ -86,8 +152,44 @@ class Session(requests.Session):
     def _is_access_token_expired(self):
         return self.access_token_expiration - EXPIRATION_BUFFER_MILLIS <= datetime.utcnow()
 
-    def _refresh_access_token(self) -> None:
-        """Optionally refresh our access token (if the previous one is about to expire)."""
+    def _is_access_token_expiring(self):
+        return self.access_token_expiration - PROACTIVE_REFRESH_WINDOW <= datetime.utcnow()
+
+    def _refresh_access_token(self, observed_token: Optional[str] = None) -> None:
+        """
+        Refresh our access token, unless another thread already has.
+
+        Refreshes are single-flight: concurrent callers wait for the refresh in progress.
+        `observed_token` is the access token the caller saw when it decided a refresh was
+        needed; if the token has changed by the time the refresh lock is acquired, then some
+        other thread already refreshed it and no request is made.
+        """
+        with self._refresh_lock:
+            if self.access_token == observed_token:
+                self._fetch_access_token()
+
+    def _start_background_refresh(self) -> None:
+        """Refresh the access token on a background thread, if no refresh is in flight."""
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        observed_token = self.access_token
+
+        def refresh():
+            try:
+                if self.access_token == observed_token:
+                    self._fetch_access_token()
+            except Exception as e:
+                # The token is still valid, and requests will refresh it once it expires
+                logger.warning('Background refresh of access token failed: {!r}'.format(e))
+            finally:
+                self._refresh_lock.release()
+
+        self._background_refresh = Thread(target=refresh, name='citrine-token-refresh',
+                                          daemon=True)
+        self._background_refresh.start()
+
+    def _fetch_access_token(self) -> None:
+        """Request a new access token. Callers must hold the refresh lock."""
         data = {'refresh_token': self.refresh_token}
 
         response = self._request_with_retry('POST', self._versioned_base_url() + 'tokens/refresh',
@@ -95,51 +197,92 @@ class Session(requests.Session):
 
         if response.status_code != 200:
             raise UnauthorizedRefreshToken()
-        self.access_token = response.json()['access_token']
-        self.access_token_expiration = datetime.utcfromtimestamp(
-            jwt.decode(self.access_token, verify=False)['exp']
-        )
+        access_token = response.json()['access_token']
+        expiration = datetime.utcfromtimestamp(jwt.decode(access_token, verify=False)['exp'])
 
         # Explicitly set an updated 'auth', so as to not rely on implicit cookie handling.
-        self.auth = BearerAuth(self.access_token)
+        # The expiration is updated last, so that no thread sees a fresh expiration paired
+        # with a stale token.
+        self.auth = BearerAuth(access_token)
+        self.access_token = access_token
+        self.access_token_expiration = expiration
 
     def _request_with_retry(self, method, uri, **kwargs):
         """Wrap a request with a try/except to retry when ConnectionErrors are seen."""
+        return self._request_counting_retries(method, uri, **kwargs)[0]
+
+    def _request_counting_retries(self, method, uri, **kwargs) -> Tuple[Response, int]:
+        """Make a request as _request_with_retry does, and count the retries it took."""
         # The urllib3 Retry object does not handle retries when ConnectionErrors
         # (or other similar errors) and raised.  Using a stale connection causes
         # these issues.  Retrying the request uses a new connection.  See PLA-3449/4183.
+        retries = 0
         try:
             response = self.request(method, uri, **kwargs)
         except self.retry_errs as e:
             logger.warning('{} seen, retrying request'.format(repr(e)))
+            retries += 1
             response = self.request(method, uri, **kwargs)
 
-        return response
+        # Retries made by the urllib3 Retry object are recorded in its history
+        history = getattr(getattr(getattr(response, 'raw', None), 'retries', None), 'history', ())
+        if isinstance(history, tuple):
+            retries += len(history)
+        return response, retries
+
+    def subscribe(self, subscriber: Callable[[object], None]) -> None:
+        """
+        Register a callable to receive instrumentation events.
+
+        After every request made through :func:`checked_request`, each subscriber is called
+        with a :class:`~citrine.instrumentation.RequestEvent`. Other components may publish
+        other event types, so subscribers should ignore events they do not recognize.
+        Subscribers are called synchronously on the requesting thread and should be fast;
+        exceptions they raise are logged and otherwise ignored.
+        """
+        self.subscribers = self.subscribers + [subscriber]
+
+    def unsubscribe(self, subscriber: Callable[[object], None]) -> None:
+        """Stop sending instrumentation events to a subscriber."""
+        self.subscribers = [x for x in self.subscribers if x != subscriber]
+
+    def publish(self, event: object) -> None:
+        """Send an instrumentation event to every subscriber."""
+        for subscriber in self.subscribers:
+            try:
+                subscriber(event)
+            except Exception:
+                logger.exception('Instrumentation subscriber {!r} failed'.format(subscriber))
 
     def checked_request(self, method: str, path: str,
                         version: str = 'v1', **kwargs) -> requests.Response:
         """Check response status code and throw an exception if relevant."""
-        logger.debug('BEGIN request details:')
-        logger.debug('\tmethod: {}'.format(method))
-        logger.debug('\tpath: {}'.format(path))
-        logger.debug('\tversion: {}'.format(version))
-
+        start = perf_counter()
+        observed_token = self.access_token
         if self._is_access_token_expired():
-            self._refresh_access_token()
+            self._refresh_access_token(observed_token)
+        elif self._is_access_token_expiring():
+            self._start_background_refresh()
+        observed_token = self.access_token
         uri = self._versioned_base_url(version) + path.lstrip('/')
 
-        logger.debug('\turi: {}'.format(uri))
+        if logger.isEnabledFor(DEBUG):
+            logger.debug('BEGIN request details:')
+            logger.debug('\tmethod: %s', method)
+            logger.debug('\tpath: %s', path)
+            logger.debug('\tversion: %s', version)
+            logger.debug('\turi: %s', uri)
+            for k, v in kwargs.items():
+                logger.debug('\t%s: %s', k, v)
+            logger.debug('END request details.')
 
-        for k, v in kwargs.items():
-            logger.debug('\t{}: {}'.format(k, v))
-        logger.debug('END request details.')
-
-        response = self._request_with_retry(method, uri, **kwargs)
+        response, retries = self._checked_retries(method, uri, path, **kwargs)
 
         try:
             if response.status_code == 401 and response.json().get("reason") == "invalid-token":
-                self._refresh_access_token()
-                response = self._request_with_retry(method, uri, **kwargs)
+                self._refresh_access_token(observed_token)
+                response, token_retries = self._checked_retries(method, uri, path, **kwargs)
+                retries += token_retries + 1
         except AttributeError:
             # Catch AttributeErrors and log response
             # The 401 status will be handled further down
@@ -149,37 +292,84 @@ class Session(requests.Session):
             # might occur if we get a 401 response without a JSON body
             pass
 
+        if self.subscribers:
+            self.publish(self._request_event(method, path, version, response,
+                                             elapsed=perf_counter() - start, retries=retries))
+
         if 200 <= response.status_code <= 299:
             logger.info('%s %s %s', response.status_code, method, path)
             return response
         else:
-            stacktrace = self._extract_response_stacktrace(response)
-            if stacktrace is not None:
-                logger.error('Response arrived with stacktrace:')
-                logger.error(stacktrace)
-            if response.status_code == 400:
-                logger.error('%s %s %s', response.status_code, method, path)
-                logger.error(response.text)
-                raise BadRequest(path, response)
-            elif response.status_code == 401:
-                logger.error('%s %s %s', response.status_code, method, path)
-                raise Unauthorized(path, response)
-            elif response.status_code == 403:
-                logger.error('%s %s %s', response.status_code, method, path)
-                raise Unauthorized(path, response)
-            elif response.status_code == 404:
-                logger.error('%s %s %s', response.status_code, method, path)
-                raise NotFound(path, response)
-            elif response.status_code == 409:
-                logger.debug('%s %s %s', response.status_code, method, path)
-                raise WorkflowConflictException(response.text)
-            elif response.status_code == 425:
-                logger.debug('%s %s %s', response.status_code, method, path)
-                msg = 'Cant execute at this time. Try again later. Error: {}'.format(response.text)
-                raise WorkflowNotReadyException(msg)
-            else:
-                logger.error('%s %s %s', response.status_code, method, path)
-                raise CitrineException(response.text)
+            self._raise_for_status(response, method, path)
+
+    def _checked_retries(self, method: str, uri: str, path: str,
+                         **kwargs) -> Tuple[Response, int]:
+        """Make a request with retries, raising GatewayTimeout if every retry timed out."""
+        try:
+            return self._request_counting_retries(method, uri, **kwargs)
+        except requests.exceptions.RetryError as e:
+            # urllib3 retries 504s itself, and gives up with a RetryError rather than a response
+            reason = getattr(e.args[0], 'reason', None) if e.args else None
+            if isinstance(reason, ResponseError) and str(reason) == _GATEWAY_TIMEOUT_RETRIES:
+                logger.error('%s %s %s', 504, method, path)
+                raise GatewayTimeout(path) from e
+            raise
+
+    @staticmethod
+    def _request_event(method: str, path: str, version: str, response: Response, *,
+                       elapsed: float, retries: int) -> RequestEvent:
+        body = getattr(getattr(response, 'request', None), 'body', None)
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        content = getattr(response, 'content', None)
+        return RequestEvent(
+            method=method,
+            path=path,
+            route=route_template(path),
+            version=version,
+            status_code=response.status_code,
+            elapsed=elapsed,
+            bytes_sent=len(body) if isinstance(body, (bytes, bytearray)) else 0,
+            bytes_received=len(content) if isinstance(content, (bytes, bytearray)) else 0,
+            retries=retries
+        )
+
+    @staticmethod
+    def _raise_for_status(response: Response, method: str, path: str) -> None:
+        """Raise the exception that corresponds to a non-2XX response."""
+        stacktrace = Session._extract_response_stacktrace(response)
+        if stacktrace is not None:
+            logger.error('Response arrived with stacktrace:')
+            logger.error(stacktrace)
+        if response.status_code == 400:
+            logger.error('%s %s %s', response.status_code, method, path)
+            logger.error(response.text)
+            raise BadRequest(path, response)
+        elif response.status_code == 401:
+            logger.error('%s %s %s', response.status_code, method, path)
+            raise Unauthorized(path, response)
+        elif response.status_code == 403:
+            logger.error('%s %s %s', response.status_code, method, path)
+            raise Unauthorized(path, response)
+        elif response.status_code == 404:
+            logger.error('%s %s %s', response.status_code, method, path)
+            raise NotFound(path, response)
+        elif response.status_code == 409:
+            logger.debug('%s %s %s', response.status_code, method, path)
+            raise WorkflowConflictException(response.text)
+        elif response.status_code == 413:
+            logger.error('%s %s %s', response.status_code, method, path)
+            raise PayloadTooLarge(path, response)
+        elif response.status_code == 504:
+            logger.error('%s %s %s', response.status_code, method, path)
+            raise GatewayTimeout(path, response)
+        elif response.status_code == 425:
+            logger.debug('%s %s %s', response.status_code, method, path)
+            msg = 'Cant execute at this time. Try again later. Error: {}'.format(response.text)
+            raise WorkflowNotReadyException(msg)
+        else:
+            logger.error('%s %s %s', response.status_code, method, path)
+            raise CitrineException(response.text)
 
     @staticmethod
     def _extract_response_stacktrace(response: Response) -> Optional[str]:
@@ -227,25 +417,49 @@ class Session(requests.Session):
     @staticmethod
     def cursor_paged_resource(base_method: Callable[..., dict], path: str,
                               forward: bool = True, per_page: int = 100,
-                              version: str = 'v2', **kwargs) -> Iterator[dict]:
+                              version: str = 'v2', prefetch: int = 0,
+                              cursor: Optional[str] = None,
+                              checkpoint: Optional[PathType] = None,
+                              **kwargs) -> CursorIterator[dict]:
         """
-        Returns a flat generator of results for an API query.
+        Returns a flat iterator of results for an API query.
 
         Results are fetched in chunks of size `per_page` and loaded lazily.
+
+        If `prefetch` is positive, pages are fetched on a background thread, up to `prefetch`
+        pages ahead of the one being consumed, so that the round-trip for the next page
+        overlaps with processing of the current one. At most `prefetch` pages are buffered.
+
+        The returned iterator exposes the `cursor` to resume from, which may be passed back
+        as `cursor` to continue an interrupted listing. If a `checkpoint` file is given, the
+        cursor is saved there as each page is started, the listing resumes from it if it
+        already exists, and it is deleted once the listing is complete.
         """
         params = kwargs.get('params', {})
         params['forward'] = forward
         params['ascending'] = forward
         params['per_page'] = per_page
         kwargs['params'] = params
-        while True:
-            response_json = base_method(path, version=version, **kwargs)
-            for obj in response_json['contents']:
-                yield obj
-            cursor = response_json.get('next')
-            if cursor is None:
-                break
-            params['cursor'] = cursor
+
+        if checkpoint is not None:
+            query = {'path': path, 'version': version, 'params': params,
+                     'json': kwargs.get('json')}
+            checkpoint = Checkpoint(checkpoint, query)
+            cursor = checkpoint.load() or cursor
+
+        def fetch_pages():
+            page_cursor = cursor
+            while True:
+                if page_cursor is not None:
+                    params['cursor'] = page_cursor
+                response_json = base_method(path, version=version, **kwargs)
+                yield page_cursor, response_json
+                page_cursor = response_json.get('next')
+                if page_cursor is None:
+                    break
+
+        pages = prefetch_pages(fetch_pages(), depth=prefetch) if prefetch > 0 else fetch_pages()
+        return CursorIterator.from_pages(pages, cursor=cursor, checkpoint=checkpoint)
 
     def checked_post(self, path: str, json: dict, **kwargs) -> Response:
         """Execute a POST request to a URL and utilize error filtering on the response."""
@@ -264,6 +478,69 @@ class Session(requests.Session):
         return self.checked_request('GET', path, **kwargs)
 
 
+class PoolStats:
+    """
+    A snapshot of the connection pool for one host.
+
+    Parameters
+    ----------
+    scheme: str
+        Networking protocol of the pool, http or https
+    host: str
+        Host the pool connects to
+    port: Optional[int]
+        Port the pool connects to
+    maxsize: int
+        Maximum number of connections the pool keeps open for reuse
+    in_use: int
+        Number of connections currently checked out of the pool by in-flight requests
+    idle: int
+        Number of open connections waiting in the pool to be reused
+    num_connections: int
+        Total number of connections opened so far
+    num_requests: int
+        Total number of requests issued so far
+
+    """
+
+    def __init__(self, *, scheme: str, host: str, port: Optional[int], maxsize: int,
+                 in_use: int, idle: int, num_connections: int, num_requests: int):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.maxsize = maxsize
+        self.in_use = in_use
+        self.idle = idle
+        self.num_connections = num_connections
+        self.num_requests = num_requests
+
+    @classmethod
+    def from_pool(cls, pool) -> 'PoolStats':
+        """Take a snapshot of a urllib3 connection pool."""
+        with pool.pool.mutex:
+            slots = list(pool.pool.queue)
+        return cls(scheme=pool.scheme,
+                   host=pool.host,
+                   port=pool.port,
+                   maxsize=pool.pool.maxsize,
+                   in_use=pool.pool.maxsize - len(slots),
+                   idle=sum(1 for conn in slots if conn is not None),
+                   num_connections=pool.num_connections,
+                   num_requests=pool.num_requests)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests that were served on an already-open connection."""
+        if self.num_requests == 0:
+            return 0.0
+        return max(0.0, 1.0 - self.num_connections / self.num_requests)
+
+    def __repr__(self):
+        return '<PoolStats {}://{}:{} in_use={} idle={} maxsize={} reuse_ratio={:.2f}>'.format(
+            self.scheme, self.host, self.port, self.in_use, self.idle, self.maxsize,
+            self.reuse_ratio)
+
+
 class BearerAuth(requests.auth.AuthBase):
     """A lightweight Auth class to support Bearer tokens."""
 
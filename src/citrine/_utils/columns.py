@@ -0,0 +1,180 @@
+"""Build columns of NumPy arrays from rows of serialized results."""
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+ColumnArrays = Dict[str, 'np.ndarray']
+
+# The fields of each type of design variable, by the type tag in its serialized form
+_VARIABLE_FIELDS = {
+    'R': {'m': 'mean', 's': 'std'},
+    'F': {'f': 'formula'},
+    'S': {'s': 'smiles'},
+}
+# Design variables that map names (categories or components) to numbers
+_VARIABLE_MAPPINGS = {'C': 'cp', 'M': 'q'}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _require_numpy():
+    if np is None:  # pragma: no cover
+        raise ImportError('numpy is a requirement for exporting arrays. '
+                          'Install it with `pip install numpy`')
+
+
+class ColumnBuilder:
+    """
+    Accumulates rows into named columns, some of which may be missing from some rows.
+
+    Columns hold floats unless a non-numeric value is added to them, in which case they
+    hold objects. Missing numbers are filled with `fill` and missing objects with None.
+
+    Parameters
+    ----------
+    fill: float
+        The value of a number missing from a row. Default is NaN.
+
+    """
+
+    def __init__(self, fill: float = float('nan')):
+        _require_numpy()
+        self.fill = fill
+        self._columns: Dict[str, list] = {}
+        self._numeric: Dict[str, bool] = {}
+        self._rows = 0
+
+    def add(self, row: Dict[str, Any]) -> None:
+        """Add a row, given as a mapping from column names to values."""
+        for name, value in row.items():
+            column = self._columns.get(name)
+            if column is None:
+                # A new column is missing from all of the earlier rows
+                column = self._columns[name] = [None] * self._rows
+                self._numeric[name] = True
+            if value is not None and not _is_number(value):
+                self._numeric[name] = False
+            column.append(value)
+        self._rows += 1
+        for column in self._columns.values():
+            if len(column) < self._rows:
+                column.append(None)
+
+    def to_arrays(self, order: Optional[Iterable[str]] = None) -> ColumnArrays:
+        """
+        Return the columns as arrays of the same length.
+
+        Parameters
+        ----------
+        order: Optional[Iterable[str]]
+            Names of the columns to put first, in order. Columns that were never added are
+            left out, and the rest follow in the order they were first added.
+
+        """
+        names = [name for name in (order or ()) if name in self._columns]
+        names += [name for name in self._columns if name not in names]
+        arrays = {}
+        for name in names:
+            column = self._columns[name]
+            if self._numeric[name]:
+                arrays[name] = np.array([self.fill if x is None else x for x in column],
+                                        dtype=np.float64)
+            else:
+                array = np.empty(len(column), dtype=object)
+                array[:] = column
+                arrays[name] = array
+        return arrays
+
+
+def candidate_columns(candidates: Iterable[dict], start_rank: int = 1) -> ColumnArrays:
+    """
+    Columns of serialized design candidates, which are listed in rank order.
+
+    There is a column for the material id, rank and primary score of each candidate, then
+    columns for the design variables of each descriptor, named `descriptor.field`. The fields
+    are `mean` and `std` for real values, the name of each category or component for
+    categorical values and mixtures, `formula` for chemical formulae and `smiles` for
+    molecular structures.
+    """
+    builder = ColumnBuilder()
+    for rank, candidate in enumerate(candidates, start=start_rank):
+        row = {'material_id': candidate['material_id'],
+               'rank': rank,
+               'primary_score': candidate['primary_score']}
+        for key, variable in candidate['material']['vars'].items():
+            typ = variable['type']
+            if typ in _VARIABLE_MAPPINGS:
+                for name, number in variable[_VARIABLE_MAPPINGS[typ]].items():
+                    row['{}.{}'.format(key, name)] = number
+            else:
+                for field, name in _VARIABLE_FIELDS[typ].items():
+                    row['{}.{}'.format(key, name)] = variable[field]
+        builder.add(row)
+    arrays = builder.to_arrays(order=('material_id', 'rank', 'primary_score'))
+    if 'rank' in arrays:
+        arrays['rank'] = arrays['rank'].astype(np.int64)
+    return arrays
+
+
+def _point_row(point: dict) -> dict:
+    return {'uuid': point['uuid'], 'trial': point['trial'], 'fold': point['fold']}
+
+
+def _int_columns(arrays: ColumnArrays) -> ColumnArrays:
+    for name in ('trial', 'fold'):
+        if name in arrays:
+            arrays[name] = arrays[name].astype(np.int64)
+    return arrays
+
+
+def real_pva_columns(points: Iterable[dict]) -> ColumnArrays:
+    """
+    Columns of serialized real-valued predicted vs. actual points.
+
+    They are `uuid`, `trial`, `fold` and the `mean` and `standard_error` of the `predicted`
+    and `actual` values, as `predicted.mean` and so on.
+    """
+    builder = ColumnBuilder()
+    for point in points:
+        row = _point_row(point)
+        for which in ('predicted', 'actual'):
+            value = point[which]
+            row[which + '.mean'] = value['mean']
+            row[which + '.standard_error'] = value.get('standard_error')
+        builder.add(row)
+    return _int_columns(builder.to_arrays(order=(
+        'uuid', 'trial', 'fold', 'predicted.mean', 'predicted.standard_error',
+        'actual.mean', 'actual.standard_error')))
+
+
+def categorical_pva_columns(points: Iterable[dict]) -> ColumnArrays:
+    """
+    Columns of serialized categorical predicted vs. actual points.
+
+    They are `uuid`, `trial`, `fold` and the probability of each class in the `predicted` and
+    `actual` distributions, as `predicted.class name` and so on. Classes missing from a
+    distribution have a probability of zero.
+    """
+    builder = ColumnBuilder(fill=0.0)
+    for point in points:
+        row = _point_row(point)
+        for which in ('predicted', 'actual'):
+            for name, probability in point[which].items():
+                row['{}.{}'.format(which, name)] = probability
+        builder.add(row)
+    return _int_columns(builder.to_arrays(order=('uuid', 'trial', 'fold')))
+
+
+def to_frame(arrays: ColumnArrays):
+    """Put columns into a pandas DataFrame, keeping their order."""
+    try:
+        import pandas as pd
+    except ImportError:  # pragma: no cover
+        raise ImportError('pandas is a requirement for exporting data frames. '
+                          'Install it with `pip install citrine[builders]`')
+    return pd.DataFrame(arrays, columns=list(arrays))
@@ -0,0 +1,156 @@
+"""Iteration over cursor-paged listings that can be resumed after an interruption."""
+import json
+import os
+from typing import Callable, Iterator, Optional, Tuple, TypeVar, Union
+
+T = TypeVar('T')
+S = TypeVar('S')
+
+PathType = Union[str, 'os.PathLike']
+
+
+class _Position:
+    """Where a listing has got to, shared by an iterator and the iterators mapped from it."""
+
+    def __init__(self, cursor: Optional[str]):
+        self.cursor = cursor
+        self.exhausted = False
+
+
+class CursorIterator(Iterator[T]):
+    """
+    An iterator over the results of a cursor-paged listing that records where to resume.
+
+    :attr:`cursor` is the token of the page holding the most recently yielded result, or None
+    while on the first page. Starting the same listing from that cursor resumes at the
+    beginning of that page, so no results are skipped but up to a page of them may be
+    yielded a second time.
+    """
+
+    def __init__(self, items: Iterator[T], position: _Position):
+        self._items = items
+        self._position = position
+
+    @classmethod
+    def from_pages(cls,
+                   pages: Iterator[Tuple[Optional[str], dict]],
+                   *,
+                   cursor: Optional[str] = None,
+                   checkpoint: Optional['Checkpoint'] = None) -> 'CursorIterator[dict]':
+        """
+        Flatten pages of results, tracking the cursor each page was requested with.
+
+        Parameters
+        ----------
+        pages: Iterator[Tuple[Optional[str], dict]]
+            Pairs of the cursor a page was requested with and the response for that page,
+            whose results are under ``contents``.
+        cursor: Optional[str]
+            The cursor the first page was requested with.
+        checkpoint: Optional[Checkpoint]
+            If given, the cursor is saved there whenever a new page is started and the
+            checkpoint is removed once the listing is exhausted.
+
+        """
+        position = _Position(cursor)
+
+        def items():
+            try:
+                for page_cursor, response_json in pages:
+                    if page_cursor != position.cursor:
+                        # Every result of the previous page has been consumed
+                        position.cursor = page_cursor
+                        if checkpoint is not None:
+                            checkpoint.save(page_cursor)
+                    for obj in response_json['contents']:
+                        yield obj
+                position.exhausted = True
+                if checkpoint is not None:
+                    checkpoint.remove()
+            finally:
+                pages.close()
+
+        return cls(items(), position)
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """The cursor to resume this listing from."""
+        return self._position.cursor
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether every result of the listing has been yielded."""
+        return self._position.exhausted
+
+    def map(self, function: Callable[[T], S]) -> 'CursorIterator[S]':
+        """Apply a function to every result, keeping track of the same cursor."""
+        def mapped():
+            try:
+                for item in self._items:
+                    yield function(item)
+            finally:
+                self.close()
+
+        return CursorIterator(mapped(), self._position)
+
+    def close(self) -> None:
+        """Stop the listing, releasing any pages being read ahead."""
+        close = getattr(self._items, 'close', None)
+        if close is not None:
+            close()
+
+    def __iter__(self) -> 'CursorIterator[T]':
+        return self
+
+    def __next__(self) -> T:
+        return next(self._items)
+
+
+class Checkpoint:
+    """
+    A file recording the cursor of a listing, so that it can be resumed by a later process.
+
+    The file also records the query being listed, so that resuming a different listing from
+    it is an error rather than silently skipping results. It is replaced atomically on every
+    save, so a crash never leaves it half-written.
+
+    Parameters
+    ----------
+    path: Union[str, os.PathLike]
+        Location of the checkpoint file
+    query: dict
+        A JSON-serializable description of the listing, such as its path and parameters
+
+    """
+
+    def __init__(self, path: PathType, query: dict):
+        self.path = os.fspath(path)
+        # Compare against the query as it will read back from the file
+        self.query = json.loads(json.dumps(query, default=str))
+
+    def load(self) -> Optional[str]:
+        """Return the saved cursor, or None if there is no checkpoint yet."""
+        try:
+            with open(self.path) as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return None
+        if saved.get('query') != self.query:
+            raise ValueError("Checkpoint {} was saved by a different listing".format(self.path))
+        return saved['cursor']
+
+    def save(self, cursor: Optional[str]) -> None:
+        """Record the cursor to resume from."""
+        temporary = self.path + '.tmp'
+        with open(temporary, 'w') as f:
+            json.dump({'query': self.query, 'cursor': cursor}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+
+    def remove(self) -> None:
+        """Delete the checkpoint, once the listing is complete."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,84 @@
+"""Read-ahead over a slow iterable, using a background thread."""
+from queue import Queue, Full
+from threading import Thread, Event
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
+
+# How often a blocked producer checks whether the consumer has gone away, in seconds
+_POLL_INTERVAL = 0.1
+
+
+class _Failure:
+    """Carries an exception raised by the producer over to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_DONE = object()
+
+
+def prefetch(iterable: Iterable[T], depth: int = 1) -> Iterator[T]:
+    """
+    Iterate over `iterable` while a background thread reads up to `depth` items ahead.
+
+    This lets slow items (such as pages of results from an API) be produced while the
+    consumer is still working through earlier ones. At most `depth` items are buffered, so
+    memory stays bounded no matter how far behind the consumer falls. Exceptions raised
+    while producing an item are re-raised to the consumer in order. If the consumer stops
+    early, the background thread finishes the item it is producing and then exits.
+
+    Parameters
+    ----------
+    iterable: Iterable[T]
+        The items to read ahead. Iteration happens entirely on the background thread.
+    depth: int
+        Maximum number of items to hold in memory ahead of the consumer. Must be positive.
+
+    Returns
+    -------
+    Iterator[T]
+        The items of `iterable`, in order.
+
+    """
+    if depth < 1:
+        raise ValueError("Prefetch depth must be positive, got {}".format(depth))
+    buffer = Queue(maxsize=depth)
+    stopped = Event()
+
+    def offer(item) -> bool:
+        """Block until there is room for the item, giving up if the consumer has left."""
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not offer(item):
+                    return
+            offer(_DONE)
+        except BaseException as e:
+            offer(_Failure(e))
+
+    def consume():
+        thread = Thread(target=produce, name='citrine-prefetch', daemon=True)
+        thread.start()
+        try:
+            while True:
+                # The producer always finishes by offering _DONE or a failure
+                item = buffer.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+        finally:
+            stopped.set()
+
+    return consume()
@@ -0,0 +1,276 @@
+"""Schedule batches of data concepts objects so that each is written after what it links to."""
+import math
+from collections import defaultdict
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from gemd.entity.base_entity import BaseEntity
+from gemd.entity.dict_serializable import DictSerializable
+from gemd.util import writable_sort_order
+
+from citrine.instrumentation import BatchSizeEvent
+
+# Values that never hold links, which are most of the values of an object
+_ATOMIC = frozenset((str, int, float, bool))
+
+
+def direct_links(model: BaseEntity) -> List[BaseEntity]:
+    """
+    The objects that a model points to, not counting the objects those point to in turn.
+
+    Only the writable direction of bidirectional links is followed, so a material run links to
+    the process run that made it, but that process run does not link back to the material.
+    """
+    links = []
+    queue = [value for key, value in vars(model).items() if key not in model.skip]
+    while queue:
+        value = queue.pop()
+        if value is None or type(value) in _ATOMIC:
+            continue
+        if isinstance(value, BaseEntity):
+            links.append(value)
+        elif isinstance(value, (list, tuple)):
+            queue.extend(value)
+        elif isinstance(value, dict):
+            queue.extend(value.values())
+        elif isinstance(value, DictSerializable):
+            # An attribute, bounds or value, which may point to a template
+            queue.extend(vars(value).values())
+    return links
+
+
+def type_order(models: Sequence[BaseEntity]) -> List[int]:
+    """
+    The positions of objects grouped by type, in an order in which the types can be written.
+
+    Types that can be written in either order keep the order they first appear in, and so do
+    the objects of each type.
+    """
+    ranks = {}
+    for model in models:
+        ranks.setdefault(model.typ, len(ranks))
+    types = sorted(ranks, key=lambda typ: (writable_sort_order(typ), ranks[typ]))
+    rank = {typ: position for position, typ in enumerate(types)}
+    return sorted(range(len(models)), key=lambda index: rank[models[index].typ])
+
+
+class WriteSchedule:
+    """
+    Orders the writing of a set of objects by the links between them.
+
+    Each object is ready to be written once every object it links to within the set has been
+    written. Ready objects of the same type are released in batches, and a batch is released
+    as soon as it is full, or holds all of the remaining objects of its type. So objects are
+    written in no more batches than when every type waits for all types before it, but a full
+    batch of material runs can be written as soon as the process runs they come out of are
+    written, without waiting for other, unrelated process runs.
+
+    Parameters
+    ----------
+    models: Sequence[BaseEntity]
+        The objects to write
+    batch_size: Union[int, Callable[[str], int]]
+        The largest number of objects in a batch, or a function of the type of the objects
+        that returns it, which is called every time batches are released
+
+    """
+
+    def __init__(self,
+                 models: Sequence[BaseEntity],
+                 *,
+                 batch_size: Union[int, Callable[[str], int]] = 50):
+        self.models = list(models)
+        self.batch_size = batch_size if callable(batch_size) else lambda typ: batch_size
+
+        by_type = defaultdict(list)
+        for index, model in enumerate(self.models):
+            by_type[model.typ].append(index)
+        # Types are released in the order they would be written one type at a time
+        types = sorted(by_type, key=lambda typ: writable_sort_order(typ))
+
+        position = {}
+        for index, model in enumerate(self.models):
+            position.setdefault(id(model), index)
+        self._dependents: Dict[int, List[int]] = defaultdict(list)
+        self._waiting_on = [0] * len(self.models)
+        for index, model in enumerate(self.models):
+            for link in {id(x): x for x in direct_links(model)}:
+                target = position.get(link)
+                if target is not None and target != index:
+                    self._dependents[target].append(index)
+                    self._waiting_on[index] += 1
+
+        self._ready: Dict[str, List[int]] = {typ: [] for typ in types}
+        self._remaining = {typ: len(indices) for typ, indices in by_type.items()}
+        for index, model in enumerate(self.models):
+            if self._waiting_on[index] == 0:
+                self._ready[model.typ].append(index)
+        self._unwritten = len(self.models)
+
+    @property
+    def done(self) -> bool:
+        """Whether every object has been written."""
+        return self._unwritten == 0
+
+    def take(self, limit: int, *, idle: bool) -> List[List[int]]:
+        """
+        Release up to `limit` batches of objects that are ready to be written.
+
+        Parameters
+        ----------
+        limit: int
+            The largest number of batches to release
+        idle: bool
+            Whether no batches are being written. If none are, and no batch is ready, then
+            the objects that are ready are released anyway rather than waiting forever, which
+            can only happen if objects link to each other in a cycle.
+
+        Returns
+        -------
+        List[List[int]]
+            The indices of the objects in each batch, all of one type
+
+        """
+        batches = []
+        for typ, ready in self._ready.items():
+            size = self.batch_size(typ)
+            while len(batches) < limit and ready and \
+                    (len(ready) >= size or len(ready) == self._remaining[typ]):
+                batches.append(self._release(typ, size))
+        if not batches and idle and not self.done:
+            batches = self._break_cycle()
+        return batches
+
+    def written(self, batch: List[int]) -> None:
+        """Record that a batch has been written, which can make other objects ready."""
+        for index in batch:
+            self._unwritten -= 1
+            for dependent in self._dependents.pop(index, ()):
+                self._waiting_on[dependent] -= 1
+                if self._waiting_on[dependent] == 0:
+                    self._ready[self.models[dependent].typ].append(dependent)
+
+    def _release(self, typ: str, size: int) -> List[int]:
+        ready = self._ready[typ]
+        batch = ready[:size]
+        del ready[:size]
+        self._remaining[typ] -= len(batch)
+        return batch
+
+    def _break_cycle(self) -> List[List[int]]:
+        for typ, ready in self._ready.items():
+            if ready:
+                return [self._release(typ, self.batch_size(typ))]
+        # Nothing is ready at all, so release the first type with objects left to write
+        typ = next(typ for typ in self._ready if self._remaining[typ])
+        stuck = [index for index, model in enumerate(self.models)
+                 if model.typ == typ and self._waiting_on[index] > 0]
+        for index in stuck:
+            self._waiting_on[index] = 0
+        self._ready[typ].extend(stuck)
+        return [self._release(typ, self.batch_size(typ))]
+
+
+class BatchSizer:
+    """
+    Adapts the size of the batches in which objects of one type are written.
+
+    Batches are capped both by the number of objects in them and by the size of the objects
+    once serialized. The number of objects grows by half while full batches take less than
+    half of `target_latency` to write, and is scaled down when they take longer than it. If a
+    batch is rejected as too large or times out, the number is halved and the batch is retried
+    in smaller pieces. Every change is published as a
+    :class:`~citrine.instrumentation.BatchSizeEvent`. It is safe to share one instance between
+    threads.
+
+    Parameters
+    ----------
+    object_type: str
+        Type of the objects to write
+    initial: int
+        Number of objects in the first batch
+    max_count: int
+        Largest number of objects in a batch
+    max_bytes: int
+        Largest size of the serialized objects in a batch, unless a single object is larger
+    target_latency: float
+        Time that writing a batch should take, in seconds
+    publish: Optional[Callable[[object], None]]
+        Called with an event every time the batch size changes
+
+    """
+
+    def __init__(self,
+                 object_type: str,
+                 *,
+                 initial: int = 50,
+                 max_count: int = 500,
+                 max_bytes: int = 4 * 2 ** 20,
+                 target_latency: float = 10.0,
+                 publish: Optional[Callable[[object], None]] = None):
+        self.object_type = object_type
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.target_latency = target_latency
+        self.size = max(1, min(initial, max_count))
+        self._publish = publish
+        self._lock = Lock()
+
+    def split(self, sizes: Sequence[int]) -> List[range]:
+        """
+        Split serialized objects into consecutive batches that respect both caps.
+
+        Parameters
+        ----------
+        sizes: Sequence[int]
+            Size of each serialized object, in bytes
+
+        Returns
+        -------
+        List[range]
+            The positions of the objects in each batch
+
+        """
+        batches = []
+        start, total = 0, 0
+        for end, nbytes in enumerate(sizes):
+            if end > start and (end - start >= self.size or total + nbytes > self.max_bytes):
+                batches.append(range(start, end))
+                start, total = end, 0
+            total += nbytes
+        if start < len(sizes):
+            batches.append(range(start, len(sizes)))
+        return batches
+
+    def succeeded(self, count: int, nbytes: int, elapsed: float) -> None:
+        """Adapt to the time it took to write a batch."""
+        with self._lock:
+            size = self.size
+            reason = None
+            if elapsed > self.target_latency:
+                size = max(1, min(size, math.floor(count * self.target_latency / elapsed)))
+                reason = 'slow'
+            elif count >= size and elapsed < self.target_latency / 2:
+                size = min(self.max_count, math.ceil(size * 1.5))
+                reason = 'fast'
+            if count and nbytes:
+                # Keep batches of objects of the same size as these under the byte limit
+                fits = max(1, math.floor(self.max_bytes * count / nbytes))
+                if size > fits:
+                    size, reason = fits, 'bytes'
+            self._resize(size, reason, count, nbytes, elapsed)
+
+    def failed(self, count: int, nbytes: int, elapsed: float, *, reason: str) -> None:
+        """Shrink batches after one of `count` objects was too large or timed out."""
+        with self._lock:
+            self._resize(max(1, min(self.size, count // 2)), reason, count, nbytes, elapsed)
+
+    def _resize(self, size: int, reason: Optional[str], count: int, nbytes: int,
+                elapsed: float) -> None:
+        if size == self.size:
+            return
+        previous, self.size = self.size, size
+        if self._publish is not None:
+            self._publish(BatchSizeEvent(object_type=self.object_type, previous=previous,
+                                         size=size, reason=reason, count=count,
+                                         bytes_sent=nbytes, elapsed=elapsed))
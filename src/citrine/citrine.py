@@ -1,6 +1,9 @@
 from typing import Optional
 from os import environ
 
+import requests.adapters
+
+from citrine._async_session import AsyncSession
 from citrine._session import Session
 from citrine.resources.project import ProjectCollection
 from citrine.resources.user import UserCollection
@@ -19,6 +22,17 @@ class Citrine:
         Host URL, generally '<your_site>.citrine-platform.com'
     port: Optional[str]
         Optional networking port
+    pool_connections: int
+        Number of hosts for which to cache a connection pool. Default is the requests
+        default, 10.
+    pool_maxsize: int
+        Maximum number of connections to keep open to each host. Concurrent workloads should
+        set this to at least the number of threads making requests. Default is the requests
+        default, 10.
+    pool_block: bool
+        Whether a request should wait for a free connection when the pool is exhausted,
+        rather than open a connection that is discarded afterwards. Default is the requests
+        default, False.
 
     """
 
@@ -26,8 +40,15 @@ class Citrine:
                  api_key: str = environ.get('CITRINE_API_KEY'),
                  scheme: str = 'https',
                  host: str = environ.get('CITRINE_API_HOST'),
-                 port: Optional[str] = None):
-        self.session: Session = Session(api_key, scheme, host, port)
+                 port: Optional[str] = None,
+                 *,
+                 pool_connections: int = requests.adapters.DEFAULT_POOLSIZE,
+                 pool_maxsize: int = requests.adapters.DEFAULT_POOLSIZE,
+                 pool_block: bool = requests.adapters.DEFAULT_POOLBLOCK):
+        self.session: Session = Session(api_key, scheme, host, port,
+                                        pool_connections=pool_connections,
+                                        pool_maxsize=pool_maxsize,
+                                        pool_block=pool_block)
 
     @property
     def projects(self) -> ProjectCollection:
@@ -38,3 +59,46 @@ class Citrine:
     def users(self) -> UserCollection:
         """Return the collection of all users."""
         return UserCollection(self.session)
+
+
+class AsyncCitrine:
+    """The asyncio entry point for interacting with the Citrine Platform.
+
+    The session is an :class:`~citrine._async_session.AsyncSession`, whose request methods
+    are coroutines. It requires the optional `aiohttp` dependency, and should be closed when
+    no longer needed, either by awaiting :func:`close` or with ``async with``.
+
+    Parameters
+    ----------
+    api_key: str
+        Unique key that allows a user to access the Citrine Platform.
+    scheme: str
+        Networking protocol; usually https
+    host: str
+        Host URL, generally '<your_site>.citrine-platform.com'
+    port: Optional[str]
+        Optional networking port
+    max_connections: int
+        Maximum number of simultaneously open connections. Default is 100.
+
+    """
+
+    def __init__(self,
+                 api_key: str = environ.get('CITRINE_API_KEY'),
+                 scheme: str = 'https',
+                 host: str = environ.get('CITRINE_API_HOST'),
+                 port: Optional[str] = None,
+                 *,
+                 max_connections: int = 100):
+        self.session: AsyncSession = AsyncSession(api_key, scheme, host, port,
+                                                  max_connections=max_connections)
+
+    async def __aenter__(self) -> 'AsyncCitrine':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the session and its connections."""
+        await self.session.close()
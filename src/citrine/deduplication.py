@@ -0,0 +1,121 @@
+"""Strategies for skipping resources that were already yielded while paginating."""
+import math
+from collections import deque
+from hashlib import blake2b
+from typing import Hashable
+
+
+class Deduplicator:
+    """
+    Remembers the uids yielded by a listing so that repeats can be skipped.
+
+    A listing calls :meth:`start_page` before each page of results and :meth:`add` for each
+    resource on it. Subclasses trade exactness for memory; an instance holds the state of a
+    single listing and should not be reused.
+    """
+
+    def start_page(self) -> None:
+        """Note that the following uids belong to a new page of results."""
+
+    def add(self, uid: Hashable) -> bool:
+        """Record a uid, returning True if it has not been seen before."""
+        raise NotImplementedError  # pragma: no cover
+
+
+class ExactDeduplicator(Deduplicator):
+    """
+    Remember every uid.
+
+    Never skips a resource by mistake, but memory grows with the length of the listing.
+    This is the default.
+    """
+
+    def __init__(self):
+        self._seen = set()
+
+    def add(self, uid: Hashable) -> bool:
+        """Record a uid, returning True if it has not been seen before."""
+        if uid in self._seen:
+            return False
+        self._seen.add(uid)
+        return True
+
+
+class WindowDeduplicator(Deduplicator):
+    """
+    Remember only the uids on the most recent pages.
+
+    Repeats caused by resources shifting across a page boundary while listing are always
+    within a page or two of each other, so a short window catches them in constant memory.
+    A resource that reappears further back than the window is yielded again.
+
+    Parameters
+    ----------
+    pages: int
+        Number of pages to remember, including the current one. Default is 2.
+
+    """
+
+    def __init__(self, pages: int = 2):
+        if pages < 1:
+            raise ValueError("The window must cover at least one page, got {}".format(pages))
+        self._pages = deque([set()], maxlen=pages)
+
+    def start_page(self) -> None:
+        """Note that the following uids belong to a new page of results."""
+        self._pages.append(set())
+
+    def add(self, uid: Hashable) -> bool:
+        """Record a uid, returning True if it has not been seen within the window."""
+        if any(uid in page for page in self._pages):
+            return False
+        self._pages[-1].add(uid)
+        return True
+
+
+class BloomDeduplicator(Deduplicator):
+    """
+    Remember uids in a Bloom filter of fixed size.
+
+    Memory is fixed up front by `capacity` and `false_positive_rate` (about 1.8 MB for the
+    defaults) rather than growing with the listing. Repeats are always skipped, but a small
+    fraction of new resources is mistaken for repeats and skipped too. That fraction stays
+    below `false_positive_rate` until `capacity` uids have been recorded and rises after.
+
+    Parameters
+    ----------
+    capacity: int
+        Number of uids the filter is sized for. Default is one million.
+    false_positive_rate: float
+        Probability of skipping a new resource once `capacity` uids have been recorded.
+        Default is 0.001.
+
+    """
+
+    def __init__(self, capacity: int = 1000000, false_positive_rate: float = 0.001):
+        if capacity < 1:
+            raise ValueError("Capacity must be positive, got {}".format(capacity))
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("False positive rate must be between 0 and 1, got {}"
+                             .format(false_positive_rate))
+        bits = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        self._num_bits = bits
+        self._num_hashes = max(1, round(bits / capacity * math.log(2)))
+        self._bits = bytearray((bits + 7) // 8)
+
+    def _positions(self, uid: Hashable):
+        # Derive all positions from two independent 64-bit hashes (Kirsch-Mitzenmacher)
+        digest = blake2b(str(uid).encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * second) % self._num_bits for i in range(self._num_hashes))
+
+    def add(self, uid: Hashable) -> bool:
+        """Record a uid, returning True if it has (probably) not been seen before."""
+        new = False
+        for position in self._positions(uid):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not self._bits[byte] & mask:
+                self._bits[byte] |= mask
+                new = True
+        return new
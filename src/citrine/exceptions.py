@@ -97,6 +97,18 @@ class BadRequest(NonRetryableHttpException):
     pass
 
 
+class PayloadTooLarge(NonRetryableHttpException):
+    """The body of the request is larger than the server accepts. (http status 413)."""
+
+    pass
+
+
+class GatewayTimeout(NonRetryableHttpException):
+    """The server did not respond in time, even after retrying. (http status 504)."""
+
+    pass
+
+
 class WorkflowConflictException(NonRetryableException):
     """There is a conflict preventing the workflow from being executed. (http status 409)."""
 
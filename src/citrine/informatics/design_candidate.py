@@ -23,6 +23,8 @@ class DesignVariable(PolymorphicSerializable["DesignVariable"]):
     these are simplified representations of the values.
     """
 
+    __slots__ = ()
+
     def __init__(self, arg):
         pass  # pragma: no cover
 
@@ -44,6 +46,8 @@ class MeanAndStd(Serializable["MeanAndStd"], DesignVariable):
     This does not imply that the distribution is Normal.
     """
 
+    __slots__ = properties.slots('mean', 'std')
+
     mean = properties.Float('m')
     """:float: mean of the continuous distribution"""
     std = properties.Float('s')
@@ -60,6 +64,8 @@ class TopCategories(Serializable["CategoriesAndProbabilities"], DesignVariable):
     may have non-zero probabilities.
     """
 
+    __slots__ = properties.slots('probabilities')
+
     probabilities = properties.Mapping(properties.String, properties.Float, 'cp')
     """:Dict[str, float]: mapping from category names to their probabilities"""
 
@@ -104,6 +110,8 @@ class MolecularStructure(Serializable["MolecularStructure"], DesignVariable):
 class DesignMaterial(Serializable["DesignMaterial"]):
     """Description of the material that was designed, as a set of DesignVariables."""
 
+    __slots__ = properties.slots('values')
+
     values = properties.Mapping(properties.String, properties.Object(DesignVariable), 'vars')
     """:Dict[str, DesignVariable]: mapping from descriptor keys to the value for this material"""
 
@@ -117,6 +125,8 @@ class DesignCandidate(Serializable["DesignCandidate"]):
     This class represents the candidate computed by a design execution.
     """
 
+    __slots__ = properties.slots('material_id', 'identifiers', 'primary_score', 'material')
+
     material_id = properties.UUID('material_id')
     """:UUID: unique Citrine id of the material"""
     identifiers = properties.List(properties.String(), 'identifiers')
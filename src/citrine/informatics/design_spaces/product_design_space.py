@@ -61,7 +61,7 @@ class ProductDesignSpace(Resource['ProductDesignSpace'], DesignSpace, AIResource
         for i, subspace in enumerate(model_copy.subspaces):
             if isinstance(subspace, DesignSpace) and subspace.uid is not None:
                 model_copy.subspaces[i] = subspace.uid
-        serialized = properties.Object(ProductDesignSpace).serialize(model_copy)
+        serialized = properties.Object.of(ProductDesignSpace).serialize(model_copy)
         return self._post_dump(serialized)
 
     def _post_dump(self, data: dict) -> dict:
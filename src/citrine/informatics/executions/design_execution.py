@@ -1,5 +1,5 @@
 from functools import partial
-from typing import Optional, Iterable
+from typing import Optional, Iterable, Iterator
 from uuid import UUID
 
 from citrine._rest.asynchronous_object import AsynchronousObject
@@ -8,12 +8,85 @@ from citrine._rest.paginator import Paginator
 from citrine._rest.resource import Resource
 from citrine._serialization import properties
 from citrine._session import Session
+from citrine._utils import columns
 from citrine._utils.functions import format_escaped_url
 from citrine.informatics.descriptors import Descriptor
 from citrine.informatics.design_candidate import DesignCandidate
 from citrine.informatics.scores import Score
 
 
+class DesignCandidateListing(Iterator[DesignCandidate]):
+    """
+    The candidates of a design execution, in rank order.
+
+    Iterating yields :class:`DesignCandidate` objects. Alternatively, :meth:`to_arrays` and
+    :meth:`to_frame` put the candidates into columns straight from the API responses,
+    without building an object per candidate. Pages are only fetched as they are needed and
+    a listing can only be read once, by either means.
+    """
+
+    def __init__(self, raw_candidates: Iterable[dict], start_rank: int = 1, *,
+                 lazy: bool = False):
+        self._raw = iter(raw_candidates)
+        self._rank = start_rank
+        self._lazy = lazy
+        self._candidates = None
+
+    def _take(self) -> Iterator[dict]:
+        for raw in self._raw:
+            self._rank += 1
+            yield raw
+
+    def __iter__(self) -> Iterator[DesignCandidate]:
+        return self
+
+    def __next__(self) -> DesignCandidate:
+        # Created on first use, so that the columns can be read without iterating first
+        if self._candidates is None:
+            self._candidates = (self._build(raw) for raw in self._take())
+        return next(self._candidates)
+
+    def _build(self, raw: dict) -> DesignCandidate:
+        if self._lazy:
+            with properties.lazy_deserialization():
+                return DesignCandidate.build(raw)
+        return DesignCandidate.build(raw)
+
+    def to_arrays(self) -> columns.ColumnArrays:
+        """
+        Read the remaining candidates into NumPy arrays, one per column.
+
+        Requires numpy. The columns are
+
+        * ``material_id``: the material id of each candidate
+        * ``rank``: the 1-based position of each candidate in the listing
+        * ``primary_score``: the primary score of each candidate
+        * ``<descriptor>.mean`` and ``<descriptor>.std`` for real descriptors
+        * ``<descriptor>.<category>`` with the probability of each category, for
+          categorical descriptors, and ``<descriptor>.<component>`` with the quantity of each
+          component, for mixtures
+        * ``<descriptor>.formula`` and ``<descriptor>.smiles`` for chemical formulae and
+          molecular structures
+
+        Numbers missing from a candidate are NaN and other missing values are None.
+
+        Returns
+        -------
+        Dict[str, numpy.ndarray]
+            The columns, by name
+
+        """
+        return columns.candidate_columns(self._take(), start_rank=self._rank)
+
+    def to_frame(self):
+        """
+        Read the remaining candidates into a pandas DataFrame.
+
+        Requires numpy and pandas. The columns are those of :meth:`to_arrays`.
+        """
+        return columns.to_frame(self.to_arrays())
+
+
 class DesignExecution(Resource['DesignExecution'], Pageable, AsynchronousObject):
     """The execution of a DesignWorkflow.
 
@@ -90,20 +163,50 @@ class DesignExecution(Resource['DesignExecution'], Pageable, AsynchronousObject)
         )
 
     @classmethod
-    def _build_candidates(cls, subset_collection: Iterable[dict]) -> Iterable[DesignCandidate]:
-        for candidate in subset_collection:
-            yield DesignCandidate.build(candidate)
+    def _raw_candidates(cls, subset_collection: Iterable[dict]) -> Iterable[dict]:
+        return subset_collection
 
     def candidates(self, *,
                    page: Optional[int] = None,
                    per_page: int = 100,
-                   ) -> Iterable[DesignCandidate]:
-        """Fetch the Design Candidates for the particular execution, paginated."""
+                   max_workers: int = 1,
+                   lazy: bool = False,
+                   ) -> DesignCandidateListing:
+        """
+        Fetch the Design Candidates for the particular execution, paginated.
+
+        Parameters
+        ---------
+        page: int, optional
+            The "page" of results to list. Default is to read all pages and yield
+            all results.  This option is deprecated.
+        per_page: int, optional
+            Max number of results to return per page. Default is 100.
+        max_workers: int, optional
+            Number of pages to fetch concurrently. Default is 1, which fetches one page at a
+            time. Larger values fetch a sliding window of pages in parallel, which speeds up
+            listing long collections at the cost of a few requests past the final page.
+        lazy: bool
+            If True, nested parts of each candidate, such as its material, are only
+            deserialized when they are first read. This makes reading the ids and scores of
+            many candidates much faster. Default is False.
+
+        Returns
+        -------
+        DesignCandidateListing
+            The candidates, in rank order. Iterate over it for :class:`DesignCandidate`
+            objects, or call its ``to_arrays()`` or ``to_frame()`` for columns.
+
+        """
         path = self._path() + '/candidates'
 
         fetcher = partial(self._fetch_page, path=path, fetch_func=self._session.get_resource)
 
-        return self._paginator.paginate(page_fetcher=fetcher,
-                                        collection_builder=self._build_candidates,
-                                        page=page,
-                                        per_page=per_page)
+        return DesignCandidateListing(self._paginator.paginate(
+            page_fetcher=fetcher,
+            collection_builder=self._raw_candidates,
+            page=page,
+            per_page=per_page,
+            max_workers=max_workers),
+            start_rank=1 if page is None else (page - 1) * per_page + 1,
+            lazy=lazy)
@@ -65,7 +65,7 @@ class PredictorEvaluationExecution(Resource['PredictorEvaluationExecution'], Asy
         )
 
     @lru_cache()
-    def results(self, evaluator_name: str) -> PredictorEvaluationResult:
+    def results(self, evaluator_name: str, *, lazy: bool = False) -> PredictorEvaluationResult:
         """
         Get a specific evaluation result by the name of the evaluator that produced it.
 
@@ -73,6 +73,10 @@ class PredictorEvaluationExecution(Resource['PredictorEvaluationExecution'], Asy
         ----------
         evaluator_name: str
             Name of the evaluator for which to get the results
+        lazy: bool
+            If True, nested parts of the result, such as the predicted vs. actual data of
+            each response, are only deserialized when they are first read. This makes
+            reading a few metrics out of a large result much faster. Default is False.
 
         Returns
         -------
@@ -82,6 +86,9 @@ class PredictorEvaluationExecution(Resource['PredictorEvaluationExecution'], Asy
         """
         params = {"evaluator_name": evaluator_name}
         resource = self._session.get_resource(self._path() + "/results", params=params)
+        if lazy:
+            with properties.lazy_deserialization():
+                return PredictorEvaluationResult.build(resource)
         return PredictorEvaluationResult.build(resource)
 
     def __getitem__(self, item):
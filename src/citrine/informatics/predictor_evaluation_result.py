@@ -1,6 +1,7 @@
 from typing import Type, Set
 
 from citrine._serialization import properties
+from citrine._utils import columns
 from citrine._serialization.polymorphic_serializable import PolymorphicSerializable
 from citrine._serialization.serializable import Serializable
 from citrine.informatics.predictor_evaluation_metrics import PredictorEvaluationMetric
@@ -21,6 +22,8 @@ __all__ = ['MetricValue',
 class MetricValue(PolymorphicSerializable["MetricValue"]):
     """Value associated with a metric computed during a Predictor Evaluation Workflow."""
 
+    __slots__ = ()
+
     def __init__(self):
         """These are results, so they should be built rather than constructed."""
         pass  # pragma: no cover
@@ -38,6 +41,8 @@ class MetricValue(PolymorphicSerializable["MetricValue"]):
 class RealMetricValue(Serializable["RealMetricValue"], MetricValue):
     """Mean and standard error computed for a real-valued metric."""
 
+    __slots__ = properties.slots('mean', 'standard_error', 'typ')
+
     mean = properties.Float("mean")
     """:float: Mean value"""
     standard_error = properties.Optional(properties.Float(), "standard_error")
@@ -54,6 +59,8 @@ class RealMetricValue(Serializable["RealMetricValue"], MetricValue):
 class PredictedVsActualRealPoint(Serializable["PredictedVsActualRealPoint"]):
     """Predicted vs. actual data for a single real-valued data point."""
 
+    __slots__ = properties.slots('uuid', 'identifiers', 'trial', 'fold', 'predicted', 'actual')
+
     uuid = properties.UUID("uuid")
     """:UUID: Unique Citrine id given to the candidate"""
     identifiers = properties.Set(properties.String, "identifiers")
@@ -74,6 +81,8 @@ class PredictedVsActualRealPoint(Serializable["PredictedVsActualRealPoint"]):
 class PredictedVsActualCategoricalPoint(Serializable["PredictedVsActualCategoricalPoint"]):
     """Predicted vs. actual data for a single categorical data point."""
 
+    __slots__ = properties.slots('uuid', 'identifiers', 'trial', 'fold', 'predicted', 'actual')
+
     uuid = properties.UUID("uuid")
     """:UUID: Unique Citrine id given to the candidate"""
     identifiers = properties.Set(properties.String, "identifiers")
@@ -108,6 +117,36 @@ class CategoricalPredictedVsActual(Serializable["CategoricalPredictedVsActual"],
     def __getitem__(self, item: int):
         return self.value[item]
 
+    def to_arrays(self) -> columns.ColumnArrays:
+        """
+        Put the predicted vs. actual data into NumPy arrays, one per column.
+
+        Requires numpy. If the result was built lazily and the points haven't been read,
+        the columns are filled straight from the raw data without building the points.
+        The columns are
+
+        * ``uuid``, ``trial`` and ``fold`` of each point
+        * ``predicted.<class>`` and ``actual.<class>`` with the probability of each class,
+          which is zero where a class is missing from a point
+
+        Returns
+        -------
+        Dict[str, numpy.ndarray]
+            The columns, by name
+
+        """
+        raw = properties.deferred_data(self, 'value')
+        points = raw if raw is not None else (point.dump() for point in self.value)
+        return columns.categorical_pva_columns(points)
+
+    def to_frame(self):
+        """
+        Put the predicted vs. actual data into a pandas DataFrame.
+
+        Requires numpy and pandas. The columns are those of :meth:`to_arrays`.
+        """
+        return columns.to_frame(self.to_arrays())
+
 
 class RealPredictedVsActual(Serializable["RealPredictedVsActual"], MetricValue):
     """List of predicted vs. actual data points for a real value."""
@@ -124,6 +163,36 @@ class RealPredictedVsActual(Serializable["RealPredictedVsActual"], MetricValue):
     def __getitem__(self, item: int):
         return self.value[item]
 
+    def to_arrays(self) -> columns.ColumnArrays:
+        """
+        Put the predicted vs. actual data into NumPy arrays, one per column.
+
+        Requires numpy. If the result was built lazily and the points haven't been read,
+        the columns are filled straight from the raw data without building the points.
+        The columns are
+
+        * ``uuid``, ``trial`` and ``fold`` of each point
+        * ``predicted.mean``, ``predicted.standard_error``, ``actual.mean`` and
+          ``actual.standard_error``, with NaN for a missing standard error
+
+        Returns
+        -------
+        Dict[str, numpy.ndarray]
+            The columns, by name
+
+        """
+        raw = properties.deferred_data(self, 'value')
+        points = raw if raw is not None else (point.dump() for point in self.value)
+        return columns.real_pva_columns(points)
+
+    def to_frame(self):
+        """
+        Put the predicted vs. actual data into a pandas DataFrame.
+
+        Requires numpy and pandas. The columns are those of :meth:`to_arrays`.
+        """
+        return columns.to_frame(self.to_arrays())
+
 
 class ResponseMetrics(Serializable["ResponseMetrics"]):
     """Set of metrics computed by a Predictor Evaluator for a single response.
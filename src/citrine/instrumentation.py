@@ -0,0 +1,248 @@
+"""Structured events describing the requests made by a session, and tools to aggregate them."""
+import math
+import re
+from threading import Lock
+from typing import Optional, Dict, Tuple
+
+_ID_SEGMENT = re.compile(
+    r'(?<=/)('
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+    r'|[0-9]+'
+    r')(?=/|$)'
+)
+
+
+def route_template(path: str) -> str:
+    """
+    Reduce a request path to its logical route by replacing ids with a placeholder.
+
+    Uuids and purely numeric path segments become ``{id}``, so that requests for different
+    resources of the same kind are grouped together, e.g.
+    ``projects/{id}/datasets/{id}/material-runs``.
+    """
+    return _ID_SEGMENT.sub('{id}', '/' + path.lstrip('/'))[1:]
+
+
+class RequestEvent:
+    """
+    A completed request made through :func:`~citrine._session.Session.checked_request`.
+
+    Parameters
+    ----------
+    method: str
+        HTTP method of the request
+    path: str
+        Path of the request, relative to the versioned base url
+    route: str
+        Logical route of the request, with ids replaced by placeholders
+    version: str
+        API version of the request
+    status_code: int
+        Status code of the final response
+    elapsed: float
+        Wall-clock time of the request in seconds, including any retries
+    bytes_sent: int
+        Size of the final request body
+    bytes_received: int
+        Size of the final response body
+    retries: int
+        Number of times the request was re-sent, whether by the urllib3 retry policy, after
+        a connection error, or after refreshing an invalid access token
+
+    """
+
+    def __init__(self, *, method: str, path: str, route: str, version: str,
+                 status_code: int, elapsed: float, bytes_sent: int, bytes_received: int,
+                 retries: int):
+        self.method = method
+        self.path = path
+        self.route = route
+        self.version = version
+        self.status_code = status_code
+        self.elapsed = elapsed
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.retries = retries
+
+    def __repr__(self):
+        return '<RequestEvent {} {} {} {:.3f}s>'.format(
+            self.method, self.route, self.status_code, self.elapsed)
+
+
+class BatchSizeEvent:
+    """
+    A change to the number of objects of one type that are written in each batch.
+
+    Published by :func:`~citrine.resources.gemd_resource.GEMDResourceCollection.register_all`
+    as it adapts its batches to the size of the objects and the time it takes to write them.
+
+    Parameters
+    ----------
+    object_type: str
+        Type of the objects in the batch, e.g. ``material_run``
+    previous: int
+        Largest number of objects in a batch before the change
+    size: int
+        Largest number of objects in a batch after the change
+    reason: str
+        Why the size changed: ``fast`` or ``slow`` if the batch took much less or more than
+        the target time to write, ``bytes`` if batches of the previous size would be larger
+        than the byte limit, and ``too_large`` or ``timeout`` if the batch was rejected by the
+        server or timed out and is being retried in smaller batches
+    count: int
+        Number of objects in the batch that prompted the change
+    bytes_sent: int
+        Size of the serialized objects in that batch
+    elapsed: float
+        Wall-clock time spent writing that batch in seconds, including a failed attempt
+
+    """
+
+    def __init__(self, *, object_type: str, previous: int, size: int, reason: str,
+                 count: int, bytes_sent: int, elapsed: float):
+        self.object_type = object_type
+        self.previous = previous
+        self.size = size
+        self.reason = reason
+        self.count = count
+        self.bytes_sent = bytes_sent
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return '<BatchSizeEvent {} {} -> {} ({})>'.format(
+            self.object_type, self.previous, self.size, self.reason)
+
+
+class LatencyHistogram:
+    """
+    A fixed-precision histogram of latencies.
+
+    Values are counted in logarithmically sized buckets, so memory does not grow with the
+    number of observations and quantiles are accurate to within the relative `precision`.
+
+    Parameters
+    ----------
+    precision: float
+        Maximum relative error of reported quantiles. Default is 1%.
+
+    """
+
+    def __init__(self, precision: float = 0.01):
+        self._log_base = math.log1p(2 * precision)
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Add an observation, in seconds."""
+        # Values below a microsecond all fall in the lowest bucket
+        index = math.floor(math.log(max(value, 1e-6)) / self._log_base)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the approximate `q`-quantile of the observations, or None if there are none."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                # Report the geometric midpoint of the bucket, capped by the largest value seen
+                return min(math.exp((index + 0.5) * self._log_base), self.max)
+        return self.max  # pragma: no cover
+
+
+class RouteStats:
+    """Aggregated statistics for the requests made to one route."""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.errors = 0
+
+    @property
+    def count(self) -> int:
+        """Number of requests made."""
+        return self.latency.count
+
+    @property
+    def total_time(self) -> float:
+        """Total wall-clock time of all requests, in seconds."""
+        return self.latency.total
+
+    def record(self, event: RequestEvent) -> None:
+        """Add a request to the statistics."""
+        self.latency.record(event.elapsed)
+        self.bytes_sent += event.bytes_sent
+        self.bytes_received += event.bytes_received
+        self.retries += event.retries
+        if not 200 <= event.status_code <= 299:
+            self.errors += 1
+
+    def as_dict(self) -> dict:
+        """Summarize the statistics as a dictionary."""
+        return {
+            'count': self.count,
+            'total_time': self.total_time,
+            'p50': self.latency.quantile(0.50),
+            'p95': self.latency.quantile(0.95),
+            'p99': self.latency.quantile(0.99),
+            'max': self.latency.max,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'retries': self.retries,
+            'errors': self.errors,
+        }
+
+
+class RequestMetrics:
+    """
+    An in-memory subscriber that aggregates request events per route.
+
+    Subscribe an instance to a session and read the statistics at any time. It is safe to
+    share one instance between threads.
+
+    .. code-block:: python
+
+        metrics = RequestMetrics()
+        citrine.session.subscribe(metrics)
+        ...  # make some calls
+        for (method, route), stats in metrics.slowest():
+            print(method, route, stats['count'], stats['p95'])
+
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._routes: Dict[Tuple[str, str], RouteStats] = {}
+
+    def __call__(self, event) -> None:
+        """Record an event. Events other than :class:`RequestEvent` are ignored."""
+        if not isinstance(event, RequestEvent):
+            return
+        with self._lock:
+            key = (event.method, event.route)
+            if key not in self._routes:
+                self._routes[key] = RouteStats()
+            self._routes[key].record(event)
+
+    def summary(self) -> Dict[Tuple[str, str], dict]:
+        """Return the statistics for each (method, route) pair."""
+        with self._lock:
+            return {key: stats.as_dict() for key, stats in self._routes.items()}
+
+    def slowest(self) -> list:
+        """Return (method, route) pairs and their statistics, by descending total time."""
+        return sorted(self.summary().items(), key=lambda item: -item[1]['total_time'])
+
+    def reset(self) -> None:
+        """Discard all statistics collected so far."""
+        with self._lock:
+            self._routes = {}
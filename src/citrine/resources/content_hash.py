@@ -0,0 +1,163 @@
+"""Detect data concepts objects that have not changed since they were last written."""
+import hashlib
+import json
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional, Union
+from uuid import UUID
+
+from gemd.entity.link_by_uid import LinkByUID
+
+from citrine.__version__ import __version__
+
+# Fields that describe where and when an object was written, not what it is
+_CLIENT_FIELDS = ('audit_info', 'dataset')
+
+
+def content_hash(payload: dict) -> str:
+    """
+    A hash of the content of a serialized object, which is the same for equal content.
+
+    Keys are sorted and the audit information and dataset of the object are left out, so two
+    payloads of the same object have the same hash whether or not it has been read back from
+    the platform.
+    """
+    body = {key: value for key, value in payload.items() if key not in _CLIENT_FIELDS}
+    text = json.dumps(body, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ContentHashCache:
+    """
+    A local record of the content of the objects that have been written, by uid.
+
+    Pass one to ``register`` or ``register_all`` and objects whose content has not changed
+    since it was last written through the cache are not sent again. Objects are recognized by
+    any of the uids they were written with or given by the platform, so objects that are built
+    again with the same uids in a custom scope are recognized too. Links to other objects are
+    compared by the object they point to rather than by the uid they use, since a link uses the
+    Citrine id once the linked object has one. Objects without uids are always sent. The hashes
+    are kept in a JSON file, which is rewritten by :func:`save`, or on leaving a ``with`` block.
+
+    The hashes are only valid for the version of citrine-python that recorded them and for
+    the version of the platform given as `server_version`. If either differs from the one the
+    file was written with, the file is ignored and every object is sent again.
+
+    .. code-block:: python
+
+        with ContentHashCache('hashes.json', server_version='2024.06') as cache:
+            dataset.register_all(models, cache=cache)
+
+    Parameters
+    ----------
+    path: Union[str, Path]
+        Location of the file of hashes. It is created if it does not exist.
+    server_version: Optional[str]
+        Version of the platform that objects are written to, if known. Objects written to a
+        different version are considered changed, since the platform may store them
+        differently.
+
+    """
+
+    def __init__(self, path: Union[str, Path], *, server_version: Optional[str] = None):
+        self.path = Path(path)
+        self.version = {'client': __version__, 'server': server_version}
+        self._lock = Lock()
+        self._hashes: Dict[str, str] = {}
+        # The key of each object, by every uid it is known by
+        self._aliases: Dict[str, str] = {}
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.version:
+                self._hashes = data['hashes']
+                self._aliases = data.get('aliases', {})
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def changed(self, dataset_id: UUID, payload: dict) -> bool:
+        """Whether a serialized object is new, or differs from when it was last written."""
+        key = self._key(dataset_id, payload)
+        return key is None or self._hashes.get(key) != self._hash(dataset_id, payload)
+
+    def record(self, dataset_id: UUID, payload: dict, *, uids: Optional[dict] = None) -> None:
+        """
+        Record that a serialized object has been written.
+
+        Parameters
+        ----------
+        dataset_id: UUID
+            The dataset the object was written to
+        payload: dict
+            The object as it was sent
+        uids: Optional[dict]
+            The uids of the object as it was written, including the Citrine id the platform
+            gave it, so that links that use them are recognized
+
+        """
+        key = self._key(dataset_id, payload)
+        if key is not None:
+            digest = self._hash(dataset_id, payload)
+            with self._lock:
+                self._hashes[key] = digest
+                for scope, uid in {**payload['uids'], **(uids or {})}.items():
+                    self._aliases[_alias(dataset_id, scope, uid)] = key
+
+    def clear(self) -> None:
+        """Forget every hash, so that every object is sent again."""
+        with self._lock:
+            self._hashes = {}
+            self._aliases = {}
+
+    def save(self) -> None:
+        """Write the hashes to the file, replacing it only once they are all written."""
+        with self._lock:
+            data = {'version': self.version, 'hashes': dict(self._hashes),
+                    'aliases': dict(self._aliases)}
+        partial = self.path.with_name(self.path.name + '.partial')
+        with open(partial, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(partial, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.save()
+
+    def _key(self, dataset_id: UUID, payload: dict) -> Optional[str]:
+        from citrine.resources.data_concepts import CITRINE_SCOPE
+        uids = payload.get('uids')
+        if not uids:
+            return None
+        for scope, uid in uids.items():
+            key = self._aliases.get(_alias(dataset_id, scope, uid))
+            if key is not None:
+                return key
+        if CITRINE_SCOPE in uids:
+            return '{}/{}'.format(dataset_id, uids[CITRINE_SCOPE])
+        return '{}/{}'.format(dataset_id, json.dumps(sorted(uids.items())))
+
+    def _hash(self, dataset_id: UUID, payload: dict) -> str:
+        """Hash a payload with each link replaced by the key of the object it points to."""
+        from citrine.resources.data_concepts import CITRINE_SCOPE
+
+        def canonical(value):
+            if isinstance(value, dict):
+                if value.get('type') == LinkByUID.typ:
+                    alias = _alias(dataset_id, value['scope'], value['id'])
+                    return {'link': self._aliases.get(alias, alias)}
+                return {key: canonical(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return [canonical(item) for item in value]
+            return value
+
+        # The Citrine id is given by the platform, so gaining one does not change an object
+        uids = {scope: uid for scope, uid in payload['uids'].items() if scope != CITRINE_SCOPE}
+        return content_hash(canonical(dict(payload, uids=uids)))
+
+
+def _alias(dataset_id: UUID, scope: str, uid: str) -> str:
+    return '{}/{}/{}'.format(dataset_id, scope.lower(), uid)
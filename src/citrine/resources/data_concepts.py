@@ -1,26 +1,28 @@
 """Top-level class for all data concepts objects and collections thereof."""
 from abc import abstractmethod, ABC
 from warnings import warn
-from typing import TypeVar, Type, List, Union, Optional, Iterator
+from typing import TypeVar, Type, List, Union, Optional, Iterator, Callable, Dict
 from uuid import UUID, uuid4
 import deprecation
 
 from gemd.entity.dict_serializable import DictSerializable
 from gemd.entity.base_entity import BaseEntity
 from gemd.entity.link_by_uid import LinkByUID
-from gemd.json import GEMDJson
-from gemd.util import recursive_foreach
+from gemd.enumeration.base_enumeration import BaseEnumeration
 
 from citrine._rest.collection import Collection
 from citrine._serialization import properties
+from citrine._serialization.gemd_builder import GEMDBuilder, construct, is_generic_from_dict
+from citrine._serialization.payload import PayloadWriter
 from citrine._serialization.polymorphic_serializable import PolymorphicSerializable
 from citrine._serialization.properties import Property as SerializableProperty
 from citrine._serialization.serializable import Serializable
 from citrine._session import Session
-from citrine._utils.functions import scrub_none, replace_objects_with_links, \
-    format_escaped_url
+from citrine._utils.cursor import CursorIterator, PathType
+from citrine._utils.functions import format_escaped_url
 from citrine.exceptions import BadRequest
 from citrine.resources.audit_info import AuditInfo
+from citrine.resources.content_hash import ContentHashCache
 from citrine.jobs.job import _poll_for_job_completion
 from citrine.resources.response import Response
 
@@ -116,7 +118,11 @@ class DataConcepts(PolymorphicSerializable['DataConcepts'], DictSerializable, AB
 
         """
         popped = {k: d.pop(k, None) for k in cls.client_specific_fields}
-        obj = super().from_dict(d)
+        gemd_from_dict = super().from_dict
+        if is_generic_from_dict(gemd_from_dict):
+            obj = construct(cls, d)
+        else:
+            obj = gemd_from_dict(d)
 
         for field, clazz in cls.client_specific_fields.items():
             value = popped[field]
@@ -150,7 +156,8 @@ class DataConcepts(PolymorphicSerializable['DataConcepts'], DictSerializable, AB
             the loads/dumps cycle of the GMED
             :py:mod:`JSON encoder <gemd.json>`. The ensuing dictionary must
             have a `type` field that corresponds to the response key of this class or of
-            :py:class:`LinkByUID <gemd.entity.link_by_uid.LinkByUID>`.
+            :py:class:`LinkByUID <gemd.entity.link_by_uid.LinkByUID>`. Dictionaries of plain
+            json values, as returned by the API, are built directly without that cycle.
 
         Returns
         -------
@@ -158,7 +165,7 @@ class DataConcepts(PolymorphicSerializable['DataConcepts'], DictSerializable, AB
             An object corresponding to a data concepts resource.
 
         """
-        return cls.get_json_support().copy(data)
+        return cls.get_json_support().build(data)
 
     @classmethod
     def get_type(cls, data) -> Type[Serializable]:
@@ -272,7 +279,7 @@ class DataConcepts(PolymorphicSerializable['DataConcepts'], DictSerializable, AB
         """Get a DataConcepts-compatible json serializer/deserializer."""
         if cls.json_support is None:
             DataConcepts._make_class_dict()
-            cls.json_support = GEMDJson(scope=CITRINE_SCOPE)
+            cls.json_support = GEMDBuilder(scope=CITRINE_SCOPE)
             cls.json_support.register_classes(
                 {k: v for k, v in DataConcepts.class_dict.items() if k != "link_by_uid"}
             )
@@ -306,6 +313,97 @@ def _make_link_by_uid(gemd_object_rep: Union[str, UUID, BaseEntity, LinkByUID],
 ResourceType = TypeVar('ResourceType', bound='DataConcepts')
 
 
+class ListMode(BaseEnumeration):
+    """How the objects returned by a listing are deserialized.
+
+    * FULL builds every object in full as it is yielded
+    * LAZY yields a :class:`LazyDataConcepts` view of each object, which reads a few
+      identifying fields straight from the response and builds the object on first use
+    * RAW yields each object as the dictionary returned by the platform
+    """
+
+    FULL = 'full'
+    LAZY = 'lazy'
+    RAW = 'raw'
+
+
+class LazyDataConcepts:
+    """
+    A lightweight view of a serialized data concepts object that is built on first use.
+
+    The type, uids, name, tags and dataset are read straight from the serialized form. Any
+    other attribute builds the full object and is read from it; the built object is kept,
+    so the cost of building is paid at most once.
+
+    Parameters
+    ----------
+    data: dict
+        The serialized object, as returned by the platform
+    builder: Callable[[dict], DataConcepts]
+        Builds the full object from `data`
+
+    """
+
+    __slots__ = ('_data', '_builder', '_built')
+
+    def __init__(self, data: dict, builder: Callable[[dict], DataConcepts]):
+        self._data = data
+        self._builder = builder
+        self._built = None
+
+    @property
+    def raw(self) -> dict:
+        """The serialized object."""
+        return self._data
+
+    @property
+    def typ(self) -> str:
+        """The type of the object."""
+        return self._data.get('type')
+
+    @property
+    def uids(self) -> Dict[str, str]:
+        """A copy of the unique identifiers of the object."""
+        return dict(self._data.get('uids') or {})
+
+    @property
+    def uid(self) -> Optional[str]:
+        """The Citrine Identifier (scope = "id"), or None if not registered."""
+        return (self._data.get('uids') or {}).get(CITRINE_SCOPE)
+
+    @property
+    def name(self) -> Optional[str]:
+        """The name of the object."""
+        return self._data.get('name')
+
+    @property
+    def tags(self) -> List[str]:
+        """A copy of the tags of the object."""
+        return list(self._data.get('tags') or [])
+
+    @property
+    def dataset(self) -> Optional[UUID]:
+        """The dataset of this object, if it was returned by the backend."""
+        dataset = self._data.get('dataset')
+        return None if dataset is None else UUID(str(dataset))
+
+    def build(self) -> DataConcepts:
+        """Build the full object, or return it if it has already been built."""
+        if self._built is None:
+            self._built = self._builder(self._data)
+        return self._built
+
+    def __getattr__(self, name):
+        # Only called for attributes not defined above; don't build for special methods,
+        # which copy and pickle probe for
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.build(), name)
+
+    def __repr__(self):
+        return '<LazyDataConcepts {} {!r}>'.format(self.typ, self.name)
+
+
 class DataConceptsCollection(Collection[ResourceType], ABC):
     """
     A collection of one kind of data concepts object.
@@ -354,10 +452,24 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
         data_concepts_object = self.get_type().build(data)
         return data_concepts_object
 
+    def _build_listing(self, raw_objects: CursorIterator[dict],
+                       mode: Union[ListMode, str]) -> CursorIterator:
+        """Deserialize the results of a listing as requested by `mode`."""
+        mode = ListMode.get_enum(mode)
+        if mode == ListMode.RAW:
+            return raw_objects
+        elif mode == ListMode.LAZY:
+            return raw_objects.map(lambda raw: LazyDataConcepts(raw, self.build))
+        return raw_objects.map(self.build)
+
     def list(self, *,
              page: Optional[int] = None,
              per_page: Optional[int] = 100,
-             forward: bool = True) -> Iterator[ResourceType]:
+             forward: bool = True,
+             prefetch: int = 0,
+             cursor: Optional[str] = None,
+             checkpoint: Optional[PathType] = None,
+             mode: Union[ListMode, str] = ListMode.FULL) -> CursorIterator[ResourceType]:
         """
         Get all visible elements of the collection.
 
@@ -375,10 +487,30 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             or experiencing latency from large payload sizes.
         forward: bool
             Set to False to reverse the order of results (i.e., return in descending order)
+        prefetch: int
+            Number of pages to fetch ahead of the page being consumed, on a background
+            thread. This overlaps the round-trip for the next page with processing of the
+            current one, at the cost of holding up to `prefetch` extra pages in memory.
+            Default is 0, which fetches each page only when it is needed.
+        cursor: str, optional
+            Cursor to start from, as read from the ``cursor`` attribute of the iterator
+            returned by an earlier, interrupted listing with the same arguments. Default is
+            to start at the beginning.
+        checkpoint: str or os.PathLike, optional
+            File in which to save the cursor as the listing progresses. If the file exists,
+            the listing resumes from the cursor saved in it, and it is deleted once the
+            listing completes. Results of the page being consumed when a listing was
+            interrupted are yielded again when it resumes.
+        mode: ListMode or str, optional
+            How to deserialize the objects returned. Default is ListMode.FULL, which builds
+            every object. ListMode.LAZY yields a :class:`LazyDataConcepts` view that only
+            builds the object when an attribute other than its type, uids, name, tags or
+            dataset is read. ListMode.RAW yields the dictionaries returned by the platform.
+            The lighter modes save considerable CPU when scanning for names or uids.
 
         Returns
         -------
-        Iterator[ResourceType]
+        CursorIterator[ResourceType]
             Every object in this collection.
 
         """
@@ -390,10 +522,17 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             self._get_path(ignore_dataset=True),
             forward=forward,
             per_page=per_page,
+            prefetch=prefetch,
+            cursor=cursor,
+            checkpoint=checkpoint,
             params=params)
-        return (self.build(raw) for raw in raw_objects)
+        return self._build_listing(raw_objects, mode)
 
-    def register(self, model: ResourceType, *, dry_run=False):
+    def register(self,
+                 model: ResourceType,
+                 *,
+                 dry_run=False,
+                 cache: Optional[ContentHashCache] = None):
         """
         Create a new element of the collection or update an existing element.
 
@@ -415,6 +554,10 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
         dry_run: bool
             Whether to actually register the item or run a dry run of the register operation.
             Dry run is intended to be used for validation. Default: false
+        cache: Optional[ContentHashCache]
+            A record of the objects written before. If `model` has not changed since it was
+            last written through it, it is not sent, and is returned as given. Not used by a
+            dry run. Default is no cache.
 
         Returns
         -------
@@ -427,16 +570,24 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
         path = self._get_path()
         params = {'dry_run': dry_run}
 
-        temp_scope = str(uuid4())
-        scope = temp_scope if dry_run else CITRINE_SCOPE
-        GEMDJson(scope=scope).dumps(model)  # This apparent no-op populates uids
-        dumped_data = replace_objects_with_links(scrub_none(model.dump()))
-        recursive_foreach(model, lambda x: x.uids.pop(temp_scope, None))  # Strip temp uids
+        writer = PayloadWriter(scope=str(uuid4()) if dry_run else CITRINE_SCOPE)
+        dumped_data = writer.dump(model)
+        if dry_run:
+            writer.remove_assigned_uids()
+        elif cache is not None and not cache.changed(self.dataset_id, dumped_data):
+            return model
 
         data = self.session.post_resource(path, dumped_data, params=params)
-        return self.build(data)
-
-    def register_all(self, models: List[ResourceType], *, dry_run=False) -> List[ResourceType]:
+        registered = self.build(data)
+        if cache is not None and not dry_run:
+            cache.record(self.dataset_id, dumped_data, uids=registered.uids)
+        return registered
+
+    def register_all(self,
+                     models: List[ResourceType],
+                     *,
+                     dry_run=False,
+                     cache: Optional[ContentHashCache] = None) -> List[ResourceType]:
         """
         [ALPHA] Create or update each model in models.
 
@@ -453,6 +604,10 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
         dry_run: bool
             Whether to actually register the objects or run a dry run of the register operation.
             Dry run is intended to be used for validation. Default: false
+        cache: Optional[ContentHashCache]
+            A record of the objects written before. Models that have not changed since they
+            were last written through it are not sent, and are returned as given. Not used by
+            a dry run. Default is no cache.
 
         Returns
         -------
@@ -461,24 +616,36 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             is guaranteed to be the same as originally specified.
 
         """
+        objects = self._dump_batch(models, dry_run=dry_run)
+        if cache is None or dry_run:
+            return self._put_batch(objects, dry_run=dry_run)
+
+        registered = list(models)
+        send = [i for i, obj in enumerate(objects) if cache.changed(self.dataset_id, obj)]
+        if send:
+            written = self._put_batch([objects[i] for i in send], dry_run=dry_run)
+            for i, postwrite in zip(send, written):
+                registered[i] = postwrite
+                cache.record(self.dataset_id, objects[i], uids=postwrite.uids)
+        return registered
+
+    def _dump_batch(self, models: List[ResourceType], *, dry_run: bool) -> List[dict]:
+        """Serialize models to be written together, with the objects they point to as links."""
         if self.dataset_id is None:
             raise RuntimeError("Must specify a dataset in order to register a data model object.")
-        path = self._get_path()
-        params = {'dry_run': dry_run}
-
-        temp_scope = str(uuid4())
-        scope = temp_scope if dry_run else CITRINE_SCOPE
-        json = GEMDJson(scope=scope)
-        [json.dumps(x) for x in models]  # This apparent no-op populates uids
-
-        objects = [replace_objects_with_links(scrub_none(model.dump())) for model in models]
-
-        recursive_foreach(models, lambda x: x.uids.pop(temp_scope, None))  # Strip temp uids
-
+        # Objects without uids are given one as they are reached, so that they can be linked
+        writer = PayloadWriter(scope=str(uuid4()) if dry_run else CITRINE_SCOPE)
+        objects = [writer.dump(model) for model in models]
+        if dry_run:
+            writer.remove_assigned_uids()
+        return objects
+
+    def _put_batch(self, objects: List[dict], *, dry_run: bool) -> List[ResourceType]:
+        """Write serialized models in a single request."""
         response_data = self.session.put_resource(
-            path + '/batch',
+            self._get_path() + '/batch',
             json={'objects': objects},
-            params=params
+            params={'dry_run': dry_run}
         )
         return [self.build(obj) for obj in response_data['objects']]
 
@@ -540,10 +707,9 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             method.
 
         """
-        temp_scope = str(uuid4())
-        GEMDJson(scope=temp_scope).dumps(model)  # This apparent no-op populates uids
-        dumped_data = replace_objects_with_links(scrub_none(model.dump()))
-        recursive_foreach(model, lambda x: x.uids.pop(temp_scope, None))  # Strip temp uids
+        writer = PayloadWriter(scope=str(uuid4()))
+        dumped_data = writer.dump(model)
+        writer.remove_assigned_uids()
 
         scope = CITRINE_SCOPE
         id = dumped_data['uids'][scope]
@@ -634,7 +800,11 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
         return self.build(data)
 
     def list_by_name(self, name: str, *, exact: bool = False,
-                     forward: bool = True, per_page: int = 100) -> Iterator[ResourceType]:
+                     forward: bool = True, per_page: int = 100,
+                     prefetch: int = 0,
+                     cursor: Optional[str] = None,
+                     checkpoint: Optional[PathType] = None,
+                     mode: Union[ListMode, str] = ListMode.FULL) -> CursorIterator[ResourceType]:
         """
         Get all objects with specified name in this dataset.
 
@@ -651,10 +821,30 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             Controls the number of results fetched with each http request to the backend.
             Typically, this is set to a sensible default and should not be modified. Consider
             modifying this value only if you find this method is unacceptably latent.
+        prefetch: int
+            Number of pages to fetch ahead of the page being consumed, on a background
+            thread. This overlaps the round-trip for the next page with processing of the
+            current one, at the cost of holding up to `prefetch` extra pages in memory.
+            Default is 0, which fetches each page only when it is needed.
+        cursor: str, optional
+            Cursor to start from, as read from the ``cursor`` attribute of the iterator
+            returned by an earlier, interrupted listing with the same arguments. Default is
+            to start at the beginning.
+        checkpoint: str or os.PathLike, optional
+            File in which to save the cursor as the listing progresses. If the file exists,
+            the listing resumes from the cursor saved in it, and it is deleted once the
+            listing completes. Results of the page being consumed when a listing was
+            interrupted are yielded again when it resumes.
+        mode: ListMode or str, optional
+            How to deserialize the objects returned. Default is ListMode.FULL, which builds
+            every object. ListMode.LAZY yields a :class:`LazyDataConcepts` view that only
+            builds the object when an attribute other than its type, uids, name, tags or
+            dataset is read. ListMode.RAW yields the dictionaries returned by the platform.
+            The lighter modes save considerable CPU when scanning for names or uids.
 
         Returns
         -------
-        Iterator[ResourceType]
+        CursorIterator[ResourceType]
             List of every object in this collection whose `name` matches the search term.
 
         """
@@ -667,8 +857,11 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             self._get_path(ignore_dataset=True) + "/filter-by-name",
             forward=forward,
             per_page=per_page,
+            prefetch=prefetch,
+            cursor=cursor,
+            checkpoint=checkpoint,
             params=params)
-        return (self.build(raw) for raw in raw_objects)
+        return self._build_listing(raw_objects, mode)
 
     @deprecation.deprecated(deprecated_in="0.133.0", removed_in="1.0.0",
                             details="Please use list instead of list_all")
@@ -696,7 +889,11 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
         """
         return self.list(forward=forward, per_page=per_page)  # pragma: no cover
 
-    def list_by_tag(self, tag: str, *, per_page: int = 100) -> Iterator[ResourceType]:
+    def list_by_tag(self, tag: str, *, per_page: int = 100,
+                    prefetch: int = 0,
+                    cursor: Optional[str] = None,
+                    checkpoint: Optional[PathType] = None,
+                    mode: Union[ListMode, str] = ListMode.FULL) -> CursorIterator[ResourceType]:
         """
         Get all objects bearing a tag prefixed with `tag` in the collection.
 
@@ -715,10 +912,30 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             Controls the number of results fetched with each http request to the backend.
             Typically, this is set to a sensible default and should not be modified. Consider
             modifying this value only if you find this method is unacceptably latent.
+        prefetch: int
+            Number of pages to fetch ahead of the page being consumed, on a background
+            thread. This overlaps the round-trip for the next page with processing of the
+            current one, at the cost of holding up to `prefetch` extra pages in memory.
+            Default is 0, which fetches each page only when it is needed.
+        cursor: str, optional
+            Cursor to start from, as read from the ``cursor`` attribute of the iterator
+            returned by an earlier, interrupted listing with the same arguments. Default is
+            to start at the beginning.
+        checkpoint: str or os.PathLike, optional
+            File in which to save the cursor as the listing progresses. If the file exists,
+            the listing resumes from the cursor saved in it, and it is deleted once the
+            listing completes. Results of the page being consumed when a listing was
+            interrupted are yielded again when it resumes.
+        mode: ListMode or str, optional
+            How to deserialize the objects returned. Default is ListMode.FULL, which builds
+            every object. ListMode.LAZY yields a :class:`LazyDataConcepts` view that only
+            builds the object when an attribute other than its type, uids, name, tags or
+            dataset is read. ListMode.RAW yields the dictionaries returned by the platform.
+            The lighter modes save considerable CPU when scanning for names or uids.
 
         Returns
         -------
-        Iterator[ResourceType]
+        CursorIterator[ResourceType]
             Every object in this collection.
 
         """
@@ -729,8 +946,11 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             self.session.get_resource,
             self._get_path(ignore_dataset=True),
             per_page=per_page,
+            prefetch=prefetch,
+            cursor=cursor,
+            checkpoint=checkpoint,
             params=params)
-        return (self.build(raw) for raw in raw_objects)
+        return self._build_listing(raw_objects, mode)
 
     def delete(self, uid: Union[UUID, str, LinkByUID, BaseEntity], *,
                scope: Optional[str] = None, dry_run: bool = False):
@@ -1,16 +1,15 @@
 """Top-level class for all data object (i.e., spec and run) objects and collections thereof."""
 from abc import ABC
-from typing import Dict, Union, Optional, Iterator, List, TypeVar
+from typing import Dict, Union, Optional, List, TypeVar
 from uuid import uuid4
 from deprecation import deprecated
 
-from gemd.json import GEMDJson
-from gemd.util import recursive_foreach
-
+from citrine._serialization.payload import PayloadWriter
+from citrine._utils.cursor import CursorIterator, PathType
 from citrine._utils.functions import get_object_id, replace_objects_with_links, scrub_none
 from citrine.exceptions import BadRequest
 from citrine.resources.api_error import ValidationError
-from citrine.resources.data_concepts import DataConcepts, DataConceptsCollection
+from citrine.resources.data_concepts import DataConcepts, DataConceptsCollection, ListMode
 from citrine.resources.object_templates import ObjectTemplateResourceType
 from citrine.resources.process_template import ProcessTemplate
 from gemd.entity.bounds.base_bounds import BaseBounds
@@ -85,7 +84,11 @@ class DataObjectCollection(DataConceptsCollection[DataObjectResourceType], ABC):
     def list_by_attribute_bounds(
             self,
             attribute_bounds: Dict[Union[AttributeTemplate, LinkByUID], BaseBounds], *,
-            forward: bool = True, per_page: int = 100) -> Iterator[DataObject]:
+            forward: bool = True, per_page: int = 100,
+            prefetch: int = 0,
+            cursor: Optional[str] = None,
+            checkpoint: Optional[PathType] = None,
+            mode: Union[ListMode, str] = ListMode.FULL) -> CursorIterator[DataObject]:
         """
         Get all objects in the collection with attributes within certain bounds.
 
@@ -113,10 +116,30 @@ class DataObjectCollection(DataConceptsCollection[DataObjectResourceType], ABC):
             Controls the number of results fetched with each http request to the backend.
             Typically, this is set to a sensible default and should not be modified. Consider
             modifying this value only if you find this method is unacceptably latent.
+        prefetch: int
+            Number of pages to fetch ahead of the page being consumed, on a background
+            thread. This overlaps the round-trip for the next page with processing of the
+            current one, at the cost of holding up to `prefetch` extra pages in memory.
+            Default is 0, which fetches each page only when it is needed.
+        cursor: str, optional
+            Cursor to start from, as read from the ``cursor`` attribute of the iterator
+            returned by an earlier, interrupted listing with the same arguments. Default is
+            to start at the beginning.
+        checkpoint: str or os.PathLike, optional
+            File in which to save the cursor as the listing progresses. If the file exists,
+            the listing resumes from the cursor saved in it, and it is deleted once the
+            listing completes. Results of the page being consumed when a listing was
+            interrupted are yielded again when it resumes.
+        mode: ListMode or str, optional
+            How to deserialize the objects returned. Default is ListMode.FULL, which builds
+            every object. ListMode.LAZY yields a :class:`LazyDataConcepts` view that only
+            builds the object when an attribute other than its type, uids, name, tags or
+            dataset is read. ListMode.RAW yields the dictionaries returned by the platform.
+            The lighter modes save considerable CPU when scanning for names or uids.
 
         Returns
         -------
-        Iterator[DataObject]
+        CursorIterator[DataObject]
             List of every object in this collection whose `name` matches the search term.
 
         """
@@ -131,8 +154,11 @@ class DataObjectCollection(DataConceptsCollection[DataObjectResourceType], ABC):
             json=body,
             forward=forward,
             per_page=per_page,
+            prefetch=prefetch,
+            cursor=cursor,
+            checkpoint=checkpoint,
             params=params)
-        return (self.build(raw) for raw in raw_objects)
+        return self._build_listing(raw_objects, mode)
 
     @staticmethod
     def _get_attribute_bounds_search_body(attribute_bounds):
@@ -169,10 +195,9 @@ class DataObjectCollection(DataConceptsCollection[DataObjectResourceType], ABC):
         """
         path = self._get_path(ignore_dataset=True) + "/validate-templates"
 
-        temp_scope = str(uuid4())
-        GEMDJson(scope=temp_scope).dumps(model)  # This apparent no-op populates uids
-        dumped_data = replace_objects_with_links(scrub_none(model.dump()))
-        recursive_foreach(model, lambda x: x.uids.pop(temp_scope, None))  # Strip temp uids
+        writer = PayloadWriter(scope=str(uuid4()))
+        dumped_data = writer.dump(model)
+        writer.remove_assigned_uids()
 
         request_data = {"dataObject": dumped_data}
         if object_template is not None:
@@ -1,5 +1,6 @@
 """Resources that represent both individual and collections of datasets."""
-from typing import List, Optional, Union, Tuple, Iterator
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union, Tuple
 from uuid import UUID
 
 from gemd.entity.base_entity import BaseEntity
@@ -11,9 +12,11 @@ from citrine._rest.resource import Resource, ResourceTypeEnum
 from citrine._serialization import properties
 from citrine._session import Session
 from citrine._utils.functions import scrub_none
+from citrine.deduplication import Deduplicator
 from citrine.exceptions import NotFound
 from citrine.resources.api_error import ApiError
 from citrine.resources.condition_template import ConditionTemplateCollection
+from citrine.resources.content_hash import ContentHashCache
 from citrine.resources.data_concepts import DataConcepts
 from citrine.resources.delete import _poll_for_async_batch_delete_result
 from citrine.resources.file_link import FileCollection
@@ -31,6 +34,7 @@ from citrine.resources.process_run import ProcessRunCollection
 from citrine.resources.process_spec import ProcessSpecCollection
 from citrine.resources.process_template import ProcessTemplateCollection
 from citrine.resources.property_template import PropertyTemplateCollection
+from citrine.resources.write_journal import WriteJournal
 
 
 class Dataset(Resource['Dataset']):
@@ -194,11 +198,24 @@ class Dataset(Resource['Dataset']):
         """Return a resource representing all files in the dataset."""
         return FileCollection(self.project_id, self.uid, self.session)
 
-    def register(self, model: DataConcepts, *, dry_run=False) -> DataConcepts:
+    def register(self,
+                 model: DataConcepts,
+                 *,
+                 dry_run=False,
+                 cache: Optional[ContentHashCache] = None) -> DataConcepts:
         """Register a data model object to the appropriate collection."""
-        return self.gemd.register(model, dry_run=dry_run)
-
-    def register_all(self, models: List[DataConcepts], *, dry_run=False) -> List[DataConcepts]:
+        return self.gemd.register(model, dry_run=dry_run, cache=cache)
+
+    def register_all(self,
+                     models: List[DataConcepts],
+                     *,
+                     dry_run=False,
+                     max_workers: int = 1,
+                     max_batch_size: int = 500,
+                     max_batch_bytes: int = 4 * 2 ** 20,
+                     target_latency: float = 10.0,
+                     journal: Optional[Union[str, Path, WriteJournal]] = None,
+                     cache: Optional[ContentHashCache] = None) -> List[DataConcepts]:
         """
         Register multiple GEMD objects to each of their appropriate collections.
 
@@ -208,6 +225,9 @@ class Dataset(Resource['Dataset']):
         The uids of the input data concepts resources are updated with their on-platform uids.
         This supports storing an object that has a reference to an object that doesn't have a uid.
 
+        See :func:`~citrine.resources.gemd_resource.GEMDResourceCollection.register_all` for how
+        objects are batched.
+
         Parameters
         ----------
         models: List[DataConcepts]
@@ -217,13 +237,99 @@ class Dataset(Resource['Dataset']):
             Whether to actually register the item or run a dry run of the register operation.
             Dry run is intended to be used for validation. Default: false
 
+        max_workers: int
+            Number of batches to write concurrently. Default is 1.
+
+        max_batch_size: int
+            Largest number of objects in a batch. Default is 500.
+
+        max_batch_bytes: int
+            Largest size of the serialized objects in a batch, in bytes. Default is 4 MiB.
+
+        target_latency: float
+            Time that writing a batch should take, in seconds. Default is 10.
+
+        journal: Optional[Union[str, Path, WriteJournal]]
+            A file in which to record the batches that are written, so that an interrupted
+            registration can be resumed without sending objects again. Default is no journal.
+
+        cache: Optional[ContentHashCache]
+            A record of the objects written before. Objects that have not changed since they
+            were last written through it are not sent. Default is no cache.
+
         Returns
         -------
         List[DataConcepts]
             The registered versions
 
         """
-        return self.gemd.register_all(models, dry_run=dry_run)
+        return self.gemd.register_all(models, dry_run=dry_run, max_workers=max_workers,
+                                      max_batch_size=max_batch_size,
+                                      max_batch_bytes=max_batch_bytes,
+                                      target_latency=target_latency, journal=journal,
+                                      cache=cache)
+
+    def register_stream(self,
+                        models: Iterable[DataConcepts],
+                        *,
+                        dry_run=False,
+                        buffer_size: int = 10000,
+                        max_workers: int = 1,
+                        max_batch_size: int = 500,
+                        max_batch_bytes: int = 4 * 2 ** 20,
+                        target_latency: float = 10.0,
+                        journal: Optional[Union[str, Path, WriteJournal]] = None,
+                        cache: Optional[ContentHashCache] = None) -> Iterator[DataConcepts]:
+        """
+        Register GEMD objects as they are produced, without holding all of them in memory.
+
+        Every object must come after the objects it links to. See
+        :func:`~citrine.resources.gemd_resource.GEMDResourceCollection.register_stream`.
+
+        Parameters
+        ----------
+        models: Iterable[DataConcepts]
+            The data model objects to register, such as a generator. Can be different types.
+
+        dry_run: bool
+            Whether to actually register the objects or run a dry run of the register
+            operation. Default: false
+
+        buffer_size: int
+            Largest number of objects to read ahead. Default is 10000.
+
+        max_workers: int
+            Number of batches to write concurrently. Default is 1.
+
+        max_batch_size: int
+            Largest number of objects in a batch. Default is 500.
+
+        max_batch_bytes: int
+            Largest size of the serialized objects in a batch, in bytes. Default is 4 MiB.
+
+        target_latency: float
+            Time that writing a batch should take, in seconds. Default is 10.
+
+        journal: Optional[Union[str, Path, WriteJournal]]
+            A file in which to record the batches that are written, so that an interrupted
+            registration can be resumed. Default is no journal.
+
+        cache: Optional[ContentHashCache]
+            A record of the objects written before. Objects that have not changed since they
+            were last written through it are not sent. Default is no cache.
+
+        Returns
+        -------
+        Iterator[DataConcepts]
+            The registered versions, in the order they were written
+
+        """
+        return self.gemd.register_stream(models, dry_run=dry_run, buffer_size=buffer_size,
+                                         max_workers=max_workers,
+                                         max_batch_size=max_batch_size,
+                                         max_batch_bytes=max_batch_bytes,
+                                         target_latency=target_latency, journal=journal,
+                                         cache=cache)
 
     def update(self, model: DataConcepts) -> DataConcepts:
         """Update a data model object using the appropriate collection."""
@@ -415,7 +521,9 @@ class DatasetCollection(Collection[Dataset]):
 
     def list(self, *,
              page: Optional[int] = None,
-             per_page: int = 1000) -> Iterator[Dataset]:
+             per_page: int = 1000,
+             max_workers: int = 1,
+             deduplicate: Union[bool, Deduplicator] = True) -> Iterator[Dataset]:
         """
         List datasets using pagination.
 
@@ -431,6 +539,16 @@ class DatasetCollection(Collection[Dataset]):
             Max number of results to return per page. Default is 1000.  This parameter
             is used when making requests to the backend service.  If the page parameter
             is specified it limits the maximum number of elements in the response.
+        max_workers: int, optional
+            Number of pages to fetch concurrently. Default is 1, which fetches one page at a
+            time. Larger values fetch a sliding window of pages in parallel, which speeds up
+            listing long collections at the cost of a few requests past the final page.
+        deduplicate: Union[bool, Deduplicator], optional
+            How to skip elements that appear more than once, such as when an element moves
+            across a page boundary while listing. Default is True, which remembers every uid
+            yielded. A :class:`~citrine.deduplication.WindowDeduplicator` or
+            :class:`~citrine.deduplication.BloomDeduplicator` bounds the memory used for
+            very long listings. False yields every element as received.
 
         Returns
         -------
@@ -438,7 +556,8 @@ class DatasetCollection(Collection[Dataset]):
             Datasets in this collection.
 
         """
-        return super().list(page=page, per_page=per_page)
+        return super().list(page=page, per_page=per_page, max_workers=max_workers,
+                            deduplicate=deduplicate)
 
     def get_by_unique_name(self, unique_name: str) -> Dataset:
         """Get a Dataset with the given unique name."""
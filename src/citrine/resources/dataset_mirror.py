@@ -0,0 +1,464 @@
+"""A local copy of the data objects and templates of a dataset, indexed for fast queries."""
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from gemd.entity.bounds import CategoricalBounds, IntegerBounds, RealBounds
+from gemd.entity.bounds.base_bounds import BaseBounds
+from gemd.entity.link_by_uid import LinkByUID
+from gemd.entity.template.attribute_template import AttributeTemplate
+from gemd.units import IncompatibleUnitsError, UndefinedUnitError, convert_units
+
+from citrine._utils.cursor import PathType
+from citrine.resources.data_concepts import CITRINE_SCOPE, DataConcepts, LazyDataConcepts, \
+    ListMode, _make_link_by_uid
+from citrine.resources.dataset import Dataset
+from citrine.resources.history_cache import root_stamp
+
+# Version of the layout of the tables. A mirror with another layout is rebuilt.
+_SCHEMA_VERSION = '2'
+
+# The collections of a dataset that are mirrored, by their property on Dataset
+_COLLECTIONS = (
+    'property_templates', 'condition_templates', 'parameter_templates',
+    'material_templates', 'measurement_templates', 'process_templates',
+    'process_specs', 'process_runs', 'material_specs', 'material_runs',
+    'measurement_specs', 'measurement_runs', 'ingredient_specs', 'ingredient_runs',
+)
+
+_ATTRIBUTE_KINDS = ('properties', 'conditions', 'parameters')
+
+# Fields that hold something other than links to other objects
+_NOT_LINKS = frozenset(('uids', 'tags', 'audit_info', 'file_links'))
+
+# The indexes hold the uid of the object too, so queries are answered from them alone
+_TABLES = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE objects (uid TEXT PRIMARY KEY, type TEXT NOT NULL, name TEXT,
+                      name_lower TEXT, updated_at TEXT, data TEXT NOT NULL);
+CREATE INDEX objects_by_type ON objects (type);
+CREATE INDEX objects_by_name ON objects (name_lower);
+CREATE TABLE uids (key TEXT NOT NULL, uid TEXT NOT NULL, PRIMARY KEY (key, uid));
+CREATE INDEX uids_by_object ON uids (uid);
+CREATE TABLE tags (uid TEXT NOT NULL, tag TEXT NOT NULL, head TEXT NOT NULL);
+CREATE INDEX tags_by_head ON tags (head, tag, uid);
+CREATE INDEX tags_by_object ON tags (uid);
+CREATE TABLE links (uid TEXT NOT NULL, field TEXT NOT NULL, target TEXT NOT NULL);
+CREATE INDEX links_by_target ON links (target, field, uid);
+CREATE INDEX links_by_object ON links (uid);
+CREATE TABLE attributes (uid TEXT NOT NULL, kind TEXT NOT NULL, name TEXT, template TEXT,
+                         lower REAL, upper REAL, units TEXT, category TEXT);
+CREATE INDEX attributes_by_value ON attributes (template, units, lower, upper, uid);
+CREATE INDEX attributes_by_category ON attributes (template, category, uid);
+CREATE INDEX attributes_by_object ON attributes (uid);
+"""
+
+_INDEX_TABLES = ('uids', 'tags', 'links', 'attributes')
+
+# Sorts after any text that starts with the same prefix, so prefixes are searched as ranges
+_LAST_CHARACTER = '\U0010ffff'
+
+
+def _key(scope: str, id: str) -> str:
+    """Key of a uid, with the scope in lower case as it is compared by the platform."""
+    return '{}:{}'.format(scope.lower(), id)
+
+
+def _links(value) -> Iterator[dict]:
+    """
+    Find the serialized links in a field, including in lists such as template pairs.
+
+    Links within other objects, such as the template of an attribute, are not included.
+    """
+    if isinstance(value, dict):
+        if value.get('type') == LinkByUID.typ:
+            yield value
+    elif isinstance(value, list):
+        for item in value:
+            yield from _links(item)
+
+
+def _attributes(data: dict) -> Iterator[Tuple[str, dict]]:
+    """Find the attributes of a serialized object, by kind."""
+    for kind in _ATTRIBUTE_KINDS:
+        for attribute in data.get(kind) or []:
+            if not isinstance(attribute, dict):
+                continue  # A template and bounds pair, on an object template
+            if attribute.get('type') == 'property_and_conditions':
+                yield 'properties', attribute['property']
+                for condition in attribute.get('conditions') or []:
+                    yield 'conditions', condition
+            else:
+                yield kind, attribute
+
+
+def _value_range(value: Optional[dict]) -> tuple:
+    """The lower and upper numbers, units and category of a serialized value."""
+    if not value:
+        return None, None, None, None
+    units = value.get('units')
+    if 'nominal' in value:
+        return value['nominal'], value['nominal'], units, None
+    if 'mean' in value:
+        return value['mean'], value['mean'], units, None
+    if 'lower_bound' in value:
+        return value['lower_bound'], value['upper_bound'], units, None
+    return None, None, units, value.get('category')
+
+
+class DatasetMirror:
+    """
+    A copy of the data objects and templates of a dataset in a local SQLite database.
+
+    :func:`sync` lists every collection of the dataset and stores the objects along with an
+    index of their uids, type, name, tags, links to other objects and attribute values.
+    Queries are then answered from that index without a request to the platform, which
+    takes microseconds rather than a round-trip each. They behave like the collection
+    methods of the same name, except that they only see the objects as of the last sync.
+
+    Syncing again only rewrites the objects whose update time, in their audit information,
+    has changed, and removes the objects that are no longer in the dataset. The listing has
+    no filter on update time, so every page is still listed, but without building any
+    object. A sync is written in a single transaction, so an interrupted sync leaves the
+    mirror as it was.
+
+    .. code-block:: python
+
+        with DatasetMirror(dataset, 'dataset.sqlite') as mirror:
+            mirror.sync()
+            runs = list(mirror.list_by_name('cake', object_type='material_run'))
+
+    Parameters
+    ----------
+    dataset: Dataset
+        The dataset to mirror
+    path: Union[str, os.PathLike]
+        Location of the database. It is created if it does not exist. ``':memory:'`` keeps
+        the mirror in memory.
+
+    """
+
+    def __init__(self, dataset: Dataset, path: PathType):
+        self.dataset = dataset
+        self._db = sqlite3.connect(os.fspath(path))
+        tables = {row[0] for row in self._db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if 'meta' in tables and self._meta('schema') != _SCHEMA_VERSION:
+            with self._db:
+                for table in tables:
+                    self._db.execute('DROP TABLE {}'.format(table))
+            tables = set()
+        if not tables:
+            with self._db:
+                self._db.executescript(_TABLES)
+                self._db.execute("INSERT INTO meta VALUES ('schema', ?), ('dataset', ?)",
+                                 (_SCHEMA_VERSION, str(dataset.uid)))
+        elif self._meta('dataset') != str(dataset.uid):
+            mirrored = self._meta('dataset')
+            self._db.close()
+            raise ValueError("{} is a mirror of dataset {}, not {}".format(
+                path, mirrored, dataset.uid))
+
+    @property
+    def synced_at(self) -> Optional[float]:
+        """When the last sync finished, in seconds since the epoch, or None if never."""
+        value = self._meta('synced_at')
+        return None if value is None else float(value)
+
+    def __len__(self):
+        return self._db.execute('SELECT COUNT(*) FROM objects').fetchone()[0]
+
+    def sync(self, *, per_page: int = 100, prefetch: int = 0) -> Dict[str, int]:
+        """
+        Bring the mirror up to date with the dataset.
+
+        Parameters
+        ----------
+        per_page: int
+            Number of objects to list with each request
+        prefetch: int
+            Number of pages to fetch ahead of the page being stored, on a background thread
+
+        Returns
+        -------
+        Dict[str, int]
+            Number of objects ``added``, ``updated``, ``removed`` and ``unchanged``
+
+        """
+        counts = dict.fromkeys(('added', 'updated', 'removed', 'unchanged'), 0)
+        stamps = dict(self._db.execute('SELECT uid, updated_at FROM objects'))
+        seen = set()
+        with self._db:
+            for name in _COLLECTIONS:
+                collection = getattr(self.dataset, name)
+                listing = collection.list(per_page=per_page, prefetch=prefetch,
+                                          mode=ListMode.RAW)
+                for data in listing:
+                    uid = data['uids'][CITRINE_SCOPE]
+                    seen.add(uid)
+                    stamp = root_stamp(data)
+                    text = json.dumps(data, sort_keys=True)
+                    if uid in stamps:
+                        # Objects without audit information are compared in full
+                        if stamps[uid] == stamp if stamp is not None \
+                                else self._data(uid) == text:
+                            counts['unchanged'] += 1
+                            continue
+                        self._remove(uid)
+                        counts['updated'] += 1
+                    else:
+                        counts['added'] += 1
+                    self._add(uid, stamp, data, text)
+            for uid in stamps.keys() - seen:
+                self._remove(uid)
+                counts['removed'] += 1
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES ('synced_at', ?)",
+                             (str(time.time()),))
+        return counts
+
+    def get(self, uid: Union[str, LinkByUID, DataConcepts], *,
+            mode: Union[ListMode, str] = ListMode.FULL):
+        """
+        Get an object by any of its uids.
+
+        Returns
+        -------
+        Optional[DataConcepts]
+            The object, deserialized as requested by `mode`, or None if it is not mirrored
+
+        """
+        return next(self._select(
+            'SELECT o.data FROM uids u JOIN objects o ON o.uid = u.uid WHERE u.key = ?',
+            [self._link_key(uid)], mode), None)
+
+    def list(self, *, object_type: Optional[str] = None,
+             mode: Union[ListMode, str] = ListMode.FULL) -> Iterator[DataConcepts]:
+        """
+        Get every mirrored object, or every one of a type such as ``material_run``.
+
+        Returns
+        -------
+        Iterator[DataConcepts]
+            The objects, deserialized as requested by `mode`
+
+        """
+        return self._objects('SELECT uid FROM objects', [], object_type, mode)
+
+    def list_by_name(self, name: str, *, exact: bool = False,
+                     object_type: Optional[str] = None,
+                     mode: Union[ListMode, str] = ListMode.FULL) -> Iterator[DataConcepts]:
+        """
+        Get the objects whose name starts with `name`, or equals it if `exact`.
+
+        The name is compared without regard to case, as by the platform.
+
+        Returns
+        -------
+        Iterator[DataConcepts]
+            The objects, deserialized as requested by `mode`
+
+        """
+        name = name.lower()
+        if exact:
+            query, args = 'SELECT uid FROM objects WHERE name_lower = ?', [name]
+        else:
+            query = 'SELECT uid FROM objects WHERE name_lower >= ? AND name_lower < ?'
+            args = [name, name + _LAST_CHARACTER]
+        return self._objects(query, args, object_type, mode)
+
+    def list_by_tag(self, tag: str, *, object_type: Optional[str] = None,
+                    mode: Union[ListMode, str] = ListMode.FULL) -> Iterator[DataConcepts]:
+        """
+        Get the objects bearing a tag prefixed with `tag`.
+
+        As on the platform, the prefix must match the first segment of the tag in full, so
+        'foo' and 'foo::b' both match 'foo::bar', but 'fo' does not.
+
+        Returns
+        -------
+        Iterator[DataConcepts]
+            The objects, deserialized as requested by `mode`
+
+        """
+        query = 'SELECT uid FROM tags WHERE head = ? AND tag >= ? AND tag < ?'
+        args = [tag.split('::')[0], tag, tag + _LAST_CHARACTER]
+        return self._objects(query, args, object_type, mode)
+
+    def list_by_template(self, uid: Union[str, LinkByUID, DataConcepts], *,
+                         object_type: Optional[str] = None,
+                         mode: Union[ListMode, str] = ListMode.FULL) -> Iterator[DataConcepts]:
+        """Get the specs of an object template, or the object templates using an attribute one."""
+        return self._linked_to('template', uid, object_type, mode)
+
+    def list_by_spec(self, uid: Union[str, LinkByUID, DataConcepts], *,
+                     object_type: Optional[str] = None,
+                     mode: Union[ListMode, str] = ListMode.FULL) -> Iterator[DataConcepts]:
+        """Get the runs of a spec."""
+        return self._linked_to('spec', uid, object_type, mode)
+
+    def list_by_process(self, uid: Union[str, LinkByUID, DataConcepts], *,
+                        object_type: Optional[str] = None,
+                        mode: Union[ListMode, str] = ListMode.FULL) -> Iterator[DataConcepts]:
+        """Get the materials made by a process, and the ingredients that went into it."""
+        return self._linked_to('process', uid, object_type, mode)
+
+    def list_by_material(self, uid: Union[str, LinkByUID, DataConcepts], *,
+                         object_type: Optional[str] = None,
+                         mode: Union[ListMode, str] = ListMode.FULL) -> Iterator[DataConcepts]:
+        """Get the measurements of a material, and the ingredients it was used as."""
+        return self._linked_to('material', uid, object_type, mode)
+
+    def list_by_attribute_bounds(
+            self,
+            attribute_bounds: Dict[Union[AttributeTemplate, LinkByUID, str], BaseBounds], *,
+            object_type: Optional[str] = None,
+            mode: Union[ListMode, str] = ListMode.FULL) -> Iterator[DataConcepts]:
+        """
+        Get the objects with an attribute within bounds, for each of several templates.
+
+        Real values are compared in the units of the bounds, and ranges of values, such as
+        uniform values, must lie entirely within the bounds. Categorical bounds match
+        nominal categorical values.
+
+        Parameters
+        ----------
+        attribute_bounds: Dict[Union[AttributeTemplate, LinkByUID, str], BaseBounds]
+            Bounds on the attributes of each template. Only real, integer and categorical
+            bounds are supported; others raise a TypeError.
+
+        Returns
+        -------
+        Iterator[DataConcepts]
+            The objects, deserialized as requested by `mode`
+
+        """
+        queries, args = [], []
+        for template, bounds in attribute_bounds.items():
+            query, template_args = self._bounds_query(self._aliases(template), bounds)
+            queries.append(query)
+            args.extend(template_args)
+        return self._objects(' INTERSECT '.join(queries), args, object_type, mode)
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._db.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def _data(self, uid: str) -> str:
+        return self._db.execute('SELECT data FROM objects WHERE uid = ?', (uid,)).fetchone()[0]
+
+    def _add(self, uid: str, stamp: Optional[str], data: dict, text: str) -> None:
+        name = data.get('name')
+        self._db.execute('INSERT INTO objects VALUES (?, ?, ?, ?, ?, ?)',
+                         (uid, data['type'], name, None if name is None else name.lower(),
+                          stamp, text))
+        # Keyed by object too, so that an object taking over a uid from one that is removed
+        # later in the same sync keeps it
+        self._db.executemany('INSERT OR IGNORE INTO uids VALUES (?, ?)',
+                             [(_key(scope, id), uid) for scope, id in data['uids'].items()])
+        self._db.executemany('INSERT INTO tags VALUES (?, ?, ?)',
+                             [(uid, tag, tag.split('::')[0]) for tag in data.get('tags') or []])
+        self._db.executemany(
+            'INSERT INTO links VALUES (?, ?, ?)',
+            [(uid, 'template' if field in _ATTRIBUTE_KINDS else field,
+              _key(link['scope'], link['id']))
+             for field, value in data.items() if field not in _NOT_LINKS
+             for link in _links(value)])
+        rows = []
+        for kind, attribute in _attributes(data):
+            template = attribute.get('template')
+            template = None if template is None else _key(template['scope'], template['id'])
+            lower, upper, units, category = _value_range(attribute.get('value'))
+            rows.append((uid, kind, attribute.get('name'), template,
+                         lower, upper, units, category))
+        self._db.executemany('INSERT INTO attributes VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def _remove(self, uid: str) -> None:
+        self._db.execute('DELETE FROM objects WHERE uid = ?', (uid,))
+        for table in _INDEX_TABLES:
+            self._db.execute('DELETE FROM {} WHERE uid = ?'.format(table), (uid,))
+
+    @staticmethod
+    def _link_key(uid: Union[str, LinkByUID, DataConcepts]) -> str:
+        link = _make_link_by_uid(uid)
+        return _key(link.scope, link.id)
+
+    def _aliases(self, uid: Union[str, LinkByUID, DataConcepts]) -> List[str]:
+        """Every uid of a mirrored object, so that links to it in any scope are found."""
+        key = self._link_key(uid)
+        keys = [row[0] for row in self._db.execute(
+            'SELECT a.key FROM uids u JOIN uids a ON a.uid = u.uid WHERE u.key = ?', (key,))]
+        return keys or [key]
+
+    def _linked_to(self, field: str, uid: Union[str, LinkByUID, DataConcepts],
+                   object_type: Optional[str],
+                   mode: Union[ListMode, str]) -> Iterator[DataConcepts]:
+        keys = self._aliases(uid)
+        query = 'SELECT uid FROM links WHERE field = ? AND target IN ({})'.format(
+            ', '.join('?' * len(keys)))
+        return self._objects(query, [field] + keys, object_type, mode)
+
+    def _bounds_query(self, keys: List[str], bounds: BaseBounds) -> Tuple[str, list]:
+        targets = 'template IN ({})'.format(', '.join('?' * len(keys)))
+        if isinstance(bounds, CategoricalBounds):
+            categories = sorted(bounds.categories)
+            return 'SELECT uid FROM attributes WHERE {} AND category IN ({})'.format(
+                targets, ', '.join('?' * len(categories))), keys + categories
+        if isinstance(bounds, IntegerBounds):
+            ranges = [(None, bounds.lower_bound, bounds.upper_bound)]
+        elif isinstance(bounds, RealBounds):
+            # Convert the bounds to the units of each value, rather than every value
+            units = [row[0] for row in self._db.execute(
+                'SELECT DISTINCT units FROM attributes WHERE {}'.format(targets), keys)]
+            ranges = []
+            for unit in units:
+                try:
+                    ranges.append((unit,
+                                   convert_units(bounds.lower_bound, bounds.default_units, unit),
+                                   convert_units(bounds.upper_bound, bounds.default_units, unit)))
+                except (IncompatibleUnitsError, UndefinedUnitError, TypeError):
+                    continue  # Values in other dimensions are not within the bounds
+        else:
+            raise TypeError('Only real, integer and categorical bounds are supported, '
+                            'not {}'.format(type(bounds).__name__))
+        queries, args = [], []
+        for unit, lower, upper in ranges:
+            query = 'SELECT uid FROM attributes WHERE {} AND lower >= ? AND upper <= ?'.format(
+                targets)
+            queries.append(query + ('' if unit is None else ' AND units IS ?'))
+            args.extend(keys + [lower, upper] + ([] if unit is None else [unit]))
+        if not queries:
+            return 'SELECT uid FROM attributes WHERE 0', []
+        return ' UNION '.join(queries), args
+
+    def _objects(self, query: str, args: list, object_type: Optional[str],
+                 mode: Union[ListMode, str]) -> Iterator[DataConcepts]:
+        """Get the objects whose uids are selected by a query, in the order they were added."""
+        select = 'SELECT data FROM objects WHERE uid IN ({})'.format(query)
+        if object_type is not None:
+            select += ' AND type = ?'
+            args = args + [object_type]
+        return self._select(select + ' ORDER BY rowid', args, mode)
+
+    def _select(self, query: str, args: Iterable, mode: Union[ListMode, str]) -> Iterator:
+        mode = ListMode.get_enum(mode)
+        rows = self._db.execute(query, list(args)).fetchall()
+        for text, in rows:
+            data = json.loads(text)
+            if mode == ListMode.RAW:
+                yield data
+            elif mode == ListMode.LAZY:
+                yield LazyDataConcepts(data, DataConcepts.build)
+            else:
+                yield DataConcepts.build(data)
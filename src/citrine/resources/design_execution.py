@@ -6,6 +6,7 @@ from uuid import UUID
 from citrine._rest.collection import Collection
 from citrine._utils.functions import shadow_classes_in_module
 from citrine._session import Session
+from citrine.deduplication import Deduplicator
 import citrine.informatics.executions.design_execution
 from citrine.informatics.executions import DesignExecution
 from citrine.informatics.scores import Score
@@ -80,6 +81,8 @@ class DesignExecutionCollection(Collection["DesignExecution"]):
     def list(self, *,
              page: Optional[int] = None,
              per_page: int = 100,
+             max_workers: int = 1,
+             deduplicate: Union[bool, Deduplicator] = True
              ) -> Iterator[DesignExecution]:
         """
         Paginate over the elements of the collection.
@@ -96,8 +99,16 @@ class DesignExecutionCollection(Collection["DesignExecution"]):
             Max number of results to return per page. Default is 100.  This parameter
             is used when making requests to the backend service.  If the page parameter
             is specified it limits the maximum number of elements in the response.
-        predictor_id: uuid, optional
-            list executions that targeted the predictor with this id
+        max_workers: int, optional
+            Number of pages to fetch concurrently. Default is 1, which fetches one page at a
+            time. Larger values fetch a sliding window of pages in parallel, which speeds up
+            listing long collections at the cost of a few requests past the final page.
+        deduplicate: Union[bool, Deduplicator], optional
+            How to skip elements that appear more than once, such as when an element moves
+            across a page boundary while listing. Default is True, which remembers every uid
+            yielded. A :class:`~citrine.deduplication.WindowDeduplicator` or
+            :class:`~citrine.deduplication.BloomDeduplicator` bounds the memory used for
+            very long listings. False yields every element as received.
 
         Returns
         -------
@@ -108,7 +119,9 @@ class DesignExecutionCollection(Collection["DesignExecution"]):
         return self._paginator.paginate(page_fetcher=self._fetch_page,
                                         collection_builder=self._build_collection_elements,
                                         page=page,
-                                        per_page=per_page)
+                                        per_page=per_page,
+                                        max_workers=max_workers,
+                                        deduplicate=deduplicate)
 
     def delete(self, uid: Union[UUID, str]) -> Response:
         """Design Workflow Executions cannot be deleted or archived."""
@@ -4,6 +4,7 @@ from uuid import UUID
 from citrine._rest.collection import Collection
 from citrine._session import Session
 from citrine._utils.functions import migrate_deprecated_argument, format_escaped_url
+from citrine.deduplication import Deduplicator
 from citrine.informatics.workflows import DesignWorkflow
 from citrine.resources.response import Response
 from functools import partial
@@ -68,10 +69,19 @@ class DesignWorkflowCollection(Collection[DesignWorkflow]):
     def list_archived(self,
                       *,
                       page: Optional[int] = None,
-                      per_page: int = 500) -> Iterable[DesignWorkflow]:
-        """List archived Design Workflows."""
+                      per_page: int = 500,
+                      max_workers: int = 1,
+                      deduplicate: Union[bool, Deduplicator] = True
+                      ) -> Iterable[DesignWorkflow]:
+        """
+        List archived Design Workflows.
+
+        The parameters are those of :meth:`list`, with a default page size of 500.
+        """
         fetcher = partial(self._fetch_page, additional_params={"filter": "archived eq 'true'"})
         return self._paginator.paginate(page_fetcher=fetcher,
                                         collection_builder=self._build_collection_elements,
                                         page=page,
-                                        per_page=per_page)
+                                        per_page=per_page,
+                                        max_workers=max_workers,
+                                        deduplicate=deduplicate)
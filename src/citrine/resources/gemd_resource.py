@@ -1,18 +1,43 @@
 """Collection class for generic GEMD objects and templates."""
-from collections import defaultdict
-from typing import Type, Union, Optional, List, Tuple
+import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterable, Iterator, Type, Union, Optional, List, Tuple
 from uuid import UUID
 
-from gemd.util import writable_sort_order
 from gemd.entity.base_entity import BaseEntity
 from gemd.entity.link_by_uid import LinkByUID
 
+from citrine.exceptions import GatewayTimeout, PayloadTooLarge
 from citrine.resources.api_error import ApiError
+from citrine.resources.content_hash import ContentHashCache
 from citrine.resources.data_concepts import DataConcepts, DataConceptsCollection
 from citrine.resources.delete import _async_gemd_batch_delete
+from citrine.resources.write_journal import WriteJournal, journal_keys
+from citrine._utils.write_schedule import BatchSizer, WriteSchedule, type_order
 from citrine._session import Session
 
 
+@contextmanager
+def _opened(journal: Optional[Union[str, Path, WriteJournal]],
+            *,
+            dry_run: bool) -> Iterator[Optional[WriteJournal]]:
+    """Open a journal given by its path for the duration of a registration."""
+    if journal is None:
+        yield None
+        return
+    if dry_run:
+        raise ValueError("A journal cannot be used for a dry run.")
+    if isinstance(journal, WriteJournal):
+        yield journal
+    else:
+        with WriteJournal(journal) as opened:
+            yield opened
+
+
 class GEMDResourceCollection(DataConceptsCollection[DataConcepts]):
     """A collection of any kind of GEMD objects/templates."""
 
@@ -72,11 +97,24 @@ class GEMDResourceCollection(DataConceptsCollection[DataConcepts]):
         model = self.get(uid)  # Get full object for collection lookup
         return self._collection_for(model).delete(model, dry_run=dry_run)
 
-    def register(self, model: DataConcepts, *, dry_run=False) -> DataConcepts:
+    def register(self,
+                 model: DataConcepts,
+                 *,
+                 dry_run=False,
+                 cache: Optional[ContentHashCache] = None) -> DataConcepts:
         """Register a GEMD object to the appropriate collection."""
-        return self._collection_for(model).register(model, dry_run=dry_run)
-
-    def register_all(self, models: List[DataConcepts], *, dry_run=False) -> List[DataConcepts]:
+        return self._collection_for(model).register(model, dry_run=dry_run, cache=cache)
+
+    def register_all(self,
+                     models: List[DataConcepts],
+                     *,
+                     dry_run=False,
+                     max_workers: int = 1,
+                     max_batch_size: int = 500,
+                     max_batch_bytes: int = 4 * 2 ** 20,
+                     target_latency: float = 10.0,
+                     journal: Optional[Union[str, Path, WriteJournal]] = None,
+                     cache: Optional[ContentHashCache] = None) -> List[DataConcepts]:
         """
         Register multiple GEMD objects to each of their appropriate collections.
 
@@ -86,6 +124,12 @@ class GEMDResourceCollection(DataConceptsCollection[DataConcepts]):
         The uids of the input data concepts resources are updated with their on-platform uids.
         This supports storing an object that has a reference to an object that doesn't have a uid.
 
+        Objects are written in batches of one type, which start at 50 objects and adapt to
+        the objects being written: they grow while they are quick to write, and shrink if they
+        are slow, too large to send, or time out. Each change to the batch size of a type is
+        published to the subscribers of the session as a
+        :class:`~citrine.instrumentation.BatchSizeEvent`.
+
         Parameters
         ----------
         models: List[DataConcepts]
@@ -95,30 +139,279 @@ class GEMDResourceCollection(DataConceptsCollection[DataConcepts]):
             Whether to actually register the item or run a dry run of the register operation.
             Dry run is intended to be used for validation. Default: false
 
+        max_workers: int
+            Number of batches to write concurrently. Default is 1, which writes one batch at a
+            time. Each object is written once the objects it links to have been written, so
+            with larger values, batches of different types are written side by side, and
+            objects do not wait for unrelated objects that they happen to share a type with.
+
+        max_batch_size: int
+            Largest number of objects in a batch. Default is 500.
+
+        max_batch_bytes: int
+            Largest size of the serialized objects in a batch, in bytes. A single object that
+            is larger is still written on its own. Default is 4 MiB.
+
+        target_latency: float
+            Time that writing a batch should take, in seconds. Default is 10.
+
+        journal: Optional[Union[str, Path, WriteJournal]]
+            A file in which to record the batches that are written, or an open
+            :class:`~citrine.resources.write_journal.WriteJournal`. If a registration with the
+            same journal was interrupted, the objects it wrote are not sent again, and are
+            returned as given, with the uids they were written with. Cannot be used with a dry
+            run. Default is no journal.
+
+        cache: Optional[ContentHashCache]
+            A record of the objects written before. Objects that have not changed since they
+            were last written through it are not sent, and are returned as given. Not used by
+            a dry run. Default is no cache.
+
         Returns
         -------
         List[DataConcepts]
-            The registered versions
+            The registered versions, grouped by type in an order in which types can be written
+
+        """
+        models = list(models)
+        registered = [None] * len(models)
+        sizer_for = self._batch_sizers(max_batch_size=max_batch_size,
+                                       max_batch_bytes=max_batch_bytes,
+                                       target_latency=target_latency)
+        with _opened(journal, dry_run=dry_run) as journal:
+            for index, postwrite in self._write(models, dry_run=dry_run,
+                                                max_workers=max_workers, sizer_for=sizer_for,
+                                                journal=journal, cache=cache):
+                registered[index] = postwrite
+        return [registered[index] for index in type_order(models)]
+
+    def register_stream(self,
+                        models: Iterable[DataConcepts],
+                        *,
+                        dry_run=False,
+                        buffer_size: int = 10000,
+                        max_workers: int = 1,
+                        max_batch_size: int = 500,
+                        max_batch_bytes: int = 4 * 2 ** 20,
+                        target_latency: float = 10.0,
+                        journal: Optional[Union[str, Path, WriteJournal]] = None,
+                        cache: Optional[ContentHashCache] = None) -> Iterator[DataConcepts]:
+        """
+        Register GEMD objects as they are produced, without holding all of them in memory.
+
+        Objects are read from `models` into a buffer of at most `buffer_size` objects, which are
+        written as with :func:`register_all`, and the registered versions are yielded as each
+        batch is written. Only then is the next buffer read, so memory use does not grow with
+        the number of objects, as long as the caller does not keep them either.
+
+        Every object must come after the objects it links to. Within a buffer, objects are
+        written in an order that stores linked objects first, so this only matters between
+        buffers: an object may not link to an object that is yet to be produced.
+
+        The uids of the input objects are updated with their on-platform uids as they are
+        written, so that later objects can link to them.
+
+        Parameters
+        ----------
+        models: Iterable[DataConcepts]
+            The data model objects to register, such as a generator. Can be different types.
+
+        dry_run: bool
+            Whether to actually register the objects or run a dry run of the register
+            operation. Default: false
+
+        buffer_size: int
+            Largest number of objects to read ahead. Default is 10000.
+
+        max_workers: int
+            Number of batches to write concurrently. Default is 1.
+
+        max_batch_size: int
+            Largest number of objects in a batch. Default is 500.
+
+        max_batch_bytes: int
+            Largest size of the serialized objects in a batch, in bytes. Default is 4 MiB.
+
+        target_latency: float
+            Time that writing a batch should take, in seconds. Default is 10.
+
+        journal: Optional[Union[str, Path, WriteJournal]]
+            A file in which to record the batches that are written, so that an interrupted
+            registration can be resumed. Default is no journal.
+
+        cache: Optional[ContentHashCache]
+            A record of the objects written before. Objects that have not changed since they
+            were last written through it are not sent. Default is no cache.
+
+        Returns
+        -------
+        Iterator[DataConcepts]
+            The registered versions, in the order they were written
+
+        """
+        sizer_for = self._batch_sizers(max_batch_size=max_batch_size,
+                                       max_batch_bytes=max_batch_bytes,
+                                       target_latency=target_latency)
+        models = iter(models)
+        with _opened(journal, dry_run=dry_run) as journal:
+            while True:
+                buffer = list(islice(models, buffer_size))
+                if not buffer:
+                    return
+                for _, postwrite in self._write(buffer, dry_run=dry_run,
+                                                max_workers=max_workers, sizer_for=sizer_for,
+                                                journal=journal, cache=cache):
+                    yield postwrite
+
+    def _batch_sizers(self, **options) -> Callable[[str], BatchSizer]:
+        """A function that returns the batch sizer of each type, made when first asked for."""
+        sizers = {}
+
+        def sizer_for(typ: str) -> BatchSizer:
+            if typ not in sizers:
+                sizers[typ] = BatchSizer(typ,
+                                         max_count=options['max_batch_size'],
+                                         max_bytes=options['max_batch_bytes'],
+                                         target_latency=options['target_latency'],
+                                         publish=self.session.publish)
+            return sizers[typ]
+
+        return sizer_for
+
+    def _write(self,
+               models: List[DataConcepts],
+               *,
+               dry_run: bool,
+               max_workers: int,
+               sizer_for: Callable[[str], BatchSizer],
+               journal: Optional[WriteJournal],
+               cache: Optional[ContentHashCache]) -> Iterator[Tuple[int, DataConcepts]]:
+        """
+        Write objects in batches, each after the objects it links to.
 
+        Yields the position of each object and its registered version as its batch is written.
+        Objects already written according to the journal are yielded first, as they are.
         """
-        resources = list()
-        by_type = defaultdict(list)
-        for obj in models:
-            by_type[obj.typ].append(obj)
-        typ_groups = sorted(list(by_type.values()), key=lambda x: writable_sort_order(x[0]))
-        batch_size = 50
-        for typ_group in typ_groups:
-            num_batches = len(typ_group) // batch_size
-            for batch_num in range(num_batches + 1):
-                batch = typ_group[batch_num * batch_size: (batch_num + 1) * batch_size]
-                if batch:  # final batch is empty when batch_size divides len(typ_group)
-                    registered = self._collection_for(batch[0]) \
-                        .register_all(batch, dry_run=dry_run)
-                    for prewrite, postwrite in zip(batch, registered):
-                        if isinstance(postwrite, BaseEntity):
-                            prewrite.uids = postwrite.uids
-                    resources.extend(registered)
-        return resources
+        if journal is None:
+            keys, pending = None, list(range(len(models)))
+        else:
+            keys, pending = journal_keys(models), []
+            for index, (model, key) in enumerate(zip(models, keys)):
+                for scope, uid in (journal.uids(key) or {}).items():
+                    model.add_uid(scope, uid)
+                if journal.committed(key):
+                    yield index, model
+                else:
+                    pending.append(index)
+
+        # Made up front, so that batches written concurrently share them
+        sizers = {typ: sizer_for(typ) for typ in {models[index].typ for index in pending}}
+        schedule = WriteSchedule([models[index] for index in pending],
+                                 batch_size=lambda typ: sizers[typ].size)
+
+        def write(batch: List[int]) -> List[DataConcepts]:
+            indices = [pending[i] for i in batch]
+            return self._register_batch([models[i] for i in indices], dry_run,
+                                        sizers[models[indices[0]].typ],
+                                        journal=journal,
+                                        keys=keys and [keys[i] for i in indices],
+                                        cache=None if dry_run else cache)
+
+        def record(batch: List[int], results: List[DataConcepts]) -> List[tuple]:
+            written = []
+            for index, postwrite in zip((pending[i] for i in batch), results):
+                if isinstance(postwrite, BaseEntity):
+                    models[index].uids = postwrite.uids
+                written.append((index, postwrite))
+            schedule.written(batch)
+            return written
+
+        if max_workers <= 1:
+            while not schedule.done:
+                for batch in schedule.take(1, idle=True):
+                    yield from record(batch, write(batch))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                in_flight = {}
+                try:
+                    while not schedule.done:
+                        for batch in schedule.take(max_workers - len(in_flight),
+                                                   idle=not in_flight):
+                            in_flight[executor.submit(write, batch)] = batch
+                        finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            yield from record(in_flight.pop(future), future.result())
+                finally:
+                    # If a batch failed, don't start any more, but let those in flight finish
+                    for future in in_flight:
+                        future.cancel()
+
+    def _register_batch(self,
+                        batch: List[DataConcepts],
+                        dry_run: bool,
+                        sizer: BatchSizer,
+                        *,
+                        journal: Optional[WriteJournal] = None,
+                        keys: Optional[List[str]] = None,
+                        cache: Optional[ContentHashCache] = None) -> List[DataConcepts]:
+        """Register a batch of objects of the same type, in smaller pieces if need be."""
+        collection = self._collection_for(batch[0])
+        objects = collection._dump_batch(batch, dry_run=dry_run)
+        # Objects that have not changed since they were last written are returned as they are
+        registered = list(batch)
+        send = range(len(batch)) if cache is None else \
+            [i for i, obj in enumerate(objects) if cache.changed(self.dataset_id, obj)]
+        if not send:
+            return registered
+        sizes = [len(json.dumps(objects[i])) for i in send]
+        written = self._put_pieces(collection,
+                                   [batch[i] for i in send],
+                                   [objects[i] for i in send],
+                                   sizes, dry_run, sizer,
+                                   journal=journal,
+                                   keys=keys and [keys[i] for i in send],
+                                   cache=cache)
+        for i, postwrite in zip(send, written):
+            registered[i] = postwrite
+        return registered
+
+    def _put_pieces(self,
+                    collection: DataConceptsCollection,
+                    models: List[DataConcepts],
+                    objects: List[dict],
+                    sizes: List[int],
+                    dry_run: bool,
+                    sizer: BatchSizer,
+                    *,
+                    journal: Optional[WriteJournal],
+                    keys: Optional[List[str]],
+                    cache: Optional[ContentHashCache]) -> List[DataConcepts]:
+        registered = []
+        for piece in sizer.split(sizes):
+            part = slice(piece.start, piece.stop)
+            if journal is not None:
+                number = journal.submitted(keys[part], models[part])
+            start = perf_counter()
+            try:
+                written = collection._put_batch(objects[part], dry_run=dry_run)
+            except (PayloadTooLarge, GatewayTimeout) as e:
+                if len(piece) == 1:
+                    raise
+                sizer.failed(len(piece), sum(sizes[part]), perf_counter() - start,
+                             reason='too_large' if isinstance(e, PayloadTooLarge) else 'timeout')
+                written = self._put_pieces(collection, models[part], objects[part], sizes[part],
+                                           dry_run, sizer,
+                                           journal=journal, keys=keys and keys[part],
+                                           cache=cache)
+            else:
+                sizer.succeeded(len(piece), sum(sizes[part]), perf_counter() - start)
+                if journal is not None:
+                    journal.committed_batch(number, keys[part], written)
+                if cache is not None:
+                    for obj, postwrite in zip(objects[part], written):
+                        cache.record(self.dataset_id, obj, uids=getattr(postwrite, 'uids', None))
+            registered.extend(written)
+        return registered
 
     def async_update(self, model: DataConcepts, *,
                      dry_run: bool = False,
@@ -87,7 +87,8 @@ class GemTableCollection(Collection[GemTable]):
                       uid: UUID,
                       *,
                       page: Optional[int] = None,
-                      per_page: int = 100) -> Iterable[GemTable]:
+                      per_page: int = 100,
+                      max_workers: int = 1) -> Iterable[GemTable]:
         """
         List the versions of a table given a specific Table UID.
 
@@ -97,6 +98,7 @@ class GemTableCollection(Collection[GemTable]):
         :param uid: The Table UID.
         :param page: The page number to display (eg: 1)
         :param per_page: The number of items to fetch per-page.
+        :param max_workers: The number of pages to fetch concurrently (default 1).
         :return: An iterable of the versions of the Tables (as Table objects).
         """
         def _fetch_versions(page: Optional[int],
@@ -111,13 +113,15 @@ class GemTableCollection(Collection[GemTable]):
 
         return self._paginator.paginate(
             # Don't deduplicate on uid since uids are shared between versions
-            _fetch_versions, _build_versions, page, per_page, deduplicate=False)
+            _fetch_versions, _build_versions, page, per_page, deduplicate=False,
+            max_workers=max_workers)
 
     def list_by_config(self,
                        table_config_uid: UUID,
                        *,
                        page: Optional[int] = None,
-                       per_page: int = 100) -> Iterable[GemTable]:
+                       per_page: int = 100,
+                       max_workers: int = 1) -> Iterable[GemTable]:
         """
         List the versions of a table associated with a given Table Config UID.
 
@@ -127,6 +131,7 @@ class GemTableCollection(Collection[GemTable]):
         :param table_config_uid: The Table Config UID.
         :param page: The page number to display (eg: 1)
         :param per_page: The number of items to fetch per-page.
+        :param max_workers: The number of pages to fetch concurrently (default 1).
         :return: An iterable of the versions of the Tables (as Table objects).
         """
         def _fetch_versions(page: Optional[int],
@@ -148,7 +153,8 @@ class GemTableCollection(Collection[GemTable]):
 
         return self._paginator.paginate(
             # Don't deduplicate on uid since uids are shared between versions
-            _fetch_versions, _build_versions, page, per_page, deduplicate=False)
+            _fetch_versions, _build_versions, page, per_page, deduplicate=False,
+            max_workers=max_workers)
 
     def initiate_build(self, config: Union[TableConfig, str, UUID], *,
                        version: Union[str, UUID] = None) -> JobSubmissionResponse:
@@ -0,0 +1,210 @@
+"""Keep the material histories that have been downloaded, so that they are not fetched again."""
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional, Union
+from uuid import UUID
+
+from gemd.entity.link_by_uid import LinkByUID
+
+from citrine.__version__ import __version__
+
+_STATS = ('hits', 'disk_hits', 'misses', 'stale', 'expired', 'evictions')
+
+
+def root_stamp(root: dict) -> Optional[str]:
+    """The time a serialized object was last changed, according to its audit information."""
+    audit_info = root.get('audit_info') or {}
+    return audit_info.get('updated_at') or audit_info.get('created_at')
+
+
+class _Entry:
+
+    def __init__(self, history, stamp: Optional[str], fetched: float):
+        self.history = history
+        self.stamp = stamp
+        self.fetched = fetched
+
+
+class HistoryCache:
+    """
+    A cache of material histories, keyed by the link to the terminal material.
+
+    Set one as the ``history_cache`` of a session, and every call to
+    :func:`~citrine.resources.material_run.MaterialRunCollection.get_history` through that
+    session reuses the histories it has already built, up to `max_entries` of them; the least
+    recently used are dropped first. The histories returned from the cache are the same
+    objects each time, so changes made to one are seen by later callers.
+
+    With a `directory`, the downloaded histories are also written to disk, one file each, so
+    that they outlive the cache and are shared by every cache given the same directory. Files
+    written by another version of citrine-python are ignored.
+
+    A history is fetched again once it is older than `ttl` seconds. With ``validate=True``,
+    the terminal material alone is fetched on every call, and the history is fetched again if
+    its audit information shows it was updated since. Changes to other objects in the history
+    do not update the terminal material, so only `ttl` bounds how long those go unnoticed.
+
+    .. code-block:: python
+
+        session.history_cache = HistoryCache(max_entries=64, ttl=3600, directory='histories')
+
+    Parameters
+    ----------
+    max_entries: int
+        Most histories to keep in memory
+    ttl: Optional[float]
+        Seconds after which a history is fetched again. Histories never expire if None.
+    directory: Optional[Union[str, Path]]
+        Directory to keep the downloaded histories in. It is created if it does not exist.
+        Only memory is used if None.
+    validate: bool
+        Whether to check the update time of the terminal material before using a history
+
+    """
+
+    def __init__(self, *, max_entries: int = 128, ttl: Optional[float] = None,
+                 directory: Optional[Union[str, Path]] = None, validate: bool = False):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1, not {}".format(max_entries))
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.directory = None if directory is None else Path(directory)
+        self.validate = validate
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._entries: Dict[str, _Entry] = OrderedDict()
+        self._stats = dict.fromkeys(_STATS, 0)
+
+    @staticmethod
+    def key(project_id: UUID, link: LinkByUID) -> str:
+        """The key of the history of a material in a project."""
+        return '{}/{}/{}'.format(project_id, link.scope, link.id)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Count how the cache has been used.
+
+        Returns
+        -------
+        Dict[str, int]
+            Number of ``hits`` from memory, ``disk_hits``, ``misses``, histories found
+            ``stale`` by validation or ``expired`` by the ttl, and ``evictions`` from memory
+
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def get(self, key: str, *, stamp: Optional[str] = None):
+        """
+        Get a history, if one is cached and still current.
+
+        Parameters
+        ----------
+        key: str
+            Key of the history, from :func:`key`
+        stamp: Optional[str]
+            Update time of the terminal material, if it has just been checked. A history
+            cached with a different update time is stale.
+
+        Returns
+        -------
+        Optional[MaterialRun]
+            The cached history, or None if it must be fetched
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._current(entry, stamp):
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return entry.history
+            stored = self._entries.pop(key, None)
+        # Memory holds the newest copy, so the disk is only read for histories not in memory
+        entry = self._read(key, stamp) if stored is None else None
+        with self._lock:
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['disk_hits'] += 1
+            self._insert(key, entry)
+        return entry.history
+
+    def put(self, key: str, data: dict, history) -> None:
+        """
+        Cache a history that has just been fetched.
+
+        Parameters
+        ----------
+        key: str
+            Key of the history, from :func:`key`
+        data: dict
+            The history as it was downloaded, which is what is written to disk
+        history: MaterialRun
+            The history built from `data`
+
+        """
+        entry = _Entry(history, root_stamp(data['root']), time.time())
+        if self.directory is not None:
+            path = self._path(key)
+            partial = path.with_name(path.name + '.partial')
+            with open(partial, 'w', encoding='utf-8') as f:
+                json.dump({'version': __version__, 'stamp': entry.stamp,
+                           'fetched': entry.fetched, 'data': data}, f)
+            os.replace(partial, path)
+        with self._lock:
+            self._insert(key, entry)
+
+    def clear(self) -> None:
+        """Forget every history, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            if self.directory is not None:
+                for path in self.directory.glob('*.json'):
+                    path.unlink()
+
+    def _current(self, entry: _Entry, stamp: Optional[str]) -> bool:
+        if self.ttl is not None and time.time() - entry.fetched >= self.ttl:
+            self._stats['expired'] += 1
+            return False
+        if self.validate and stamp != entry.stamp:
+            self._stats['stale'] += 1
+            return False
+        return True
+
+    def _insert(self, key: str, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def _read(self, key: str, stamp: Optional[str]) -> Optional[_Entry]:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if saved.get('version') != __version__:
+            return None
+        entry = _Entry(None, saved['stamp'], saved['fetched'])
+        with self._lock:
+            if not self._current(entry, stamp):
+                return None
+        from citrine.resources.material_run import build_history
+        entry.history = build_history(saved['data'])
+        return entry
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
@@ -1,8 +1,8 @@
 """Resources that represent material run data objects."""
-import json
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from logging import getLogger
-from typing import List, Dict, Optional, Type, Iterator, Union
+from typing import List, Dict, Iterable, Optional, Type, Iterator, Union
 from uuid import UUID
 
 from citrine._rest.resource import Resource
@@ -11,6 +11,7 @@ from citrine._serialization.properties import Optional as PropertyOptional
 from citrine._serialization.properties import String, LinkOrElse, Mapping, Object
 from citrine._utils.functions import format_escaped_url
 from citrine.resources.data_concepts import DataConcepts, _make_link_by_uid
+from citrine.resources.history_cache import HistoryCache, root_stamp
 from citrine.resources.material_spec import MaterialSpecCollection
 from citrine.resources.object_runs import ObjectRun, ObjectRunCollection
 from gemd.entity.file_link import FileLink
@@ -19,7 +20,6 @@ from gemd.entity.object.material_run import MaterialRun as GEMDMaterialRun
 from gemd.entity.object.material_spec import MaterialSpec as GEMDMaterialSpec
 from gemd.entity.template.material_template import MaterialTemplate as GEMDMaterialTemplate
 from gemd.entity.object.process_run import ProcessRun as GEMDProcessRun
-from gemd.json import GEMDEncoder
 from gemd.util import writable_sort_order
 
 logger = getLogger(__name__)
@@ -95,6 +95,30 @@ class MaterialRun(ObjectRun, Resource['MaterialRun'], GEMDMaterialRun):
         return '<Material run {!r}>'.format(self.name)
 
 
+def build_history(data: dict, *, index: Optional[dict] = None) -> MaterialRun:
+    """
+    Build a material history from the root and context returned by the platform.
+
+    Objects found in `index`, keyed by lower-case scope and uid, are used as they are instead
+    of being built again, and the objects that are built are added to it.
+    """
+    objects = data['context'] + [data['root']]
+    if index is not None:
+        objects = [x for x in objects
+                   if not any((scope.lower(), uid) in index for scope, uid in x['uids'].items())]
+
+    # Add the root to the context and sort by writable order
+    blob = dict()
+    blob["context"] = sorted(objects, key=lambda x: writable_sort_order(x["type"]))
+    terminal_scope, terminal_id = next(iter(data['root']['uids'].items()))
+    # Add a link to the root as the "object"
+    blob["object"] = LinkByUID(scope=terminal_scope, id=terminal_id).as_dict()
+
+    # Build the context in order, resolving links to objects built earlier, in order to
+    # rebuild the material history
+    return MaterialRun.get_json_support().build(blob, index=index)["object"]
+
+
 class MaterialRunCollection(ObjectRunCollection[MaterialRun]):
     """Represents the collection of all material runs associated with a dataset."""
 
@@ -110,7 +134,8 @@ class MaterialRunCollection(ObjectRunCollection[MaterialRun]):
         return MaterialRun
 
     def get_history(self, *, id: Union[str, UUID, LinkByUID, MaterialRun],
-                    scope: Optional[str] = None) -> Type[MaterialRun]:
+                    scope: Optional[str] = None,
+                    cache: Optional[HistoryCache] = None) -> Type[MaterialRun]:
         """
         Get the history associated with a terminal material.
 
@@ -126,6 +151,9 @@ class MaterialRunCollection(ObjectRunCollection[MaterialRun]):
             [DEPRECATED] use a LinkByUID to specify a custom scope
             The scope of the uid. The lookup will be most efficient if you use the Citrine ID
             of the material, which is the default if scope=None.
+        cache: Optional[HistoryCache]
+            Cache to reuse histories from, instead of the ``history_cache`` of the session.
+            Histories are always fetched if neither is set.
 
         Returns
         -------
@@ -136,24 +164,78 @@ class MaterialRunCollection(ObjectRunCollection[MaterialRun]):
 
         """
         link = _make_link_by_uid(id, scope)
+        if cache is None:
+            cache = self.session.history_cache
+        if not isinstance(cache, HistoryCache):
+            return build_history(self._fetch_history(link))
+
+        key = HistoryCache.key(self.project_id, link)
+        stamp = None
+        if cache.validate:
+            path = self._get_path(ignore_dataset=True) \
+                + format_escaped_url("/{}/{}", link.scope, link.id)
+            stamp = root_stamp(self.session.get_resource(path))
+        history = cache.get(key, stamp=stamp)
+        if history is None:
+            data = self._fetch_history(link)
+            history = build_history(data)
+            cache.put(key, data, history)
+        return history
+
+    def get_histories(self, ids: Iterable[Union[str, UUID, LinkByUID, MaterialRun]], *,
+                      max_workers: int = 4) -> Iterator[MaterialRun]:
+        """
+        Get the histories of many terminal materials, fetching several at a time.
+
+        Histories are yielded as they arrive, so not necessarily in the order of `ids`; each
+        is identified by the uids of its terminal material. Objects that appear in more than
+        one history, such as the templates, specs and processes that many materials share,
+        are built once and shared between the histories, so that they only take up memory
+        once. An object is built from the first history it appears in.
+
+        Parameters
+        ----------
+        ids: Iterable[Union[UUID, str, LinkByUID, MaterialRun]]
+            Representations of the materials whose histories are to be retrieved. They are
+            read as the histories are fetched, so this can be a generator.
+        max_workers: int
+            Largest number of histories to fetch at once. With 1, they are fetched one by one.
+
+        Returns
+        -------
+        Iterator[MaterialRun]
+            The histories, each like the result of :func:`get_history`
+
+        """
+        index = dict()
+        links = (_make_link_by_uid(id) for id in ids)
+        if max_workers <= 1:
+            for link in links:
+                yield build_history(self._fetch_history(link), index=index)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        in_flight = set()
+        try:
+            for link in links:
+                in_flight.add(executor.submit(self._fetch_history, link))
+                if len(in_flight) >= max_workers:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield build_history(future.result(), index=index)
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield build_history(future.result(), index=index)
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _fetch_history(self, link: LinkByUID) -> dict:
         base_path = os.path.dirname(self._get_path(ignore_dataset=True))
         path = base_path + format_escaped_url("/material-history/{}/{}", link.scope, link.id)
-        data = self.session.get_resource(path)
-
-        # Add the root to the context and sort by writable order
-        blob = dict()
-        blob["context"] = sorted(
-            data['context'] + [data['root']],
-            key=lambda x: writable_sort_order(x["type"])
-        )
-        terminal_scope, terminal_id = next(iter(data['root']['uids'].items()))
-        # Add a link to the root as the "object"
-        blob["object"] = LinkByUID(scope=terminal_scope, id=terminal_id)
-
-        # Serialize using normal json (with the GEMDEncoder) and then deserialize with the
-        # GEMDEncoder encoder in order to rebuild the material history
-        return MaterialRun.get_json_support().loads(
-            json.dumps(blob, cls=GEMDEncoder, sort_keys=True))
+        return self.session.get_resource(path)
 
     def get_by_process(self,
                        uid: Union[UUID, str, LinkByUID, GEMDProcessRun], *,
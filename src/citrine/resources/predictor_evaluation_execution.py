@@ -9,6 +9,7 @@ from citrine._rest.resource import ResourceRef
 from citrine._session import Session
 from citrine._utils.functions import migrate_deprecated_argument, shadow_classes_in_module, \
     format_escaped_url
+from citrine.deduplication import Deduplicator
 from citrine.informatics.executions import PredictorEvaluationExecution
 import citrine.informatics.executions.predictor_evaluation_execution
 from citrine.resources.response import Response
@@ -97,7 +98,9 @@ class PredictorEvaluationExecutionCollection(Collection["PredictorEvaluationExec
              *,
              page: Optional[int] = None,
              per_page: int = 100,
-             predictor_id: Optional[UUID] = None
+             predictor_id: Optional[UUID] = None,
+             max_workers: int = 1,
+             deduplicate: Union[bool, Deduplicator] = True
              ) -> Iterator[PredictorEvaluationExecution]:
         """
         Paginate over the elements of the collection.
@@ -116,6 +119,16 @@ class PredictorEvaluationExecutionCollection(Collection["PredictorEvaluationExec
             is specified it limits the maximum number of elements in the response.
         predictor_id: uuid, optional
             list executions that targeted the predictor with this id
+        max_workers: int, optional
+            Number of pages to fetch concurrently. Default is 1, which fetches one page at a
+            time. Larger values fetch a sliding window of pages in parallel, which speeds up
+            listing long collections at the cost of a few requests past the final page.
+        deduplicate: Union[bool, Deduplicator], optional
+            How to skip elements that appear more than once, such as when an element moves
+            across a page boundary while listing. Default is True, which remembers every uid
+            yielded. A :class:`~citrine.deduplication.WindowDeduplicator` or
+            :class:`~citrine.deduplication.BloomDeduplicator` bounds the memory used for
+            very long listings. False yields every element as received.
 
         Returns
         -------
@@ -133,7 +146,9 @@ class PredictorEvaluationExecutionCollection(Collection["PredictorEvaluationExec
         return self._paginator.paginate(page_fetcher=fetcher,
                                         collection_builder=self._build_collection_elements,
                                         page=page,
-                                        per_page=per_page)
+                                        per_page=per_page,
+                                        max_workers=max_workers,
+                                        deduplicate=deduplicate)
 
     def delete(self, uid: Union[UUID, str]) -> Response:
         """Predictor Evaluation Executions cannot be deleted; they can be archived instead."""
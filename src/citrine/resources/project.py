@@ -11,6 +11,7 @@ from citrine._rest.resource import Resource, ResourceTypeEnum
 from citrine._serialization import properties
 from citrine._utils.functions import format_escaped_url
 from citrine._session import Session
+from citrine.deduplication import Deduplicator
 from citrine.resources.api_error import ApiError
 from citrine.resources.condition_template import ConditionTemplateCollection
 from citrine.resources.dataset import DatasetCollection
@@ -555,7 +556,9 @@ class ProjectCollection(Collection[Project]):
 
     def list(self, *,
              page: Optional[int] = None,
-             per_page: int = 1000) -> Iterator[Project]:
+             per_page: int = 1000,
+             max_workers: int = 1,
+             deduplicate: Union[bool, Deduplicator] = True) -> Iterator[Project]:
         """
         List projects using pagination.
 
@@ -571,6 +574,16 @@ class ProjectCollection(Collection[Project]):
             Max number of results to return per page. Default is 1000.  This parameter
             is used when making requests to the backend service.  If the page parameter
             is specified it limits the maximum number of elements in the response.
+        max_workers: int, optional
+            Number of pages to fetch concurrently. Default is 1, which fetches one page at a
+            time. Larger values fetch a sliding window of pages in parallel, which speeds up
+            listing long collections at the cost of a few requests past the final page.
+        deduplicate: Union[bool, Deduplicator], optional
+            How to skip elements that appear more than once, such as when an element moves
+            across a page boundary while listing. Default is True, which remembers every uid
+            yielded. A :class:`~citrine.deduplication.WindowDeduplicator` or
+            :class:`~citrine.deduplication.BloomDeduplicator` bounds the memory used for
+            very long listings. False yields every element as received.
 
         Returns
         -------
@@ -578,7 +591,8 @@ class ProjectCollection(Collection[Project]):
             Projects in this collection.
 
         """
-        return super().list(page=page, per_page=per_page)
+        return super().list(page=page, per_page=per_page, max_workers=max_workers,
+                            deduplicate=deduplicate)
 
     def search(self, *, search_params: Optional[dict] = None,
                per_page: int = 1000) -> Iterable[Project]:
@@ -0,0 +1,176 @@
+"""A local record of the batches written by a bulk registration, so that it can be resumed."""
+import json
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Set, Union
+
+from gemd.entity.base_entity import BaseEntity
+
+from citrine._serialization.payload import PayloadWriter
+from citrine._utils.write_schedule import direct_links
+from citrine.resources.content_hash import content_hash
+from citrine.resources.data_concepts import CITRINE_SCOPE
+
+
+class _ContentKeys(PayloadWriter):
+    """
+    Names objects by what they are, so that they can be recognized when they are built again.
+
+    An object with uids is named by its uids. One without is named by a hash of its content,
+    in which the objects it links to are named in the same way.
+    """
+
+    def __init__(self):
+        super().__init__(scope='')
+        # Keyed by id, holding on to each object so that its id is not reused
+        self._keys: Dict[int, tuple] = {}
+
+    def ensure_uid(self, entity: BaseEntity) -> None:
+        """Leave objects without uids as they are."""
+
+    def link(self, entity: BaseEntity) -> dict:
+        """Serialize a link to an object as its name, which must already be known."""
+        return {'key': self.key(entity)}
+
+    def key(self, entity: BaseEntity) -> str:
+        """Name an object by its uids, or by its content if it has none."""
+        if entity.uids:
+            return 'uids:' + json.dumps(sorted(entity.uids.items()))
+        # Name the objects this one links to first, without recursing through long histories
+        stack = [entity]
+        visiting = {id(entity)}
+        while stack:
+            top = stack[-1]
+            if id(top) in self._keys:
+                stack.pop()
+                continue
+            unnamed = [x for x in direct_links(top)
+                       if not x.uids and id(x) not in self._keys and id(x) not in visiting]
+            if unnamed:
+                stack.extend(unnamed)
+                visiting.update(id(x) for x in unnamed)
+            else:
+                stack.pop()
+                self._keys[id(top)] = (top, self._content_key(top))
+        return self._keys[id(entity)][1]
+
+    def _content_key(self, entity: BaseEntity) -> str:
+        body = self.dump(entity)
+        # Only objects without uids are named by their content, so the field is always empty
+        body.pop('uids', None)
+        return 'content:' + content_hash(body)
+
+
+def journal_keys(models: Sequence[BaseEntity]) -> List[str]:
+    """
+    Name each of a list of objects, so that it can be found in a journal by a later run.
+
+    Objects with uids are named by them. Objects without are named by their content, and the
+    second and later of several identical objects are told apart by their position.
+    """
+    namer = _ContentKeys()
+    keys = []
+    seen: Dict[str, int] = {}
+    for model in models:
+        key = namer.key(model)
+        seen[key] = seen.get(key, 0) + 1
+        keys.append(key if seen[key] == 1 else '{}#{}'.format(key, seen[key]))
+    return keys
+
+
+class WriteJournal:
+    """
+    An append-only record of the batches written by a bulk registration.
+
+    Before a batch is sent, a line is appended with a name for each object in it and the uids
+    it is sent with, including the Citrine ids given to new objects. Once the server has
+    accepted the batch, another line records the ids it acknowledged. Every line is flushed to
+    disk before moving on, so the journal survives the process dying at any point.
+
+    When a registration is run again with the same journal, objects in batches that were
+    accepted are not sent again, and every object that was sent before gets back the uids it
+    was sent with, so that re-sending it updates the same object rather than creating a
+    duplicate. Objects are recognized by their uids, or by their content if they had none.
+
+    .. code-block:: python
+
+        dataset.register_all(models, journal='load.jsonl')
+
+    Parameters
+    ----------
+    path: Union[str, Path]
+        Location of the journal, which is a file of JSON lines. It is created if it does not
+        exist, and appended to if it does.
+
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = Lock()
+        self._uids: Dict[str, dict] = {}
+        self._committed: Set[str] = set()
+        self._batches = 0
+        pending: Dict[int, List[str]] = {}
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # The last line is incomplete if a write was interrupted
+                    batch = entry['batch']
+                    self._batches = max(self._batches, batch + 1)
+                    if entry['status'] == 'submitted':
+                        pending[batch] = entry['keys']
+                        self._uids.update(zip(entry['keys'], entry['uids']))
+                    else:
+                        self._acknowledge(pending.pop(batch, []), entry['ids'])
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def uids(self, key: str) -> Optional[dict]:
+        """The uids an object was last sent with, if it has been sent."""
+        return self._uids.get(key)
+
+    def committed(self, key: str) -> bool:
+        """Whether an object was in a batch that the server accepted."""
+        return key in self._committed
+
+    def submitted(self, keys: List[str], models: List[BaseEntity]) -> int:
+        """Record that a batch of objects is about to be sent, and return its number."""
+        uids = [dict(model.uids) for model in models]
+        with self._lock:
+            batch = self._batches
+            self._batches += 1
+            self._uids.update(zip(keys, uids))
+            self._append({'batch': batch, 'status': 'submitted', 'keys': keys, 'uids': uids})
+        return batch
+
+    def committed_batch(self, batch: int, keys: List[str], registered: List[BaseEntity]) -> None:
+        """Record that the server accepted a batch, with the ids it acknowledged."""
+        ids = [model.uids.get(CITRINE_SCOPE) if isinstance(model, BaseEntity) else None
+               for model in registered]
+        with self._lock:
+            self._acknowledge(keys, ids)
+            self._append({'batch': batch, 'status': 'committed', 'ids': ids})
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _acknowledge(self, keys: List[str], ids: List[Optional[str]]) -> None:
+        self._committed.update(keys)
+        for key, citrine_id in zip(keys, ids):
+            if citrine_id is not None:
+                self._uids[key] = {**self._uids.get(key, {}), CITRINE_SCOPE: citrine_id}
+
+    def _append(self, entry: dict) -> None:
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
@@ -0,0 +1,88 @@
+import copy
+import json
+from uuid import uuid4
+
+from gemd.entity.attribute import Property
+from gemd.entity.link_by_uid import LinkByUID
+from gemd.entity.object import MaterialRun as GEMDMaterialRun, ProcessRun as GEMDProcessRun
+from gemd.entity.value import NominalReal
+from gemd.json import GEMDEncoder
+
+from citrine._serialization.gemd_builder import GEMDBuilder
+from citrine.resources.data_concepts import DataConcepts
+from citrine.resources.ingredient_run import IngredientRun
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.measurement_run import MeasurementRun
+from citrine.resources.process_run import ProcessRun
+
+
+def _history():
+    """A serialized history of two processes, as a list of objects and a link to the root."""
+    first = MaterialRun("first", uids={'id': str(uuid4())},
+                        process=ProcessRun("make first", uids={'id': str(uuid4())}))
+    process = ProcessRun("make second", uids={'id': str(uuid4())})
+    IngredientRun(uids={'id': str(uuid4())}, material=first, process=process)
+    second = MaterialRun("second", uids={'id': str(uuid4())}, process=process, tags=["a::b"])
+    MeasurementRun("density", uids={'id': str(uuid4())}, material=second,
+                   properties=[Property("density", value=NominalReal(1.5, "g/cm^3"))])
+    return json.loads(DataConcepts.get_json_support().dumps(second))
+
+
+def test_build_matches_round_trip():
+    support = DataConcepts.get_json_support()
+    data = _history()
+    original = copy.deepcopy(data)
+
+    built = support.build(data)
+    expected = support.loads(json.dumps(data, cls=GEMDEncoder, sort_keys=True))
+
+    assert data == original
+    root = built['object']
+    assert isinstance(root, MaterialRun)
+    assert root.dump() == expected.dump()
+    # Links to objects in the context are resolved to the objects themselves
+    assert isinstance(root.process, ProcessRun)
+    assert [type(i) for i in root.process.ingredients] == \
+        [type(i) for i in expected.process.ingredients]
+    assert [m.name for m in root.measurements] == [m.name for m in expected.measurements]
+
+
+def test_build_unresolved_links():
+    data = MaterialRun("lonely", process=LinkByUID('id', str(uuid4()))).dump()
+    built = DataConcepts.build(data)
+    assert isinstance(built, MaterialRun)
+    assert isinstance(built.process, LinkByUID)
+
+
+def test_build_falls_back_for_objects():
+    run = MaterialRun("already built", uids={'id': str(uuid4())})
+    copied = DataConcepts.build(run)
+    assert copied is not run
+    assert copied.dump() == run.dump()
+
+    support = DataConcepts.get_json_support()
+    nested = {'objects': [run]}
+    assert support.build(nested)['objects'][0].name == "already built"
+    assert nested['objects'][0] is run
+    assert support.build({1: 'not a json key'}) == {'1': 'not a json key'}
+    assert support.build(('a', 1.0, None, True)) == ['a', 1.0, None, True]
+
+
+def test_build_ignores_unexpected_fields(caplog):
+    value = {'type': 'nominal_real', 'nominal': 2.0, 'units': 'm', 'color': 'blue'}
+    built = DataConcepts.get_json_support().build(value)
+    assert built.nominal == 2.0
+    assert 'color' in caplog.text
+
+
+def test_build_plain_gemd_objects():
+    support = GEMDBuilder()
+    process = GEMDProcessRun("make", uids={'id': str(uuid4())})
+    data = json.loads(support.dumps(GEMDMaterialRun("made", process=process,
+                                                    uids={'id': str(uuid4())})))
+
+    # Entities with the generic from_dict are indexed, so that links to them are resolved
+    built = support.build(data)['object']
+    assert type(built) is GEMDMaterialRun
+    assert type(built.process) is GEMDProcessRun
+    assert built.process.output_material is built
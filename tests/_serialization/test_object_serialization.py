@@ -2,7 +2,9 @@ import pytest
 from typing import Any
 
 from citrine._serialization.serializable import Serializable
-from citrine._serialization.properties import String, Object, Optional
+from citrine._serialization.properties import (
+    Integer, List, Mapping, String, Object, Optional, lazy_deserialization, slots
+)
 from gemd.entity.value.base_value import BaseValue
 from gemd.entity.value.nominal_real import NominalReal
 
@@ -61,3 +63,136 @@ def test_bad_object_serde():
 
 def test_object_str_representation():
     assert "<Object[NominalReal] 'foo'>" == str(Object(NominalReal, 'foo'))
+
+
+class PlanClass(Serializable):
+    """A class whose fields exercise the compiled serialization plan."""
+    nested = String('a.b.c')
+    read_only = String('read_only', serializable=False, default='ro')
+    write_only = String('write_only', deserializable=False, default='wo')
+
+    def __init__(self, nested: str):
+        self.nested = nested
+
+
+class ShoutingString(String):
+    """A property that customizes how it is read from a dictionary."""
+    def deserialize_from_dict(self, data: dict) -> str:
+        return super().deserialize_from_dict(data).upper()
+
+
+class CustomClass(Serializable):
+    shout = ShoutingString('shout')
+    whisper = ShoutingString('whisper.text', default='hush')
+
+    def __init__(self):
+        pass
+
+
+def test_object_property_is_shared():
+    assert Object.of(PlanClass) is Object.of(PlanClass)
+    assert Object.of(PlanClass) is not Object.of(SampleClass)
+    assert Object.of(PlanClass).plan is Object.of(PlanClass).plan
+
+
+def test_compiled_plan():
+    obj = PlanClass.build({'a': {'b': {'c': 'deep'}}, 'read_only': 'given', 'write_only': 'no'})
+    assert obj.nested == 'deep'
+    assert obj.read_only == 'given'
+    assert obj.write_only == 'wo'
+    assert obj.dump() == {'a': {'b': {'c': 'deep'}}, 'write_only': 'wo'}
+
+    with pytest.raises(RuntimeError, match='missing a required field: b'):
+        PlanClass.build({'a': {}})
+
+
+class NoPathClass(Serializable):
+    unnamed = String()
+
+    def __init__(self):
+        pass
+
+
+def test_plan_respects_custom_properties():
+    assert CustomClass.build({'shout': 'hi'}).shout == 'HI'
+    # The defaults and required fields of custom properties are checked by the property
+    assert CustomClass.build({'shout': 'hi', 'whisper': {}}).whisper == 'HUSH'
+    with pytest.raises(RuntimeError, match='missing a required field: shout'):
+        CustomClass.build({'whisper': {'text': 'psst'}})
+
+    obj = NoPathClass()
+    obj.unnamed = 'x'
+    with pytest.raises(ValueError, match='No serialization path set'):
+        obj.dump()
+    with pytest.raises(AttributeError):
+        NoPathClass.build({})
+
+
+class LeafClass(Serializable):
+    value = Integer('value')
+
+    def __init__(self):
+        pass
+
+
+class TreeClass(Serializable):
+    name = String('name')
+    leaves = List(Object(LeafClass), 'leaves')
+    by_name = Mapping(String, Object(LeafClass), 'by_name', default={})
+    child = Optional(Object(LeafClass), 'child')
+
+    def __init__(self):
+        pass
+
+
+def test_lazy_deserialization():
+    data = {'name': 'tree', 'leaves': [{'value': 1}, {'value': 'two'}], 'child': None}
+    with lazy_deserialization():
+        tree = TreeClass.build(data)
+
+    # Scalars, nulls and defaults are set eagerly; nested containers are left raw
+    assert tree.name == 'tree'
+    assert tree.child is None
+    assert tree.by_name == {}
+
+    # The invalid leaf didn't fail the build; it fails the first read, and the result
+    # of a successful read is kept
+    with pytest.raises(ValueError):
+        tree.leaves
+    data['leaves'][1]['value'] = 2
+    leaves = tree.leaves
+    assert [leaf.value for leaf in leaves] == [1, 2]
+    assert tree.leaves is leaves
+    assert tree.dump() == TreeClass.build(data).dump()
+
+
+def test_lazy_deserialization_is_scoped():
+    data = {'name': 'tree', 'leaves': [{'value': 'bad'}], 'child': None}
+    with lazy_deserialization():
+        TreeClass.build(data)
+    with pytest.raises(ValueError):
+        TreeClass.build(data)
+
+
+class CompactClass(Serializable['CompactClass']):
+    __slots__ = slots('name', 'leaves')
+
+    name = String('name')
+    leaves = List(Object(LeafClass), 'leaves', default=[])
+
+    def __init__(self):
+        pass
+
+
+def test_compact_class():
+    obj = CompactClass.build({'name': 'compact', 'leaves': [{'value': 1}]})
+    assert not hasattr(obj, '__dict__')
+    assert obj.name == 'compact'
+    assert obj.dump() == {'name': 'compact', 'leaves': [{'value': 1}]}
+    with pytest.raises(AttributeError):
+        obj.other = 'not a property'
+
+    with lazy_deserialization():
+        lazy = CompactClass.build({'name': 'compact', 'leaves': [{'value': 2}]})
+    assert lazy.leaves[0].value == 2
+    assert CompactClass.build({'name': 'compact'}).leaves == []
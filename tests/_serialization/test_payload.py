@@ -0,0 +1,117 @@
+from uuid import uuid4
+
+import pytest
+from gemd.entity.attribute import Condition, Property, PropertyAndConditions
+from gemd.entity.bounds import RealBounds
+from gemd.entity.link_by_uid import LinkByUID
+from gemd.entity.object import MaterialSpec as GEMDMaterialSpec, ProcessSpec as GEMDProcessSpec
+from gemd.entity.value import NominalReal
+from gemd.enumeration import Origin, SampleType
+from gemd.json import GEMDJson
+from gemd.util import recursive_foreach
+
+from citrine._serialization.payload import PayloadWriter
+from citrine._utils.functions import replace_objects_with_links, scrub_none
+from citrine.resources.condition_template import ConditionTemplate
+from citrine.resources.data_concepts import CITRINE_SCOPE
+from citrine.resources.ingredient_run import IngredientRun
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.material_spec import MaterialSpec
+from citrine.resources.measurement_run import MeasurementRun
+from citrine.resources.process_run import ProcessRun
+from citrine.resources.process_spec import ProcessSpec
+from citrine.resources.property_template import PropertyTemplate
+
+
+def make_models():
+    """A short history, with attributes, templates, specs and links in several scopes."""
+    temperature = ConditionTemplate("temperature", bounds=RealBounds(0, 1000, "K"),
+                                    uids={'custom': 'temperature', 'id': str(uuid4())})
+    density = PropertyTemplate("density", bounds=RealBounds(0, 100, "g/cm^3"),
+                               uids={'custom': 'density'})
+    process_spec = ProcessSpec("mixing")
+    material_spec = MaterialSpec("mixture", process=process_spec)
+    first = MaterialRun("first", spec=LinkByUID('custom', 'spec'), notes=None)
+    process = ProcessRun("mix", spec=process_spec, tags=["a", "b"],
+                         conditions=[Condition("temperature", template=temperature,
+                                               value=NominalReal(300, "K"), notes=None)])
+    material = MaterialRun("second", process=process, spec=material_spec,
+                           uids={'custom': 'second'})
+    measurement = MeasurementRun("density", material=material,
+                                 properties=[Property("density", template=density,
+                                                      value=NominalReal(1.0, "g/cm^3"))])
+    ingredient = IngredientRun(material=first, process=process)
+    return [process, first, material, measurement, ingredient]
+
+
+def prepare_in_passes(models, scope):
+    """How payloads were prepared before PayloadWriter."""
+    json = GEMDJson(scope=scope)
+    [json.dumps(x) for x in models]
+    return [replace_objects_with_links(scrub_none(model.dump())) for model in models]
+
+
+@pytest.mark.parametrize("scope", [CITRINE_SCOPE, 'temporary'])
+def test_same_payload_as_separate_passes(scope):
+    models = make_models()
+    writer = PayloadWriter(scope=scope)
+    payloads = [writer.dump(model) for model in models]
+
+    # Every object now has a uid, so the old passes assign none and see the same graph
+    assert payloads == prepare_in_passes(models, scope)
+
+
+def test_gemd_objects():
+    process = GEMDProcessSpec("process", notes=None)
+    material = GEMDMaterialSpec("material", process=process,
+                                properties=[PropertyAndConditions(
+                                    Property("density", value=NominalReal(1.0, "g/cm^3")))])
+    writer = PayloadWriter(scope='temporary')
+    payloads = [writer.dump(process), writer.dump(material)]
+
+    assert payloads[1]['process'] == {'type': 'link_by_uid', 'scope': 'temporary',
+                                      'id': process.uids['temporary']}
+    assert payloads == prepare_in_passes([process, material], 'temporary')
+
+
+def test_links_and_enumerations():
+    process = GEMDProcessSpec("process", uids={'custom': 'process'})
+    writer = PayloadWriter(scope='temporary')
+
+    # Without a Citrine id, links use the scope there is
+    payload = writer.dump(GEMDMaterialSpec("spec", process=process))
+    assert payload['process'] == {'type': 'link_by_uid', 'scope': 'custom', 'id': 'process'}
+    assert writer.encode({'origin': Origin.MEASURED, 'tags': (SampleType.VIRTUAL,)}) == \
+        {'origin': 'measured', 'tags': ['virtual']}
+
+
+def test_objects_are_linked_not_dumped():
+    process, first, material, measurement, ingredient = make_models()
+    writer = PayloadWriter(scope='temporary')
+    payload = writer.dump(measurement)
+
+    assert payload['material'] == {'type': 'link_by_uid', 'scope': 'custom', 'id': 'second'}
+    template = payload['properties'][0]['template']
+    assert template == {'type': 'link_by_uid', 'scope': 'custom', 'id': 'density'}
+    assert 'notes' not in payload
+
+    condition = writer.dump(process)['conditions'][0]
+    assert condition['template']['scope'] == CITRINE_SCOPE  # the Citrine id is preferred
+    assert 'notes' not in condition
+
+
+def test_assigned_uids_are_consistent_and_removable():
+    process, first, material, measurement, ingredient = make_models()
+    writer = PayloadWriter(scope='temporary')
+    ingredient_payload = writer.dump(ingredient)
+    first_payload = writer.dump(first)
+
+    # `first` got its uid when the ingredient linked to it, and keeps it for its own payload
+    assert ingredient_payload['material']['id'] == first_payload['uids']['temporary']
+    assert ingredient in writer.assigned and first in writer.assigned
+    assert material not in writer.assigned
+
+    writer.remove_assigned_uids()
+    seen = []
+    recursive_foreach([process, first, material, measurement, ingredient], seen.append)
+    assert seen and all('temporary' not in entity.uids for entity in seen)
@@ -275,3 +275,45 @@ def test_set_serialize_unsortable():
     serialized = Set(Object(PredictorEvaluationMetric)).serialize(data)
     for metric in data:
         assert metric.dump() in serialized
+
+
+def test_override_base_class_resolved_once(monkeypatch):
+    """The parent class to defer to is looked up once per class, not on every access."""
+    import citrine._serialization.properties as properties
+
+    class Base:
+        def __init__(self):
+            self._label = None
+
+        @property
+        def label(self):
+            return self._label
+
+        @label.setter
+        def label(self, value):
+            self._label = value.upper()
+
+    class Child(Base):
+        label = String('label', override=True)
+
+    lookups = []
+    find_base_class = properties._find_base_class
+    monkeypatch.setattr(properties, '_find_base_class',
+                        lambda clazz, key: lookups.append(clazz) or find_base_class(clazz, key))
+
+    first, second = Child(), Child()
+    first.label = 'foo'
+    second.label = 'bar'
+    assert (first.label, second.label) == ('FOO', 'BAR')
+    assert lookups == [Child]
+
+
+def test_set_underlying_type_skips_deserialize(monkeypatch):
+    """Values that already have the underlying type are stored without deserializing."""
+    class Holder:
+        value = Float('value')
+
+    monkeypatch.setattr(Float, 'deserialize', lambda *args, **kwargs: pytest.fail())
+    holder = Holder()
+    holder.value = 1.5
+    assert holder.value == 1.5
@@ -0,0 +1,50 @@
+import numpy as np
+
+from citrine._utils.columns import ColumnBuilder, candidate_columns, to_frame
+
+
+def test_column_builder_fills_missing_values():
+    builder = ColumnBuilder()
+    builder.add({'x': 1.0, 'name': 'a'})
+    builder.add({'y': 2, 'name': None})
+    builder.add({'x': 3.0, 'y': None})
+    arrays = builder.to_arrays(order=['y', 'missing'])
+
+    assert list(arrays) == ['y', 'x', 'name']
+    np.testing.assert_array_equal(arrays['x'], [1.0, np.nan, 3.0])
+    np.testing.assert_array_equal(arrays['y'], [np.nan, 2.0, np.nan])
+    assert arrays['x'].dtype == np.float64
+    assert arrays['name'].dtype == object
+    assert list(arrays['name']) == ['a', None, None]
+
+
+def test_column_builder_booleans_are_objects():
+    builder = ColumnBuilder(fill=0.0)
+    builder.add({'flag': True, 'x': 1})
+    builder.add({'flag': False})
+    arrays = builder.to_arrays()
+    assert list(arrays['flag']) == [True, False]
+    np.testing.assert_array_equal(arrays['x'], [1.0, 0.0])
+
+
+def test_candidate_columns(example_candidates):
+    candidate = example_candidates['response'][0]
+    arrays = candidate_columns([candidate, candidate], start_rank=5)
+
+    assert list(arrays)[:3] == ['material_id', 'rank', 'primary_score']
+    np.testing.assert_array_equal(arrays['rank'], [5, 6])
+    assert arrays['rank'].dtype == np.int64
+    np.testing.assert_array_equal(arrays['Temperature.mean'], [475.8, 475.8])
+    np.testing.assert_array_equal(arrays['Temperature.std'], [0.0, 0.0])
+    np.testing.assert_array_equal(arrays['Flour.flour'], [100.0, 100.0])
+    np.testing.assert_array_equal(arrays['Water.water'], [72.5, 72.5])
+    assert list(arrays['Salt.formula']) == ['NaCl', 'NaCl']
+    assert arrays['Yeast.smiles'].dtype == object
+
+    assert candidate_columns([]) == {}
+
+
+def test_to_frame(example_candidates):
+    frame = to_frame(candidate_columns(example_candidates['response']))
+    assert list(frame.columns)[:3] == ['material_id', 'rank', 'primary_score']
+    assert frame['Temperature.mean'][0] == 475.8
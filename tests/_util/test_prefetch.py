@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+from citrine._utils.prefetch import prefetch
+
+
+def test_prefetch_preserves_order():
+    assert list(prefetch(iter(range(100)), depth=3)) == list(range(100))
+    assert list(prefetch([], depth=1)) == []
+
+
+def test_prefetch_is_lazy_and_bounded():
+    produced = []
+
+    def source():
+        for i in range(20):
+            produced.append(i)
+            yield i
+
+    items = prefetch(source(), depth=2)
+    time.sleep(0.05)
+    assert produced == []  # nothing happens until iteration begins
+
+    assert next(items) == 0
+    time.sleep(0.2)
+    # Two items are buffered and the producer is blocked trying to hand over a third
+    assert len(produced) <= 4
+    items.close()
+
+
+def test_prefetch_reads_ahead():
+    def slow_source():
+        for i in range(5):
+            time.sleep(0.05)
+            yield i
+
+    start = time.perf_counter()
+    for _ in prefetch(slow_source(), depth=1):
+        time.sleep(0.05)  # consuming takes as long as producing
+    elapsed = time.perf_counter() - start
+    # Serially this would take 0.5s; with read-ahead the two halves overlap
+    assert elapsed < 0.45
+
+
+def test_prefetch_propagates_errors():
+    def failing():
+        yield 1
+        raise KeyError('boom')
+
+    items = prefetch(failing(), depth=1)
+    assert next(items) == 1
+    with pytest.raises(KeyError):
+        next(items)
+
+
+def test_prefetch_stops_producer_when_closed():
+    def endless():
+        i = 0
+        while True:
+            yield i
+            i += 1
+
+    before = threading.active_count()
+    items = prefetch(endless(), depth=1)
+    assert next(items) == 0
+    items.close()
+    deadline = time.time() + 5
+    while threading.active_count() > before and time.time() < deadline:
+        time.sleep(0.05)
+    assert threading.active_count() == before
+
+
+def test_prefetch_depth_must_be_positive():
+    with pytest.raises(ValueError):
+        prefetch([1, 2], depth=0)
@@ -0,0 +1,121 @@
+from gemd.entity.attribute import Condition
+from gemd.entity.bounds import RealBounds
+from gemd.entity.value import NominalReal
+
+from citrine._utils import write_schedule
+from citrine._utils.write_schedule import BatchSizer, WriteSchedule, direct_links, \
+    type_order
+from citrine.resources.condition_template import ConditionTemplate
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.measurement_run import MeasurementRun
+from citrine.resources.process_run import ProcessRun
+from citrine.resources.process_spec import ProcessSpec
+
+
+def test_direct_links():
+    template = ConditionTemplate("temperature", bounds=RealBounds(0, 1000, "K"))
+    spec = ProcessSpec("spec")
+    process = ProcessRun("process", spec=spec,
+                         conditions=[Condition("temperature", template=template,
+                                               value=NominalReal(300, "K"))])
+    material = MaterialRun("material", process=process)
+    measurement = MeasurementRun("measurement", material=material)
+
+    assert {id(x) for x in direct_links(process)} == {id(spec), id(template)}
+    # Links back from a process to its output, or a material to its measurements, are skipped
+    assert [id(x) for x in direct_links(material)] == [id(process)]
+    assert [id(x) for x in direct_links(measurement)] == [id(material)]
+
+
+def test_batches_wait_only_for_their_links():
+    processes = [ProcessRun("process {}".format(i)) for i in range(4)]
+    materials = [MaterialRun("material {}".format(i), process=process)
+                 for i, process in enumerate(processes)]
+    schedule = WriteSchedule(materials + processes, batch_size=2)
+
+    first = schedule.take(1, idle=True)
+    assert first == [[4, 5]]
+    assert schedule.take(5, idle=False) == [[6, 7]]
+    schedule.written(first[0])
+    # The materials made by the first two processes are ready, even though the others aren't
+    assert schedule.take(5, idle=False) == [[0, 1]]
+    assert schedule.take(5, idle=False) == []
+    schedule.written([6, 7])
+    schedule.written([0, 1])
+    assert schedule.take(5, idle=False) == [[2, 3]]
+    schedule.written([2, 3])
+    assert schedule.done
+    assert type_order(materials + processes) == [4, 5, 6, 7, 0, 1, 2, 3]
+
+
+def test_partial_batches_wait_for_the_rest_of_their_type():
+    processes = [ProcessRun("process {}".format(i)) for i in range(3)]
+    materials = [MaterialRun("material {}".format(i), process=process)
+                 for i, process in enumerate(processes)]
+    schedule = WriteSchedule(processes[:2] + materials + processes[2:], batch_size=5)
+
+    assert schedule.take(5, idle=True) == [[0, 1, 5]]
+    schedule.written([0, 1, 5])
+    assert schedule.take(5, idle=True) == [[2, 3, 4]]
+
+
+def test_cycles_are_broken_when_idle(monkeypatch):
+    first, second = ProcessSpec("first"), ProcessSpec("second")
+    links = {id(first): [second], id(second): [first]}
+    monkeypatch.setattr(write_schedule, 'direct_links', lambda model: links[id(model)])
+    schedule = WriteSchedule([first, second])
+
+    assert schedule.take(5, idle=False) == []
+    batch, = schedule.take(5, idle=True)
+    assert sorted(batch) == [0, 1]
+    schedule.written(batch)
+    assert schedule.done
+
+
+def test_cycles_are_broken_for_partial_batches(monkeypatch):
+    first, second, third = ProcessSpec("first"), ProcessSpec("second"), ProcessSpec("third")
+    links = {id(first): [second], id(second): [first], id(third): []}
+    monkeypatch.setattr(write_schedule, 'direct_links', lambda model: links[id(model)])
+    schedule = WriteSchedule([first, second, third])
+
+    # The one ready object waits for the rest of its type, until nothing else can be written
+    assert schedule.take(5, idle=False) == []
+    assert schedule.take(5, idle=True) == [[2]]
+    schedule.written([2])
+    batch, = schedule.take(5, idle=True)
+    assert sorted(batch) == [0, 1]
+
+
+def test_batch_sizer_splits_by_count_and_bytes():
+    sizer = BatchSizer('process_spec', initial=3, max_bytes=100)
+    assert sizer.split([10] * 7) == [range(0, 3), range(3, 6), range(6, 7)]
+    assert sizer.split([60, 30, 20, 150, 10]) == [range(0, 2), range(2, 3), range(3, 4),
+                                                  range(4, 5)]
+    assert sizer.split([]) == []
+
+
+def test_batch_sizer_adapts_to_latency_and_failures():
+    events = []
+    sizer = BatchSizer('process_spec', initial=10, max_count=20, target_latency=1.0,
+                       publish=events.append)
+
+    sizer.succeeded(5, 500, 0.1)  # A partial batch says nothing about larger ones
+    assert sizer.size == 10
+    sizer.succeeded(10, 1000, 0.1)
+    assert sizer.size == 15
+    sizer.succeeded(15, 1500, 0.1)
+    assert sizer.size == 20  # capped by max_count
+    sizer.succeeded(20, 2000, 4.0)
+    assert sizer.size == 5
+    sizer.succeeded(5, 500, 0.7)
+    assert sizer.size == 5  # within the target
+    sizer.failed(5, 500, 0.3, reason='timeout')
+    assert sizer.size == 2
+    sizer.failed(2, 200, 0.3, reason='too_large')
+    sizer.failed(1, 100, 0.3, reason='too_large')
+    assert sizer.size == 1
+
+    assert [(event.previous, event.size, event.reason) for event in events] == [
+        (10, 15, 'fast'), (15, 20, 'fast'), (20, 5, 'slow'), (5, 2, 'timeout'),
+        (2, 1, 'too_large')]
+    assert events[2].count == 20 and events[2].bytes_sent == 2000 and events[2].elapsed == 4.0
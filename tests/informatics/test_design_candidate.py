@@ -1,5 +1,5 @@
 """Tests for citrine.informatics.design_candidate."""
-from citrine.informatics.design_candidate import DesignVariable
+from citrine.informatics.design_candidate import DesignCandidate, DesignVariable
 
 
 def test_deser():
@@ -8,3 +8,20 @@ def test_deser():
     deserialized = DesignVariable.build(dumped)
     assert deserialized.mean == 1.0
     assert deserialized.std == 2.0
+
+
+def test_candidates_are_compact():
+    """Candidates and their values are stored without a __dict__ per instance"""
+    dumped = {
+        "material_id": "b5b6dbe5-5b8e-4c6a-9a6b-5b1e9c7c8d53",
+        "identifiers": ["foo"],
+        "primary_score": 0.5,
+        "material": {"vars": {"x": {"type": "R", "m": 1.0, "s": 2.0},
+                              "y": {"type": "C", "cp": {"a": 1.0}}}}
+    }
+    candidate = DesignCandidate.build(dumped)
+    values = candidate.material.values
+    for obj in (candidate, candidate.material, values["x"], values["y"]):
+        assert not hasattr(obj, "__dict__")
+    assert values["y"].probabilities == {"a": 1.0}
+    assert candidate.dump()["identifiers"] == ["foo"]
@@ -54,3 +54,57 @@ def test_categorical_pva(example_result, example_categorical_pva_metrics):
     expected = PredictedVsActualCategoricalPoint.build(args)
     assert example_result["salt?"]["predicted_vs_actual"][0].predicted == expected.predicted
     assert next(iter(example_result["salt?"]["predicted_vs_actual"])).actual == expected.actual
+
+
+def test_lazy_build(example_result, example_result_dict, example_real_pva_metrics, monkeypatch):
+    from citrine._serialization.properties import lazy_deserialization
+
+    with lazy_deserialization():
+        lazy = PredictorEvaluationResult.build(example_result_dict)
+
+    # Reading a metric doesn't deserialize the predicted vs actual points
+    monkeypatch.setattr(PredictedVsActualRealPoint, 'build', lambda data: pytest.fail())
+    assert lazy["saltiness"][RMSE()] == example_result["saltiness"][RMSE()]
+    monkeypatch.undo()
+
+    assert lazy.evaluator == example_result.evaluator
+    for response in example_result:
+        assert lazy[response].dump() == example_result[response].dump()
+    expected = PredictedVsActualRealPoint.build(example_real_pva_metrics["value"][0])
+    assert lazy["saltiness"][PVA()].value[0].predicted == expected.predicted
+
+
+def test_points_are_compact(example_result):
+    point = example_result["saltiness"]["predicted_vs_actual"][0]
+    categorical_point = example_result["salt?"]["predicted_vs_actual"][0]
+    for obj in (point, point.predicted, categorical_point, example_result["saltiness"]["rmse"]):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_real_pva_to_arrays(example_result, example_result_dict, example_real_pva_metrics):
+    from citrine._serialization.properties import lazy_deserialization
+    point = example_real_pva_metrics["value"][0]
+
+    arrays = example_result["saltiness"]["predicted_vs_actual"].to_arrays()
+    assert list(arrays) == ["uuid", "trial", "fold", "predicted.mean", "predicted.standard_error",
+                            "actual.mean", "actual.standard_error"]
+    assert list(arrays["uuid"]) == [point["uuid"]]
+    assert list(arrays["fold"]) == [3]
+    assert list(arrays["predicted.standard_error"]) == [0.12]
+
+    # A lazily built result fills the same columns without building the points
+    with lazy_deserialization():
+        lazy = PredictorEvaluationResult.build(example_result_dict)
+    pva = lazy["saltiness"]["predicted_vs_actual"]
+    lazy_arrays = pva.to_arrays()
+    assert {name: list(column) for name, column in lazy_arrays.items()} == \
+        {name: list(column) for name, column in arrays.items()}
+    assert pva.to_frame()["actual.mean"][0] == 1.2
+
+
+def test_categorical_pva_to_arrays(example_result):
+    frame = example_result["salt?"]["predicted_vs_actual"].to_frame()
+    assert list(frame.columns) == ["uuid", "trial", "fold", "predicted.salt", "predicted.not salt",
+                                   "actual.not salt"]
+    assert list(frame["predicted.salt"]) == [0.3]
+    assert list(frame["actual.not salt"]) == [1.0]
@@ -0,0 +1,150 @@
+from json import dumps as json_dumps
+from uuid import uuid4
+
+import pytest
+
+from citrine.resources.content_hash import ContentHashCache, content_hash
+from citrine.resources.gemd_resource import GEMDResourceCollection
+from citrine.resources.process_run import ProcessRun
+from citrine.resources.process_spec import ProcessSpec, ProcessSpecCollection
+from tests.utils.session import FakeCall, FakeSession
+
+
+@pytest.fixture
+def collection() -> GEMDResourceCollection:
+    return GEMDResourceCollection(uuid4(), uuid4(), FakeSession())
+
+
+def nightly(temperature: str = "300 K"):
+    """The objects of a nightly load, built from scratch with uids in a custom scope."""
+    specs = [ProcessSpec("spec {}".format(i), uids={'lims': 'spec-{}'.format(i)})
+             for i in range(30)]
+    runs = [ProcessRun("run {}".format(i), spec=spec, uids={'lims': 'run-{}'.format(i)},
+                       notes=temperature if i == 7 else None)
+            for i, spec in enumerate(specs)]
+    return specs + runs
+
+
+def sent(collection):
+    return [obj['name'] for call in collection.session.calls for obj in call.json['objects']]
+
+
+def test_content_hash():
+    payload = {'type': 'process_spec', 'name': 'spec', 'uids': {'lims': '1'}}
+    assert content_hash(payload) == content_hash(dict(reversed(list(payload.items()))))
+    written = dict(payload, audit_info={'created_by': str(uuid4())}, dataset=str(uuid4()))
+    assert content_hash(written) == content_hash(payload)
+    assert content_hash(dict(payload, name='other')) != content_hash(payload)
+
+
+def test_register_all_skips_unchanged_objects(collection, tmp_path):
+    path = tmp_path / 'hashes.json'
+    with ContentHashCache(path, server_version='1') as cache:
+        collection.register_all(nightly(), cache=cache)
+    assert len(sent(collection)) == 60
+
+    collection.session.calls = []
+    with ContentHashCache(path, server_version='1') as cache:
+        assert len(cache) == 60
+        models = nightly(temperature="310 K")
+        registered = collection.register_all(models, cache=cache)
+    assert sent(collection) == ["run 7"]
+    assert [x.name for x in registered] == [x.name for x in models]
+    assert registered[0] is models[0]
+
+    collection.session.calls = []
+    with ContentHashCache(path, server_version='1') as cache:
+        collection.register_all(nightly(temperature="310 K"), cache=cache)
+        # A dry run sends everything, and records nothing
+        collection.register_all(nightly(temperature="320 K"), cache=cache, dry_run=True)
+    assert len(sent(collection)) == 60
+
+    # Hashes recorded by another version of the platform are not trusted
+    collection.session.calls = []
+    with ContentHashCache(path, server_version='2') as cache:
+        assert len(cache) == 0
+        collection.register_all(nightly(temperature="310 K"), cache=cache)
+    assert len(sent(collection)) == 60
+
+
+class PlatformSession(FakeSession):
+    """A session that gives each object written a Citrine id, as the platform does."""
+
+    def __init__(self):
+        super().__init__()
+        self.ids = {}
+
+    def checked_put(self, path: str, json: dict, **kwargs) -> dict:
+        self.calls.append(FakeCall('PUT', path, json))
+        objects = [dict(obj, uids=dict(obj['uids'], id=self.ids.setdefault(
+            json_dumps(sorted(obj['uids'].items())), str(uuid4())))) for obj in json['objects']]
+        return {'objects': objects}
+
+
+def test_links_are_compared_by_the_object_they_point_to(tmp_path):
+    collection = GEMDResourceCollection(uuid4(), uuid4(), PlatformSession())
+    path = tmp_path / 'hashes.json'
+    with ContentHashCache(path) as cache:
+        models = nightly()
+        collection.register_all(models, cache=cache)
+    # The runs were written after their specs got a Citrine id, and linked to them by it
+    assert all('id' in spec.uids for spec in models[:30])
+    assert {obj['spec']['scope'] for call in collection.session.calls
+            for obj in call.json['objects'] if obj['type'] == 'process_run'} == {'id'}
+
+    # Built again without ids, the runs link to their specs by their custom uids
+    collection.session.calls = []
+    with ContentHashCache(path) as cache:
+        collection.register_all(nightly(), cache=cache)
+        assert sent(collection) == []
+        # Objects that already have their ids are recognized by them
+        collection.register_all(models, cache=cache)
+        assert sent(collection) == []
+        collection.register_all(nightly(temperature="310 K"), cache=cache)
+    assert sent(collection) == ["run 7"]
+
+
+def test_register_skips_unchanged_object(collection, tmp_path):
+    cache = ContentHashCache(tmp_path / 'hashes.json')
+    spec = ProcessSpec("spec", uids={'lims': 'spec'})
+    collection.register(spec, cache=cache)
+    assert collection.session.num_calls == 1
+
+    again = ProcessSpec("spec", uids={'lims': 'spec'})
+    assert collection.register(again, cache=cache) is again
+    assert collection.session.num_calls == 1
+
+    # Objects without any uids cannot be recognized, and are always sent
+    collection.register(ProcessSpec("spec"), cache=cache)
+    collection.register(ProcessSpec("spec"), cache=cache)
+    assert collection.session.num_calls == 3
+
+
+def test_collection_register_all_skips_unchanged_objects(tmp_path):
+    collection = ProcessSpecCollection(uuid4(), uuid4(), FakeSession())
+    cache = ContentHashCache(tmp_path / 'hashes.json')
+    collection.register_all([ProcessSpec("spec {}".format(i), uids={'lims': str(i)})
+                             for i in range(3)], cache=cache)
+
+    models = [ProcessSpec("spec {}".format(i), uids={'lims': str(i)}) for i in range(3)]
+    models[1].notes = "changed"
+    registered = collection.register_all(models, cache=cache)
+    assert sent(collection)[3:] == ["spec 1"]
+    assert registered[0] is models[0] and registered[1] is not models[1]
+
+    assert collection.register_all(models, cache=cache) == models
+    assert collection.session.num_calls == 2
+
+
+def test_cache_without_uids_or_hashes(tmp_path):
+    cache = ContentHashCache(tmp_path / 'hashes.json')
+    dataset_id = uuid4()
+    payload = {'type': 'process_spec', 'name': 'spec', 'uids': {}}
+    cache.record(dataset_id, payload)
+    assert len(cache) == 0 and cache.changed(dataset_id, payload)
+
+    payload['uids'] = {'lims': 'spec'}
+    cache.record(dataset_id, payload)
+    assert not cache.changed(dataset_id, payload)
+    cache.clear()
+    assert len(cache) == 0 and cache.changed(dataset_id, payload)
@@ -6,7 +6,7 @@ from uuid import uuid4
 
 from gemd.entity.link_by_uid import LinkByUID
 from citrine.resources.audit_info import AuditInfo
-from citrine.resources.data_concepts import DataConcepts, _make_link_by_uid, CITRINE_SCOPE
+from citrine.resources.data_concepts import DataConcepts, LazyDataConcepts, _make_link_by_uid, CITRINE_SCOPE
 from citrine.resources.process_run import ProcessRun
 from citrine.resources.process_spec import ProcessSpec
 from tests.utils.session import FakeCall
@@ -92,3 +92,43 @@ def test_get_type():
 
     assert DataConcepts.get_type({"type": "process_run"}) == ProcessRun
     assert DataConcepts.get_type(ProcessSpec("foo")) == ProcessSpec
+
+
+def test_lazy_data_concepts():
+    dataset_id = uuid4()
+    spec = ProcessSpec("lazy", uids={CITRINE_SCOPE: str(uuid4())}, tags=["a::b"])
+    data = spec.dump()
+    data['dataset'] = str(dataset_id)
+    built = []
+
+    def builder(raw):
+        built.append(raw)
+        return ProcessSpec.build(raw)
+
+    lazy = LazyDataConcepts(data, builder)
+    assert lazy.typ == 'process_spec'
+    assert lazy.uid == spec.uid
+    assert lazy.uids == spec.uids
+    assert lazy.name == 'lazy'
+    assert lazy.tags == ['a::b']
+    assert lazy.dataset == dataset_id
+    assert lazy.raw is data
+    assert 'lazy' in repr(lazy)
+    assert not built
+
+    # Anything else builds the object, once
+    assert lazy.notes is None
+    assert lazy.template is None
+    assert len(built) == 1
+    assert isinstance(lazy.build(), ProcessSpec)
+    assert lazy.build().dataset == dataset_id
+    assert len(built) == 1
+
+    with pytest.raises(AttributeError):
+        lazy.__missing__
+
+    empty = LazyDataConcepts({'type': 'process_spec', 'name': 'empty'}, builder)
+    assert empty.uid is None
+    assert empty.uids == {}
+    assert empty.tags == []
+    assert empty.dataset is None
@@ -1,5 +1,6 @@
 import uuid
 from os.path import basename
+from unittest import mock
 from uuid import UUID, uuid4
 
 import pytest
@@ -8,6 +9,7 @@ from gemd.entity.bounds.integer_bounds import IntegerBounds
 from citrine.exceptions import PollingTimeoutError, JobFailureError, NotFound
 from citrine.resources.condition_template import ConditionTemplateCollection, ConditionTemplate
 from citrine.resources.dataset import DatasetCollection
+from citrine.resources.gemd_resource import GEMDResourceCollection
 from citrine.resources.material_run import MaterialRunCollection, MaterialRun
 from citrine.resources.material_spec import MaterialSpecCollection, MaterialSpec
 from citrine.resources.material_template import MaterialTemplateCollection, MaterialTemplate
@@ -198,6 +200,17 @@ def test_list_datasets(paginated_collection, paginated_session):
     assert dataset_ids == expected_uids
 
 
+def test_list_datasets_concurrently(paginated_collection, paginated_session):
+    datasets_data = DatasetDataFactory.create_batch(50)
+    paginated_session.set_response(datasets_data)
+
+    datasets = list(paginated_collection.list(per_page=20, max_workers=3))
+
+    # Pages are yielded in order, with up to two requests past the last page
+    assert [str(d.uid) for d in datasets] == [d['id'] for d in datasets_data]
+    assert 3 <= paginated_session.num_calls <= 5
+
+
 def test_list_datasets_infinite_loop_detect(paginated_collection, paginated_session):
     # Given
     batch_size = 100
@@ -362,6 +375,20 @@ def test_gemd_posts(dataset):
         for pair in obj.uids.items():
             assert pair in seen_ids  # registered items have the same ids
 
+def test_register_stream(dataset):
+    """Pass through to GEMDResourceCollection, with every option."""
+    specs = [ProcessSpec("spec {}".format(i)) for i in range(3)]
+    registered = dataset.register_stream(iter(specs), buffer_size=2, max_batch_size=10)
+    assert [spec.name for spec in registered] == ["spec 0", "spec 1", "spec 2"]
+    assert [len(call.json['objects']) for call in dataset.session.calls] == [2, 1]
+
+    options = dict(dry_run=True, buffer_size=7, max_workers=3, max_batch_size=11,
+                   max_batch_bytes=1000, target_latency=2.0, journal=None, cache=None)
+    with mock.patch.object(GEMDResourceCollection, 'register_stream') as register_stream:
+        dataset.register_stream(iter(specs), **options)
+    register_stream.assert_called_once_with(mock.ANY, **options)
+
+
 def test_gemd_batch_delete(dataset):
     """Pass through to GEMDResourceCollection working."""
     with pytest.raises(TypeError):
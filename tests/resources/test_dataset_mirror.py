@@ -0,0 +1,224 @@
+import sqlite3
+from uuid import uuid4
+
+import pytest
+from gemd.entity.bounds import CategoricalBounds, CompositionBounds, IntegerBounds, \
+    RealBounds
+from gemd.entity.link_by_uid import LinkByUID
+
+from citrine.resources.data_concepts import LazyDataConcepts
+from citrine.resources.dataset_mirror import DatasetMirror
+from citrine.resources.material_run import MaterialRun
+from tests.utils.factories import DatasetFactory
+from tests.utils.session import FakeCall, FakeSession
+
+
+class DatasetSession(FakeSession):
+    """A session that lists the objects of a dataset by type, in a single page."""
+
+    def __init__(self, objects: list):
+        super().__init__()
+        self.objects = objects
+
+    def checked_get(self, path: str, **kwargs) -> dict:
+        self.calls.append(FakeCall('GET', path, params=kwargs.get('params')))
+        typ = path.rsplit('/', 1)[-1][:-1].replace('-', '_')
+        return {'contents': [obj for obj in self.objects if obj['type'] == typ]}
+
+
+def gemd(typ: str, name: str, tags: tuple = (), **fields) -> dict:
+    return dict(type=typ, name=name, uids={'id': str(uuid4())}, tags=list(tags),
+                audit_info={'created_at': '2023-01-01T00:00:00Z',
+                            'updated_at': '2024-01-01T00:00:00Z'},
+                **fields)
+
+
+def link(obj: dict, scope: str = 'id') -> dict:
+    return {'type': 'link_by_uid', 'scope': scope, 'id': obj['uids'][scope]}
+
+
+def density(value: dict) -> dict:
+    # Linked to the template in a custom scope, which is compared without regard to case
+    template = {'type': 'link_by_uid', 'scope': 'LIMS', 'id': 'density'}
+    return {'type': 'property', 'name': 'density', 'template': template, 'value': value}
+
+
+def flavor(template: dict, category: str) -> dict:
+    return {'type': 'condition', 'name': 'flavor', 'template': template,
+            'value': {'type': 'nominal_categorical', 'category': category}}
+
+
+@pytest.fixture
+def objects() -> dict:
+    density_template = gemd('property_template', 'density',
+                            bounds={'type': 'real_bounds', 'lower_bound': 0,
+                                    'upper_bound': 10, 'default_units': 'g/cm**3'})
+    density_template['uids']['lims'] = 'density'
+    flavor_template = gemd('condition_template', 'flavor',
+                           bounds={'type': 'categorical_bounds',
+                                   'categories': ['chocolate', 'vanilla']})
+    cake_template = gemd('material_template', 'cake', properties=[
+        [link(density_template), density_template['bounds']]])
+    spec = gemd('material_spec', 'Cake spec', template=link(cake_template), tags=['color::red'],
+                properties=[{'type': 'property_and_conditions',
+                             'property': density({'type': 'normal_real', 'mean': 3.0, 'std': 0.1,
+                                                  'units': 'gram / centimeter ** 3'}),
+                             'conditions': [flavor(link(flavor_template), 'vanilla')]}])
+    bake = gemd('process_run', 'Bake', conditions=[
+        flavor(link(flavor_template), 'chocolate'),
+        {'type': 'condition', 'name': 'duration', 'template': None, 'value': None}])
+    cake = gemd('material_run', 'Cake 1', spec=link(spec), process=link(bake),
+                tags=['color::red', 'size::large'])
+    other = gemd('material_run', 'cake 2', tags=['color::blue'])
+    dense = gemd('measurement_run', 'Weigh', material=link(cake), properties=[
+        density({'type': 'nominal_real', 'nominal': 1.2, 'units': 'gram / centimeter ** 3'})])
+    light = gemd('measurement_run', 'Weigh again', material=link(other), properties=[
+        density({'type': 'uniform_real', 'lower_bound': 0.5, 'upper_bound': 0.9,
+                 'units': 'gram / centimeter ** 3'}),
+        {'type': 'property', 'name': 'count', 'template': None,
+         'value': {'type': 'nominal_integer', 'nominal': 3}}])
+    return dict(density_template=density_template, flavor_template=flavor_template,
+                cake_template=cake_template, spec=spec,
+                bake=bake, cake=cake, other=other, dense=dense, light=light)
+
+
+@pytest.fixture
+def dataset(objects):
+    dataset = DatasetFactory(name='Test Dataset')
+    dataset.project_id = uuid4()
+    dataset.uid = uuid4()
+    dataset.session = DatasetSession(list(objects.values()))
+    return dataset
+
+
+def names(results) -> list:
+    return [obj.name for obj in results]
+
+
+def test_queries(dataset, objects):
+    with DatasetMirror(dataset, ':memory:') as mirror:
+        assert mirror.synced_at is None
+        assert mirror.sync() == {'added': 9, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        assert len(mirror) == 9 and mirror.synced_at is not None
+        dataset.session.calls = []
+
+        assert names(mirror.list_by_name('CAKE')) == ['cake', 'Cake spec', 'Cake 1', 'cake 2']
+        assert names(mirror.list_by_name('Cake', exact=True)) == ['cake']
+        assert names(mirror.list_by_name('cake', object_type='material_run')) == \
+            ['Cake 1', 'cake 2']
+        assert names(mirror.list_by_tag('color')) == ['Cake spec', 'Cake 1', 'cake 2']
+        assert names(mirror.list_by_tag('color::r')) == ['Cake spec', 'Cake 1']
+        assert names(mirror.list_by_tag('col')) == []
+
+        cake = mirror.get(objects['cake']['uids']['id'])
+        assert isinstance(cake, MaterialRun) and cake.name == 'Cake 1'
+        assert mirror.get(LinkByUID('lims', 'density'), mode='raw')['name'] == 'density'
+        assert mirror.get(str(uuid4())) is None
+        lazy, = mirror.list(object_type='process_run', mode='lazy')
+        assert isinstance(lazy, LazyDataConcepts) and lazy.name == 'Bake'
+
+        assert names(mirror.list_by_spec(objects['spec']['uids']['id'])) == ['Cake 1']
+        assert names(mirror.list_by_process(objects['bake']['uids']['id'])) == ['Cake 1']
+        assert names(mirror.list_by_material(cake)) == ['Weigh']
+        assert names(mirror.list_by_template(objects['cake_template']['uids']['id'])) == \
+            ['Cake spec']
+        # Object templates are linked to their attribute templates through their pairs
+        assert names(mirror.list_by_template(objects['density_template']['uids']['id'])) == \
+            ['cake']
+        assert dataset.session.calls == []
+
+
+def test_attribute_bounds(dataset, objects):
+    template = objects['density_template']['uids']['id']
+    with DatasetMirror(dataset, ':memory:') as mirror:
+        mirror.sync()
+        assert names(mirror.list_by_attribute_bounds(
+            {template: RealBounds(1000, 1500, 'kg/m**3')})) == ['Weigh']
+        assert names(mirror.list_by_attribute_bounds(
+            {LinkByUID('lims', 'density'): RealBounds(0, 2, 'g/cm**3')})) == \
+            ['Weigh', 'Weigh again']
+        # Ranges of values must be within the bounds, and other dimensions never are
+        assert names(mirror.list_by_attribute_bounds(
+            {template: RealBounds(0.6, 2, 'g/cm**3')})) == ['Weigh']
+        assert names(mirror.list_by_attribute_bounds(
+            {template: RealBounds(0, 2, 'kelvin')})) == []
+        assert names(mirror.list_by_attribute_bounds(
+            {template: RealBounds(0, 2, 'g/cm**3'), str(uuid4()): IntegerBounds(0, 5)})) == []
+        with pytest.raises(TypeError, match='not str'):
+            list(mirror.list_by_attribute_bounds({template: 'not bounds'}))
+        with pytest.raises(TypeError, match='not CompositionBounds'):
+            list(mirror.list_by_attribute_bounds({template: CompositionBounds(['C', 'H'])}))
+
+        flavor = objects['flavor_template']['uids']['id']
+        assert names(mirror.list_by_attribute_bounds(
+            {flavor: CategoricalBounds(['chocolate'])})) == ['Bake']
+        assert names(mirror.list_by_attribute_bounds(
+            {flavor: CategoricalBounds(['vanilla'])})) == ['Cake spec']
+        # Properties of specs are found with their conditions
+        assert names(mirror.list_by_attribute_bounds(
+            {template: RealBounds(2.5, 3.5, 'g/cm**3')})) == ['Cake spec']
+
+
+def test_incremental_sync(dataset, objects, tmp_path):
+    path = tmp_path / 'mirror.sqlite'
+    with DatasetMirror(dataset, path) as mirror:
+        mirror.sync()
+
+    objects['other']['name'] = 'Pie'
+    objects['other']['audit_info']['updated_at'] = '2024-02-01T00:00:00Z'
+    # Changes without a new update time are not seen
+    objects['bake']['name'] = 'Roast'
+    dataset.session.objects.remove(objects['light'])
+
+    with DatasetMirror(dataset, path) as mirror:
+        assert mirror.sync() == {'added': 0, 'updated': 1, 'removed': 1, 'unchanged': 7}
+        assert names(mirror.list_by_name('pie')) == ['Pie']
+        assert names(mirror.list_by_tag('color::blue')) == ['Pie']
+        assert names(mirror.list_by_name('roast')) == []
+        assert names(mirror.list_by_material(objects['other']['uids']['id'])) == []
+        assert len(mirror) == 8
+
+    other = DatasetFactory(name='Other Dataset')
+    other.uid = uuid4()
+    with pytest.raises(ValueError):
+        DatasetMirror(other, path)
+
+
+def test_objects_without_audit_info_are_compared_in_full(dataset, objects):
+    for obj in objects.values():
+        del obj['audit_info']
+    with DatasetMirror(dataset, ':memory:') as mirror:
+        mirror.sync()
+        objects['bake']['name'] = 'Roast'
+        assert mirror.sync() == {'added': 0, 'updated': 1, 'removed': 0, 'unchanged': 8}
+        assert names(mirror.list_by_name('roast')) == ['Roast']
+
+
+def test_uid_taken_over_by_another_object(dataset, objects):
+    objects['other']['uids']['lims'] = 'cake'
+    with DatasetMirror(dataset, ':memory:') as mirror:
+        mirror.sync()
+        # The uid moves to an object that is listed before the old one is removed
+        replacement = gemd('material_run', 'cake 3')
+        replacement['uids']['lims'] = 'cake'
+        dataset.session.objects.insert(0, replacement)
+        dataset.session.objects.remove(objects['other'])
+        assert mirror.sync()['removed'] == 1
+
+        assert mirror.get(LinkByUID('lims', 'cake')).name == 'cake 3'
+        assert mirror.get(LinkByUID('LIMS', 'cake')).name == 'cake 3'
+
+
+def test_mirror_of_an_older_layout_is_rebuilt(dataset, tmp_path):
+    path = tmp_path / 'mirror.sqlite'
+    with DatasetMirror(dataset, path) as mirror:
+        mirror.sync()
+    db = sqlite3.connect(str(path))
+    with db:
+        db.execute("UPDATE meta SET value = '0' WHERE key = 'schema'")
+    db.close()
+
+    with DatasetMirror(dataset, path) as mirror:
+        assert len(mirror) == 0 and mirror.synced_at is None
+        mirror.sync()
+        assert len(mirror) == 9
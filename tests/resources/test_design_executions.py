@@ -4,7 +4,7 @@ import uuid
 from citrine.informatics.executions.design_execution import DesignExecution
 from citrine.resources.design_execution import DesignExecutionCollection
 from tests.utils.factories import MLIScoreFactory
-from tests.utils.session import FakeSession, FakeCall
+from tests.utils.session import FakeSession, FakeCall, FakePaginatedSession
 
 
 @pytest.fixture
@@ -97,6 +97,66 @@ def test_workflow_execution_results(workflow_execution: DesignExecution, session
     assert session.last_call == FakeCall(method='GET', path=expected_path, params={"page": 2, "per_page": 4})
 
 
+def test_candidates_to_arrays(workflow_execution: DesignExecution, session, example_candidates):
+    # Given
+    session.set_responses(example_candidates, {"response": []})
+
+    # When
+    arrays = workflow_execution.candidates(per_page=4).to_arrays()
+
+    # Then
+    candidate = example_candidates["response"][0]
+    assert list(arrays["material_id"]) == [candidate["material_id"]]
+    assert list(arrays["rank"]) == [1]
+    assert list(arrays["Temperature.mean"]) == [475.8]
+
+
+def test_candidates_iterate_then_to_frame(workflow_execution: DesignExecution, session, example_candidates):
+    # Given
+    first = example_candidates["response"][0]
+    second = dict(first, material_id=str(uuid.uuid4()), primary_score=-1)
+    session.set_responses({"response": [first]}, {"response": [second]}, {"response": []})
+    candidates = workflow_execution.candidates(per_page=1)
+
+    # When
+    built = next(iter(candidates))
+    frame = candidates.to_frame()
+
+    # Then the frame holds the rest of the listing, ranked after the candidates already read
+    assert str(built.material_id) == first["material_id"]
+    assert list(frame["material_id"]) == [second["material_id"]]
+    assert list(frame["rank"]) == [2]
+    assert list(frame["primary_score"]) == [-1.0]
+
+
+def test_candidates_is_an_iterator(workflow_execution: DesignExecution, session, example_candidates):
+    session.set_responses(example_candidates, {"response": []})
+
+    candidate = next(workflow_execution.candidates(per_page=4))
+
+    assert str(candidate.material_id) == example_candidates["response"][0]["material_id"]
+    with pytest.raises(StopIteration):
+        next(workflow_execution.candidates())
+
+
+def test_candidates_lazy(workflow_execution: DesignExecution, session, example_candidates):
+    # Given a candidate whose material can't be deserialized
+    candidate = example_candidates["response"][0]
+    temperature = candidate["material"]["vars"]["Temperature"]
+    temperature["m"] = "hot"
+    session.set_responses(example_candidates, {"response": []})
+
+    # When
+    candidates = list(workflow_execution.candidates(per_page=4, lazy=True))
+
+    # Then the material is only deserialized when it is read
+    assert [str(c.material_id) for c in candidates] == [candidate["material_id"]]
+    with pytest.raises(ValueError):
+        candidates[0].material.values
+    temperature["m"] = 475.8
+    assert candidates[0].material.values["Temperature"].mean == 475.8
+
+
 def test_list(collection: DesignExecutionCollection, session):
     session.set_response({"page": 2, "per_page": 4, "next": "foo", "response": []})
     lst = list(collection.list(page=2, per_page=4))
@@ -110,6 +170,26 @@ def test_list(collection: DesignExecutionCollection, session):
     )
 
 
+def test_list_concurrently_without_deduplication(design_execution_dict):
+    # Given five executions, the second of which is listed twice
+    executions = [dict(design_execution_dict, id=str(uuid.uuid4())) for _ in range(5)]
+    session = FakePaginatedSession()
+    session.set_response({"response": executions + executions[1:2]})
+    collection = DesignExecutionCollection(
+        project_id=uuid.uuid4(),
+        workflow_id=uuid.uuid4(),
+        session=session,
+    )
+
+    # When
+    listed = list(collection.list(per_page=4, max_workers=3))
+    duplicated = list(collection.list(per_page=4, max_workers=3, deduplicate=False))
+
+    # Then
+    assert [str(e.uid) for e in listed] == [e["id"] for e in executions]
+    assert len(duplicated) == 6
+
+
 def test_delete(collection):
     with pytest.raises(NotImplementedError):
         collection.delete(uuid.uuid4())
@@ -4,7 +4,7 @@ import pytest
 
 from citrine.informatics.workflows import DesignWorkflow
 from citrine.resources.design_workflow import DesignWorkflowCollection
-from tests.utils.session import FakeSession, FakeCall
+from tests.utils.session import FakeSession, FakeCall, FakePaginatedSession
 
 
 @pytest.fixture
@@ -62,6 +62,25 @@ def test_list_archived(workflow, collection: DesignWorkflowCollection):
     )
 
 
+def test_list_archived_concurrently_without_deduplication(design_workflow_dict):
+    # Given five workflows, the second of which is listed twice
+    workflows = [dict(design_workflow_dict, id=str(uuid.uuid4())) for _ in range(5)]
+    session = FakePaginatedSession()
+    session.set_response({"response": workflows + workflows[1:2]})
+    collection = DesignWorkflowCollection(
+        project_id=uuid.uuid4(),
+        session=session,
+    )
+
+    # When
+    listed = list(collection.list_archived(per_page=4, max_workers=3))
+    duplicated = list(collection.list_archived(per_page=4, max_workers=3, deduplicate=False))
+
+    # Then
+    assert [str(w.uid) for w in listed] == [w["id"] for w in workflows]
+    assert len(duplicated) == 6
+
+
 def test_missing_project(design_workflow_dict):
     """Make sure we get an attribute error if there is no project id."""
 
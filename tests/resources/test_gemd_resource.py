@@ -1,5 +1,12 @@
+import gc
+import json
+import threading
 import random
+import time
+import weakref
 from uuid import uuid4, UUID
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from os.path import basename
 
 import pytest
@@ -9,7 +16,10 @@ from gemd.entity.link_by_uid import LinkByUID
 from gemd.entity.object.material_spec import MaterialSpec as GemdMaterialSpec
 from gemd.entity.object.process_spec import ProcessSpec as GemdProcessSpec
 
-from citrine.exceptions import PollingTimeoutError, JobFailureError, NotFound
+from citrine.exceptions import PollingTimeoutError, JobFailureError, NotFound, \
+    PayloadTooLarge, GatewayTimeout
+from citrine._session import Session
+from citrine.instrumentation import BatchSizeEvent
 from citrine.resources.api_error import ApiError, ValidationError
 from citrine.resources.condition_template import ConditionTemplateCollection, ConditionTemplate
 from citrine.resources.data_concepts import DataConcepts
@@ -225,6 +235,186 @@ def test_register_all_object_update(gemd_collection):
     assert material.uids == registered_material.uids
 
 
+def test_register_all_concurrently(gemd_collection):
+    """Check that concurrent batches keep the order of tiers, results and uids"""
+    specs = [ProcessSpec("spec {}".format(i)) for i in range(120)]
+    runs = [ProcessRun("run {}".format(i), spec=spec) for i, spec in enumerate(specs)]
+    templates = [ProcessTemplate("template {}".format(i)) for i in range(60)]
+
+    registered = gemd_collection.register_all(runs + specs + templates, max_workers=4,
+                                              max_batch_size=50)
+
+    assert [obj.name for obj in registered] == \
+        [obj.name for obj in templates + specs + runs]
+    for prewrite, postwrite in zip(templates + specs + runs, registered):
+        assert prewrite.uids == postwrite.uids
+    for run, spec in zip(registered[-len(runs):], specs):
+        assert run.spec.id == spec.uids[run.spec.scope]
+
+    # Types are written in as few batches as possible, and each object after what it links to
+    calls = gemd_collection.session.calls
+    call_basenames = [call.path.split('/')[-2] for call in calls]
+    assert sorted(call_basenames) == \
+        sorted(['process-templates'] * 2 + ['process-specs'] * 3 + ['process-runs'] * 3)
+    written_in = {obj['name']: index for index, call in enumerate(calls)
+                  for obj in call.json['objects']}
+    for run, spec in zip(runs, specs):
+        assert written_in[run.name] > written_in[spec.name]
+
+
+def test_register_all_adapts_batch_size(gemd_collection, session):
+    """Check that fast batches grow, and large batches are split by their size in bytes"""
+    templates = [ProcessTemplate("template {}".format(i)) for i in range(300)]
+    gemd_collection.register_all(templates)
+    assert [len(call.json['objects']) for call in session.calls] == [50, 75, 113, 62]
+    assert [(event.previous, event.size, event.reason) for event in session.events] == \
+        [(50, 75, 'fast'), (75, 113, 'fast'), (113, 170, 'fast')]
+
+    session.calls, session.events = [], []
+    specs = [ProcessSpec("spec {}".format(i), tags=["x" * 1000]) for i in range(20)]
+    gemd_collection.register_all(specs, max_batch_bytes=8000)
+    sizes = [sum(len(json.dumps(obj)) for obj in call.json['objects']) for call in session.calls]
+    assert sum(len(call.json['objects']) for call in session.calls) == 20
+    assert len(sizes) > 1 and max(sizes) <= 8000
+    assert [(event.previous, event.reason) for event in session.events] == [(50, 'bytes')]
+
+
+def test_register_all_splits_rejected_batches(gemd_collection, session):
+    """Check that a batch that is too large is retried in smaller pieces"""
+    session.set_responses(PayloadTooLarge('path'))
+    specs = [ProcessSpec("spec {}".format(i)) for i in range(40)]
+
+    registered = gemd_collection.register_all(specs)
+
+    assert [obj.name for obj in registered] == [spec.name for spec in specs]
+    assert [len(call.json['objects']) for call in session.calls] == [40, 20, 20]
+    assert session.events[0].size == 20
+    assert session.events[0].reason == 'too_large'
+
+    # A single object that is still rejected cannot be split any further
+    session.calls = []
+    session.set_responses(PayloadTooLarge('path'))
+    with pytest.raises(PayloadTooLarge):
+        gemd_collection.register_all([ProcessSpec("alone")])
+    assert len(session.calls) == 1
+
+    session.set_responses(GatewayTimeout('path'))
+    with pytest.raises(GatewayTimeout):
+        gemd_collection.register_all([ProcessSpec("alone")])
+
+
+class _SlowBatchHandler(BaseHTTPRequestHandler):
+    """Times out on batches of more than one object, and writes single objects."""
+
+    batch_sizes = []
+
+    def do_PUT(self):
+        objects = json.loads(self.rfile.read(int(self.headers['Content-Length'])))['objects']
+        _SlowBatchHandler.batch_sizes.append(len(objects))
+        body = b'' if len(objects) > 1 else json.dumps({'objects': objects}).encode('utf-8')
+        self.send_response(504 if len(objects) > 1 else 200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_register_all_splits_batches_that_time_out():
+    """Check that batches the gateway times out on, after retrying them, are split"""
+    server = HTTPServer(('127.0.0.1', 0), _SlowBatchHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        session = Session(refresh_token='12345', scheme='http', host='127.0.0.1',
+                          port=str(server.server_address[1]))
+        session.access_token_expiration = datetime.utcnow() + timedelta(minutes=3)
+        adapter = session.get_adapter('http://127.0.0.1')
+        adapter.max_retries = adapter.max_retries.new(backoff_factor=0)
+        collection = GEMDResourceCollection(project_id=uuid4(), dataset_id=uuid4(),
+                                            session=session)
+        events = []
+        session.subscribe(events.append)
+
+        specs = [ProcessSpec("spec {}".format(i)) for i in range(2)]
+        registered = collection.register_all(specs)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [spec.name for spec in registered] == ["spec 0", "spec 1"]
+    # The batch of two is tried six times in all, then each object is written alone
+    assert _SlowBatchHandler.batch_sizes == [2] * 6 + [1, 1]
+    resized = [event for event in events if isinstance(event, BatchSizeEvent)]
+    assert (resized[0].size, resized[0].reason) == (1, 'timeout')
+
+
+class FirstBatchFailsSession(FakeSession):
+    """A session that rejects the first batch written, and is slow to write the others."""
+
+    def checked_put(self, path: str, json: dict, **kwargs) -> dict:
+        if json['objects'][0]['name'] == "spec 0":
+            raise NotFound(path)
+        time.sleep(0.2)
+        return super().checked_put(path, json, **kwargs)
+
+
+def test_register_all_concurrently_stops_on_failure():
+    """Check that a failed batch is raised without waiting for the others to be collected"""
+    session = FirstBatchFailsSession()
+    collection = GEMDResourceCollection(project_id=uuid4(), dataset_id=uuid4(), session=session)
+    specs = [ProcessSpec("spec {}".format(i)) for i in range(100)]
+
+    with pytest.raises(NotFound):
+        collection.register_all(specs, max_workers=2, max_batch_size=50)
+
+
+def test_register_stream(gemd_collection, session):
+    """Check that a stream is read a buffer at a time, with links to earlier buffers"""
+    produced = []
+
+    def histories():
+        for i in range(100):
+            spec = ProcessSpec("spec {}".format(i))
+            run = ProcessRun("run {}".format(i), spec=spec)
+            produced.extend([spec, run])
+            yield spec
+            yield run
+
+    stream = gemd_collection.register_stream(histories(), buffer_size=30)
+    first = next(stream)
+    assert len(produced) == 30
+    assert first.name == "spec 0"
+    registered = [first] + list(stream)
+
+    assert len(registered) == 200
+    by_name = {obj.name: obj for obj in produced}
+    for run in registered:
+        if isinstance(run, ProcessRun):
+            spec = by_name[run.name.replace("run", "spec")]
+            assert run.spec.id == spec.uids['id']
+    # Each buffer is written in as few batches as its types allow
+    assert len(session.calls) == 2 * 7
+
+
+def test_register_stream_keeps_memory_flat(gemd_collection):
+    """Check that objects are let go of once they have been written and yielded"""
+    refs = []
+
+    def templates():
+        for i in range(100):
+            template = ProcessTemplate("template {}".format(i))
+            refs.append(weakref.ref(template))
+            yield template
+
+    for registered in gemd_collection.register_stream(templates(), buffer_size=10):
+        pass
+    del registered
+    gc.collect()
+    assert sum(ref() is not None for ref in refs) <= 10
+
+
 def test_delete(gemd_collection, session):
     """
     Check that delete routes to the correct collections
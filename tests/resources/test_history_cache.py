@@ -0,0 +1,133 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from citrine._session import Session
+from citrine.resources import history_cache
+from citrine.resources.history_cache import HistoryCache
+from citrine.resources.material_run import MaterialRunCollection
+from tests.utils.factories import MaterialRunDataFactory
+from tests.utils.session import FakeSession
+
+
+@pytest.fixture
+def session() -> FakeSession:
+    return FakeSession()
+
+
+@pytest.fixture
+def collection(session) -> MaterialRunCollection:
+    return MaterialRunCollection(project_id=uuid4(), dataset_id=uuid4(), session=session)
+
+
+def history(name: str, updated_at: str = '2024-01-01T00:00:00Z') -> dict:
+    root = MaterialRunDataFactory(name=name, audit_info={'created_at': '2023-01-01T00:00:00Z',
+                                                          'updated_at': updated_at})
+    return {'context': [], 'root': root}
+
+
+def test_histories_are_reused_until_evicted(collection, session):
+    session.history_cache = HistoryCache(max_entries=2)
+    first, second, third = history('first'), history('second'), history('third')
+    session.set_responses(first, second, third, first)
+
+    run = collection.get_history(id=first['root']['uids']['id'])
+    assert collection.get_history(id=first['root']['uids']['id']) is run
+    assert session.num_calls == 1
+
+    collection.get_history(id=second['root']['uids']['id'])
+    collection.get_history(id=third['root']['uids']['id'])
+    again = collection.get_history(id=first['root']['uids']['id'])
+    assert again.name == 'first' and again is not run
+    assert session.num_calls == 4
+    assert session.history_cache.stats() == {
+        'hits': 1, 'disk_hits': 0, 'misses': 4, 'stale': 0, 'expired': 0, 'evictions': 2}
+
+
+def test_histories_are_not_cached_by_default(collection, session):
+    assert Session().history_cache is None
+    data = history('cake')
+    session.set_responses(data, data)
+
+    first = collection.get_history(id=data['root']['uids']['id'])
+    assert collection.get_history(id=data['root']['uids']['id']) is not first
+    assert session.num_calls == 2
+
+
+def test_cache_holds_at_least_one_history():
+    with pytest.raises(ValueError):
+        HistoryCache(max_entries=0)
+
+
+def test_histories_expire(collection, session, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(history_cache.time, 'time', lambda: now[0])
+    cache = HistoryCache(ttl=60)
+    data = history('cake')
+    session.set_responses(data, data)
+
+    collection.get_history(id=data['root']['uids']['id'], cache=cache)
+    now[0] += 59
+    collection.get_history(id=data['root']['uids']['id'], cache=cache)
+    assert session.num_calls == 1
+    now[0] += 1
+    collection.get_history(id=data['root']['uids']['id'], cache=cache)
+    assert session.num_calls == 2
+    assert cache.stats()['expired'] == 1
+
+
+def test_histories_are_validated_by_the_update_time_of_the_root(collection, session):
+    cache = HistoryCache(validate=True)
+    data = history('cake')
+    updated = history('cake', updated_at='2024-02-01T00:00:00Z')
+    updated['root']['uids'] = data['root']['uids']
+    session.set_responses(data['root'], data, data['root'], updated['root'], updated)
+    uid = data['root']['uids']['id']
+
+    run = collection.get_history(id=uid, cache=cache)
+    assert collection.get_history(id=uid, cache=cache) is run
+    assert [call.path for call in session.calls][-1] == \
+        'projects/{}/material-runs/id/{}'.format(collection.project_id, uid)
+    assert collection.get_history(id=uid, cache=cache) is not run
+    assert session.num_calls == 5
+    assert cache.stats()['stale'] == 1
+
+
+def test_histories_are_kept_on_disk(collection, session, tmp_path):
+    data = history('cake')
+    uid = data['root']['uids']['id']
+    session.set_responses(data)
+    collection.get_history(id=uid, cache=HistoryCache(directory=tmp_path))
+
+    cache = HistoryCache(directory=tmp_path)
+    assert collection.get_history(id=uid, cache=cache).name == 'cake'
+    assert session.num_calls == 1
+    assert cache.stats()['disk_hits'] == 1
+
+    # Histories saved by another version of the client are not used
+    path, = tmp_path.glob('*.json')
+    saved = json.loads(path.read_text())
+    path.write_text(json.dumps(dict(saved, version='0.0.0')))
+    session.set_responses(data)
+    collection.get_history(id=uid, cache=HistoryCache(directory=tmp_path))
+    assert session.num_calls == 2
+
+    cache.clear()
+    assert list(tmp_path.glob('*.json')) == [] and len(cache) == 0
+
+
+def test_expired_histories_on_disk_are_fetched_again(collection, session, tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(history_cache.time, 'time', lambda: now[0])
+    data = history('cake')
+    uid = data['root']['uids']['id']
+    session.set_responses(data, data)
+    collection.get_history(id=uid, cache=HistoryCache(directory=tmp_path))
+
+    now[0] += 60
+    cache = HistoryCache(ttl=60, directory=tmp_path)
+    collection.get_history(id=uid, cache=cache)
+    assert session.num_calls == 2
+    assert cache.stats() == {
+        'hits': 0, 'disk_hits': 0, 'misses': 1, 'stale': 0, 'expired': 1, 'evictions': 0}
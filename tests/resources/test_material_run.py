@@ -1,11 +1,14 @@
-from uuid import UUID
+from functools import partial
+from threading import Event
+from uuid import UUID, uuid4
 
 import pytest
 from citrine._session import Session
 from citrine._utils.functions import scrub_none
 from citrine.exceptions import BadRequest
 from citrine.resources.api_error import ValidationError
-from citrine.resources.material_run import MaterialRunCollection
+from citrine.resources.data_concepts import LazyDataConcepts, ListMode
+from citrine.resources.material_run import MaterialRun, MaterialRunCollection
 from gemd.entity.bounds.integer_bounds import IntegerBounds
 from gemd.entity.object.material_run import MaterialRun as GEMDRun
 
@@ -104,6 +107,76 @@ def test_get_history(collection, session):
     assert 'Historic MR' == run.name
 
 
+class HistorySession(FakeSession):
+    """A session that serves material histories by path, holding back the first one."""
+
+    def __init__(self, histories: dict):
+        super().__init__()
+        self.histories = histories
+        self.release = Event()
+
+    def checked_get(self, path: str, **kwargs) -> dict:
+        self.calls.append(FakeCall('GET', path))
+        material_id = path.rsplit('/', 1)[-1]
+        if material_id == next(iter(self.histories)):
+            assert self.release.wait(timeout=10)
+        return self.histories[material_id]
+
+
+def shared_histories(count: int) -> dict:
+    def link(obj):
+        return {'type': 'link_by_uid', 'scope': 'id', 'id': obj['uids']['id']}
+
+    template = {'type': 'material_template', 'name': 'template', 'uids': {'id': str(uuid4())}}
+    spec = {'type': 'material_spec', 'name': 'spec', 'uids': {'id': str(uuid4())},
+            'template': link(template)}
+    histories = dict()
+    for i in range(count):
+        root = {'type': 'material_run', 'name': 'run {}'.format(i), 'uids': {'id': str(uuid4())},
+                'spec': link(spec)}
+        histories[root['uids']['id']] = {'context': [spec, template], 'root': root}
+    return histories
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_get_histories_shares_context(max_workers):
+    session = HistorySession(shared_histories(10))
+    session.release.set()
+    collection = MaterialRunCollection(project_id=uuid4(), dataset_id=uuid4(), session=session)
+
+    runs = list(collection.get_histories(iter(session.histories), max_workers=max_workers))
+    assert sorted(run.uids['id'] for run in runs) == sorted(session.histories)
+    assert session.num_calls == 10
+    assert len({id(run.spec) for run in runs}) == 1
+    assert runs[0].spec.template.name == 'template'
+    assert runs[0].spec.template is runs[-1].spec.template
+
+
+def test_get_histories_streams_as_histories_arrive():
+    session = HistorySession(shared_histories(2))
+    collection = MaterialRunCollection(project_id=uuid4(), dataset_id=uuid4(), session=session)
+    first_id, second_id = session.histories
+
+    histories = collection.get_histories([first_id, second_id], max_workers=2)
+    assert next(histories).uids['id'] == second_id
+    session.release.set()
+    assert next(histories).uids['id'] == first_id
+    assert list(histories) == []
+
+
+def test_get_histories_stops_when_closed():
+    session = HistorySession(shared_histories(3))
+    collection = MaterialRunCollection(project_id=uuid4(), dataset_id=uuid4(), session=session)
+    first_id, second_id, _ = session.histories
+
+    histories = collection.get_histories(iter(session.histories), max_workers=2)
+    assert next(histories).uids['id'] == second_id
+    histories.close()
+    session.release.set()
+    # The history still in flight is abandoned, and no more are requested
+    assert session.num_calls == 2
+
+
 def test_get_material_run(collection, session):
     # Given
     run_data = MaterialRunDataFactory(name='Cake 2')
@@ -150,7 +223,7 @@ def test_list_material_runs(collection, session):
     assert sample_run['uids'] == runs[0].uids
 
 
-def test_cursor_paginated_searches(collection, session):
+def test_cursor_paginated_searches(collection, session, tmp_path):
     """
     Tests that search methods using cursor-pagination are hooked up correctly.
     There is no real search logic tested here.
@@ -171,6 +244,46 @@ def test_cursor_paginated_searches(collection, session):
     assert len(list(collection.list_by_attribute_bounds(
         {LinkByUIDFactory(): IntegerBounds(1, 5)}, per_page=2))) == len(all_runs)
 
+    # read-ahead does not change the results
+    names = [run['name'] for run in all_runs]
+    assert [r.name for r in collection.list(per_page=3, prefetch=2)] == names
+    assert [r.name for r in collection.list_by_name('unused', per_page=3, prefetch=2)] == names
+    assert [r.name for r in collection.list_by_tag('unused', per_page=3, prefetch=1)] == names
+    assert [r.name for r in collection.list_by_attribute_bounds(
+        {LinkByUIDFactory(): IntegerBounds(1, 5)}, per_page=3, prefetch=4)] == names
+
+    # listings can be resumed from the cursor of an interrupted one
+    for list_method in (collection.list, partial(collection.list_by_name, 'unused'),
+                        partial(collection.list_by_tag, 'unused'),
+                        partial(collection.list_by_attribute_bounds,
+                                {LinkByUIDFactory(): IntegerBounds(1, 5)})):
+        interrupted = list_method(per_page=3)
+        assert [next(interrupted).name for _ in range(7)] == names[:7]
+        resumed = list_method(per_page=3, cursor=interrupted.cursor)
+        assert [r.name for r in resumed] == names[6:]
+
+    checkpoint = tmp_path / 'runs.json'
+    interrupted = collection.list(per_page=3, checkpoint=checkpoint)
+    assert [next(interrupted).name for _ in range(5)] == names[:5]
+    interrupted.close()
+    assert checkpoint.exists()
+    assert [r.name for r in collection.list(per_page=3, checkpoint=checkpoint)] == names[3:]
+    assert not checkpoint.exists()
+
+    # lighter deserialization modes
+    raw = list(collection.list(per_page=3, mode=ListMode.RAW))
+    assert raw == all_runs
+    lazy = list(collection.list_by_name('unused', per_page=3, mode='lazy'))
+    assert [r.name for r in lazy] == names
+    assert all(isinstance(r, LazyDataConcepts) for r in lazy)
+    assert isinstance(lazy[0].build(), MaterialRun)
+    assert [r['name'] for r in collection.list_by_tag('unused', mode='raw')] == names
+    assert [r.uid for r in collection.list_by_attribute_bounds(
+        {LinkByUIDFactory(): IntegerBounds(1, 5)}, mode=ListMode.LAZY)] == \
+        [run['uids']['id'] for run in all_runs]
+    with pytest.raises(ValueError):
+        collection.list(mode='eager')
+
     # invalid inputs
     with pytest.raises(TypeError):
         collection.list_by_attribute_bounds([1, 5], per_page=2)
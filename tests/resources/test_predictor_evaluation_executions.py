@@ -6,7 +6,7 @@ from citrine._rest.resource import ResourceRef
 from citrine.informatics.executions.predictor_evaluation_execution import PredictorEvaluationExecution
 from citrine.informatics.predictor_evaluation_result import PredictorEvaluationResult
 from citrine.resources.predictor_evaluation_execution import PredictorEvaluationExecutionCollection
-from tests.utils.session import FakeSession, FakeCall
+from tests.utils.session import FakeSession, FakeCall, FakePaginatedSession
 
 
 @pytest.fixture
@@ -77,6 +77,19 @@ def test_workflow_execution_results(workflow_execution: PredictorEvaluationExecu
     assert session.last_call == FakeCall(method='GET', path=expected_path, params={"evaluator_name": "Example Evaluator"})
 
 
+def test_workflow_execution_results_lazy(workflow_execution: PredictorEvaluationExecution, session, example_result_dict):
+    # Given
+    session.set_response(example_result_dict)
+
+    # When
+    results = workflow_execution.results("Example Evaluator", lazy=True)
+
+    # Then
+    expected = PredictorEvaluationResult.build(example_result_dict)
+    assert results.evaluator == expected.evaluator
+    assert results.responses == expected.responses
+
+
 def test_trigger_workflow_execution(collection: PredictorEvaluationExecutionCollection, predictor_evaluation_execution_dict, session):
     # Given
     predictor_id = uuid.uuid4()
@@ -112,6 +125,26 @@ def test_list(collection: PredictorEvaluationExecutionCollection, session):
     )
 
 
+def test_list_concurrently_without_deduplication(predictor_evaluation_execution_dict):
+    # Given five executions, the second of which is listed twice
+    executions = [dict(predictor_evaluation_execution_dict, id=str(uuid.uuid4())) for _ in range(5)]
+    session = FakePaginatedSession()
+    session.set_response({"response": executions + executions[1:2]})
+    collection = PredictorEvaluationExecutionCollection(
+        project_id=uuid.uuid4(),
+        workflow_id=uuid.uuid4(),
+        session=session,
+    )
+
+    # When
+    listed = list(collection.list(per_page=4, max_workers=3))
+    duplicated = list(collection.list(per_page=4, max_workers=3, deduplicate=False))
+
+    # Then
+    assert [str(e.uid) for e in listed] == [e["id"] for e in executions]
+    assert len(duplicated) == 6
+
+
 def test_archive(workflow_execution, collection):
     collection.archive(workflow_execution.uid)
     expected_path = '/projects/{}/predictor-evaluation-executions/archive'.format(collection.project_id)
@@ -342,6 +342,15 @@ def test_list_projects(collection, session):
     assert 5 == len(projects)
 
 
+def test_list_projects_without_deduplication(collection, session):
+    projects_data = ProjectDataFactory.create_batch(5)
+    response = {'projects': projects_data + projects_data[1:2]}
+    session.set_responses(response, response)
+
+    assert len(list(collection.list())) == 5
+    assert len(list(collection.list(deduplicate=False))) == 6
+
+
 def test_list_projects_filters_non_projects(collection, session):
     # Given
     projects_data = ProjectDataFactory.create_batch(5)
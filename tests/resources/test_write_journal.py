@@ -0,0 +1,125 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from citrine.exceptions import NotFound
+from citrine.resources.gemd_resource import GEMDResourceCollection
+from citrine.resources.process_run import ProcessRun
+from citrine.resources.process_spec import ProcessSpec
+from citrine.resources.write_journal import WriteJournal, journal_keys
+from tests.utils.session import FakeSession
+
+
+def histories():
+    specs = [ProcessSpec("spec {}".format(i)) for i in range(60)]
+    runs = [ProcessRun("run {}".format(i), spec=spec) for i, spec in enumerate(specs)]
+    return specs, runs
+
+
+class FailingSession(FakeSession):
+    """A session whose connection is lost after a number of writes."""
+
+    def __init__(self, writes: int):
+        super().__init__()
+        self.writes = writes
+
+    def checked_put(self, path: str, json: dict, **kwargs) -> dict:
+        if self.writes == 0:
+            raise NotFound(path)
+        self.writes -= 1
+        return super().checked_put(path, json, **kwargs)
+
+
+def first_key(model) -> str:
+    key, = journal_keys([model])
+    return key
+
+
+def test_journal_keys():
+    specs, runs = histories()
+    again, _ = histories()
+    assert journal_keys(specs) == journal_keys(again)
+    assert len(set(journal_keys(specs + runs))) == 120
+    # Identical objects are told apart by their position, and objects with uids by them
+    twins = [ProcessSpec("twin"), ProcessSpec("twin"), ProcessSpec("twin", uids={'lims': '1'})]
+    first, second, third = journal_keys(twins)
+    assert second == first + '#2'
+    assert third == 'uids:[["lims", "1"]]'
+    # Objects are named the same whether or not the objects they link to are listed first
+    assert journal_keys(runs) == journal_keys(specs + runs)[60:]
+
+
+def test_resume_interrupted_registration(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    project_id, dataset_id = uuid4(), uuid4()
+
+    # The first run writes one batch of 50 specs, then fails
+    specs, runs = histories()
+    collection = GEMDResourceCollection(project_id, dataset_id, FailingSession(writes=1))
+    with pytest.raises(NotFound):
+        collection.register_all(specs + runs, max_batch_size=50, journal=path)
+    first_ids = [spec.uids['id'] for spec in specs]
+
+    # The second run is given the same objects, built again
+    specs, runs = histories()
+    session = FakeSession()
+    collection = GEMDResourceCollection(project_id, dataset_id, session)
+    registered = collection.register_all(specs + runs, max_batch_size=50, journal=path)
+
+    sent = [obj['name'] for call in session.calls for obj in call.json['objects']]
+    assert sent == ["spec {}".format(i) for i in range(50, 60)] + \
+        ["run {}".format(i) for i in range(60)]
+    assert [spec.uids['id'] for spec in specs] == first_ids
+    assert registered[:50] == specs[:50]
+    assert [run.spec.id for run in registered[60:]] == first_ids
+
+    # Nothing is left to write after that, with the journal given by path or already open
+    session.calls = []
+    specs, runs = histories()
+    collection.register_all(specs + runs, journal=path)
+    with WriteJournal(path) as journal:
+        collection.register_all(histories()[0], journal=journal)
+    assert session.calls == []
+    assert [spec.uids['id'] for spec in specs] == first_ids
+
+
+def test_journal_ignores_interrupted_line(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    spec = ProcessSpec("spec", uids={'id': str(uuid4())})
+    key, = journal_keys([spec])
+    with WriteJournal(path) as journal:
+        batch = journal.submitted([key], [spec])
+        journal.committed_batch(batch, [key], [spec])
+    with open(path, 'a') as f:
+        f.write(json.dumps({'batch': 1, 'status': 'submitted'})[:10])
+
+    with WriteJournal(path) as journal:
+        assert journal.committed(key)
+        assert journal.uids(key) == {'id': spec.uids['id']}
+        assert journal.submitted([key], [spec]) == 1
+
+
+def test_journal_replays_a_truncated_last_line(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    spec = ProcessSpec("spec", uids={'id': str(uuid4())})
+    key = first_key(spec)
+    with WriteJournal(path) as journal:
+        batch = journal.submitted([key], [spec])
+        journal.committed_batch(batch, [key], [spec])
+    # The process died while writing that the batch was accepted
+    text = path.read_text()
+    last_line = text.splitlines()[-1]
+    path.write_text(text[:len(text) - len(last_line) // 2])
+
+    with WriteJournal(path) as journal:
+        assert not journal.committed(key)
+        assert journal.uids(key) == {'id': spec.uids['id']}
+        assert journal.submitted([key], [spec]) == 1
+
+
+def test_journal_is_not_for_dry_runs(tmp_path):
+    collection = GEMDResourceCollection(uuid4(), uuid4(), FakeSession())
+    with pytest.raises(ValueError):
+        collection.register_all([ProcessSpec("spec")], dry_run=True,
+                                journal=tmp_path / 'journal.jsonl')
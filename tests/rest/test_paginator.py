@@ -1,9 +1,13 @@
 """Test the Paginator"""
+import time
 from uuid import uuid4
 
+import pytest
+
 from mock import Mock
 
 from citrine._rest.paginator import Paginator
+from citrine.deduplication import BloomDeduplicator, ExactDeduplicator, WindowDeduplicator
 
 
 class DummyResource:
@@ -63,3 +67,76 @@ def mocked_fetcher(*args):
     args_in_lists.append(([], ""))
     mock_fetcher.side_effect = list(args_in_lists)
     return mock_fetcher
+
+
+def page_fetcher(items, delay=0.0):
+    """A thread-safe fetcher that serves `items` by page number, recording the pages asked for."""
+    requested = []
+
+    def fetch(page=None, per_page=100):
+        time.sleep(delay)
+        page = 1 if page is None else page
+        requested.append(page)
+        return items[(page - 1) * per_page:page * per_page], ""
+
+    return fetch, requested
+
+
+def test_concurrent_pagination_matches_serial():
+    items = [DummyResource(str(i)) for i in range(53)]
+    fetch, requested = page_fetcher(items, delay=0.01)
+
+    result = list(Paginator().paginate(fetch, lambda x: x, per_page=5, max_workers=4))
+
+    assert result == items
+    # The last page is short, so at most max_workers - 1 pages past it are requested
+    assert 11 <= len(requested) <= 14
+    assert sorted(requested)[:11] == list(range(1, 12))
+
+
+def test_concurrent_pagination_deduplicates_and_stops_on_repeat():
+    fetch, _ = page_fetcher([a, b, b, c, c, a, b])
+    result = Paginator().paginate(fetch, lambda x: x, per_page=1, max_workers=3)
+    assert list(result) == [a, b, c]
+
+
+def test_concurrent_pagination_propagates_errors():
+    def fetch(page=None, per_page=100):
+        if page == 3:
+            raise ValueError("boom")
+        return [DummyResource(str(page))], "next_uri"
+
+    result = Paginator().paginate(fetch, lambda x: x, per_page=1, max_workers=2)
+    with pytest.raises(ValueError):
+        list(result)
+
+
+def test_concurrent_pagination_ignored_for_single_page():
+    fetch, requested = page_fetcher([a, b, c])
+    result = Paginator().paginate(fetch, lambda x: x, page=2, per_page=1, max_workers=4)
+    with pytest.warns(DeprecationWarning):
+        assert list(result) == [b]
+    assert requested == [2]
+
+
+@pytest.mark.parametrize('deduplicate', [
+    True,
+    ExactDeduplicator(),
+    WindowDeduplicator(pages=2),
+    BloomDeduplicator(capacity=100, false_positive_rate=0.001),
+])
+def test_deduplication_strategies(deduplicate):
+    result = Paginator().paginate(mocked_fetcher(a, b, b, c, c), lambda x: x, per_page=1,
+                                  deduplicate=deduplicate)
+    assert list(result) == [a, b, c]
+
+
+def test_window_deduplication_forgets_distant_repeats():
+    result = Paginator().paginate(mocked_fetcher(a, b, c, b), lambda x: x, per_page=1,
+                                  deduplicate=WindowDeduplicator(pages=2))
+    assert list(result) == [a, b, c, b]
+
+
+def test_elements_without_uid_are_not_deduplicated():
+    result = Paginator().paginate(mocked_fetcher('a', 'b', 'b'), lambda x: x, per_page=1)
+    assert list(result) == ['a', 'b', 'b']
@@ -0,0 +1,307 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import jwt
+import mock
+import pytest
+import pytz
+from urllib3.util.retry import Retry
+
+from citrine import AsyncCitrine
+from citrine._async_session import AsyncSession, AsyncResponse
+from citrine.exceptions import (
+    BadRequest,
+    CitrineException,
+    NotFound,
+    Unauthorized,
+    UnauthorizedRefreshToken,
+    WorkflowConflictException,
+    WorkflowNotReadyException)
+
+web = pytest.importorskip('aiohttp.web')
+test_utils = pytest.importorskip('aiohttp.test_utils')
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def access_token(expiration: datetime) -> str:
+    return jwt.encode(payload={'exp': expiration.timestamp()}, key='garbage').decode('utf-8')
+
+
+class FakePlatform:
+    """A tiny aiohttp application standing in for the platform API."""
+
+    def __init__(self):
+        self.refresh_count = 0
+        self.refresh_status = 200
+        self.requests = []
+        self.responses = {}
+
+    def respond(self, method, path, *responses):
+        self.responses[(method, path)] = list(responses)
+
+    async def refresh(self, request):
+        self.refresh_count += 1
+        # Yield to the loop so concurrent callers have a chance to pile up
+        await asyncio.sleep(0.01)
+        if self.refresh_status != 200:
+            return web.Response(status=self.refresh_status)
+        token = access_token(datetime(2100, 1, 1, tzinfo=pytz.utc))
+        return web.json_response({'access_token': token})
+
+    async def handle(self, request):
+        body = await request.json() if request.can_read_body else None
+        self.requests.append((request.method, request.path, request.query, body,
+                              request.headers.get('Authorization')))
+        queue = self.responses.get((request.method, request.path), [])
+        status, payload, headers = queue.pop(0) if len(queue) > 1 else queue[0]
+        if payload is None:
+            return web.Response(status=status, headers=headers)
+        return web.json_response(payload, status=status, headers=headers)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post('/api/v1/tokens/refresh', self.refresh)
+        app.router.add_route('*', '/{tail:.*}', self.handle)
+        self.server = test_utils.TestServer(app)
+        await self.server.start_server()
+        session = AsyncSession(refresh_token='12345', scheme='http',
+                               host=self.server.host, port=str(self.server.port))
+        return session
+
+    async def stop(self):
+        await self.server.close()
+
+
+def with_platform(test):
+    """Run an async test against a fresh fake platform and session."""
+    def wrapper():
+        async def inner():
+            platform = FakePlatform()
+            session = await platform.start()
+            try:
+                await test(platform, session)
+            finally:
+                await session.close()
+                await platform.stop()
+        run(inner())
+    wrapper.__name__ = test.__name__
+    return wrapper
+
+
+@with_platform
+async def test_get_refreshes_token(platform, session):
+    platform.respond('GET', '/api/v1/foo', (200, {'foo': 'bar'}, None))
+
+    assert await session.get_resource('/foo') == {'foo': 'bar'}
+    assert platform.refresh_count == 1
+    assert session.access_token_expiration == datetime(2100, 1, 1)
+    assert platform.requests[0][4] == 'Bearer ' + session.access_token
+
+
+@with_platform
+async def test_concurrent_requests_share_one_refresh(platform, session):
+    platform.respond('GET', '/api/v1/foo', (200, {'foo': 'bar'}, None))
+
+    results = await asyncio.gather(*[session.get_resource('foo') for _ in range(20)])
+
+    assert results == [{'foo': 'bar'}] * 20
+    assert platform.refresh_count == 1
+
+
+@with_platform
+async def test_refresh_token_failure(platform, session):
+    platform.refresh_status = 401
+    with pytest.raises(UnauthorizedRefreshToken):
+        await session.get_resource('/foo')
+
+
+@with_platform
+async def test_post_refreshes_token_when_denied(platform, session):
+    platform.respond('POST', '/api/v1/foo',
+                     (401, {'reason': 'invalid-token'}, None),
+                     (200, {'foo': 'bar'}, None))
+    session.access_token = access_token(datetime(2100, 1, 1, tzinfo=pytz.utc))
+    session.access_token_expiration = datetime.utcnow() + timedelta(minutes=3)
+
+    assert await session.post_resource('/foo', json={'data': 'hi'}) == {'foo': 'bar'}
+    assert platform.refresh_count == 1
+    assert [r[3] for r in platform.requests] == [{'data': 'hi'}] * 2
+
+
+@with_platform
+async def test_second_invalid_token_is_not_retried(platform, session):
+    platform.respond('GET', '/api/v1/foo', (401, {'reason': 'invalid-token'}, None))
+    session.access_token = access_token(datetime(2100, 1, 1, tzinfo=pytz.utc))
+    session.access_token_expiration = datetime.utcnow() + timedelta(minutes=3)
+
+    with pytest.raises(Unauthorized):
+        await session.get_resource('/foo')
+    assert platform.refresh_count == 1
+    assert len(platform.requests) == 2
+
+
+@pytest.mark.parametrize('payload', [None, ['not', 'an', 'object']])
+def test_unauthorized_without_a_reason(payload):
+    @with_platform
+    async def check(platform, session):
+        # Neither a missing body nor one that isn't an object prompts a refresh
+        platform.respond('GET', '/api/v1/foo', (401, payload, None))
+        session.access_token = access_token(datetime(2100, 1, 1, tzinfo=pytz.utc))
+        session.access_token_expiration = datetime.utcnow() + timedelta(minutes=3)
+        with pytest.raises(Unauthorized):
+            await session.get_resource('/foo')
+        assert platform.refresh_count == 0
+    check()
+
+
+@with_platform
+async def test_non_retryable_status_is_sent_once(platform, session):
+    platform.respond('GET', '/api/v1/foo', (404, {'message': 'missing'}, None))
+
+    with pytest.raises(NotFound):
+        await session.get_resource('/foo')
+    assert len(platform.requests) == 1
+
+
+@with_platform
+async def test_refresh_is_skipped_once_the_token_has_changed(platform, session):
+    session.access_token = access_token(datetime(2100, 1, 1, tzinfo=pytz.utc))
+
+    await session._refresh_access_token(stale_token='an older token')
+    assert platform.refresh_count == 0
+
+
+@with_platform
+async def test_unreadable_retry_after_falls_back_to_backoff(platform, session):
+    platform.respond('GET', '/api/v1/foo',
+                     (503, None, {'Retry-After': 'later'}),
+                     (200, {'foo': 'bar'}, None))
+
+    assert await session.get_resource('/foo') == {'foo': 'bar'}
+    assert len(platform.requests) == 2
+
+
+@with_platform
+async def test_session_as_context_manager(platform, session):
+    platform.respond('GET', '/api/v1/foo', (200, {'foo': 'bar'}, None))
+
+    async with session as entered:
+        assert entered is session
+        assert await session.get_resource('/foo', params=None) == {'foo': 'bar'}
+    assert session._client is None
+
+
+@pytest.mark.parametrize('status,exception', [
+    (400, BadRequest),
+    (401, Unauthorized),
+    (403, Unauthorized),
+    (404, NotFound),
+    (409, WorkflowConflictException),
+    (425, WorkflowNotReadyException),
+    (500, CitrineException),
+])
+def test_status_code_mapping(status, exception):
+    @with_platform
+    async def check(platform, session):
+        # POSTs are not retried on status, which keeps the 500 case fast
+        platform.respond('POST', '/api/v1/foo', (status, {'message': 'nope'}, None))
+        with pytest.raises(exception):
+            await session.post_resource('/foo', json={})
+    check()
+
+
+@with_platform
+async def test_retry_after_status(platform, session):
+    platform.respond('GET', '/api/v1/foo',
+                     (503, None, {'Retry-After': '0'}),
+                     (200, {'foo': 'bar'}, None))
+
+    assert await session.get_resource('/foo') == {'foo': 'bar'}
+    assert len(platform.requests) == 2
+
+
+@with_platform
+async def test_retries_exhausted_returns_last_response(platform, session):
+    session.retries = Retry(total=2, status=1, backoff_factor=0,
+                            status_forcelist=[502])
+    platform.respond('DELETE', '/api/v1/foo', (502, {'message': 'bad gateway'}, None))
+
+    with pytest.raises(CitrineException):
+        await session.delete_resource('/foo')
+    assert len(platform.requests) == 2
+
+
+@with_platform
+async def test_query_params_are_encoded_like_requests(platform, session):
+    platform.respond('PUT', '/api/v1/foo', (200, {}, None))
+
+    await session.put_resource('foo', json={}, params={'dry_run': False, 'tags': ['a', 'b'],
+                                                       'skip': None})
+
+    query = platform.requests[0][2]
+    assert query.getall('dry_run') == ['False']
+    assert query.getall('tags') == ['a', 'b']
+    assert 'skip' not in query
+
+
+@with_platform
+async def test_bad_json_response(platform, session):
+    platform.respond('DELETE', '/api/v1/foo', (200, None, None))
+    assert await session.delete_resource('/foo') == {}
+
+
+def test_connection_error_retry():
+    session = AsyncSession(refresh_token='12345', scheme='http', host='citrine-testing.fake')
+    session.retries = Retry(total=1, connect=1, backoff_factor=0)
+    response = AsyncResponse(status_code=200, reason='OK', headers={}, content=b'{}')
+    side_effects = [ConnectionError(), response]
+
+    async def fake_send(*args, **kwargs):
+        effect = side_effects.pop(0)
+        if isinstance(effect, Exception):
+            raise effect
+        return effect
+
+    with mock.patch.object(session, '_send', side_effect=fake_send):
+        assert run(session._request_with_retry('GET', 'foo')) is response
+
+    side_effects = [ConnectionError(), ConnectionError()]
+    with mock.patch.object(session, '_send', side_effect=fake_send):
+        with pytest.raises(ConnectionError):
+            run(session._request_with_retry('GET', 'foo'))
+
+
+def test_cursor_paged_resource():
+    full_result_set = list(range(26))
+
+    async def fake_request(*_, params=None, **__):
+        page_size = params['per_page']
+        start = int(params['cursor']) + 1 if 'cursor' in params else 0
+        contents = full_result_set[start:start + page_size]
+        response = {'contents': contents}
+        if contents:
+            response['next'] = str(contents[-1])
+        return response
+
+    async def collect(per_page):
+        return [x async for x in AsyncSession.cursor_paged_resource(
+            fake_request, 'foo', per_page=per_page)]
+
+    for per_page in (10, 26, 40):
+        assert run(collect(per_page)) == full_result_set
+
+
+def test_async_citrine():
+    async def inner():
+        async with AsyncCitrine(api_key='1234', host='citrine.io') as citrine:
+            assert citrine.session.refresh_token == '1234'
+            assert citrine.session._get_client() is citrine.session._get_client()
+        assert citrine.session._client is None
+    run(inner())
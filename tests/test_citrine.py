@@ -1,3 +1,5 @@
+import requests.adapters
+
 from citrine import Citrine
 
 
@@ -13,3 +15,10 @@ def test_citrine_project_session():
 def test_citrine_user_session():
     citrine = Citrine(api_key='foo', host='bar')
     assert citrine.session == citrine.users.session
+
+
+def test_citrine_pool_defaults():
+    adapter = Citrine(api_key='foo', host='bar').session.get_adapter('https://bar')
+    assert adapter._pool_connections == requests.adapters.DEFAULT_POOLSIZE
+    assert adapter._pool_maxsize == requests.adapters.DEFAULT_POOLSIZE
+    assert adapter._pool_block == requests.adapters.DEFAULT_POOLBLOCK
@@ -0,0 +1,47 @@
+from uuid import uuid4
+
+import pytest
+
+from citrine.deduplication import BloomDeduplicator, ExactDeduplicator, WindowDeduplicator
+
+
+def test_exact_remembers_everything():
+    dedup = ExactDeduplicator()
+    uids = [uuid4() for _ in range(100)]
+    assert all(dedup.add(uid) for uid in uids)
+    dedup.start_page()
+    assert not any(dedup.add(uid) for uid in uids)
+
+
+def test_window_forgets_old_pages():
+    dedup = WindowDeduplicator(pages=2)
+    dedup.start_page()
+    assert dedup.add('a')
+    assert not dedup.add('a')
+    dedup.start_page()
+    assert dedup.add('b')
+    assert not dedup.add('a')
+    dedup.start_page()
+    assert not dedup.add('b')
+    assert dedup.add('a')
+
+
+def test_window_validation():
+    with pytest.raises(ValueError):
+        WindowDeduplicator(pages=0)
+
+
+def test_bloom_filter():
+    dedup = BloomDeduplicator(capacity=1000, false_positive_rate=0.01)
+    uids = [uuid4() for _ in range(1000)]
+    new = sum(dedup.add(uid) for uid in uids)
+    # Every repeat is caught; only a few new uids may be mistaken for repeats
+    assert new >= 980
+    assert not any(dedup.add(uid) for uid in uids)
+    assert len(dedup._bits) < 1500
+
+
+@pytest.mark.parametrize('capacity,rate', [(0, 0.1), (10, 0), (10, 1)])
+def test_bloom_validation(capacity, rate):
+    with pytest.raises(ValueError):
+        BloomDeduplicator(capacity=capacity, false_positive_rate=rate)
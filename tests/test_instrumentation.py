@@ -0,0 +1,91 @@
+import pytest
+
+from citrine.instrumentation import (
+    BatchSizeEvent,
+    LatencyHistogram,
+    RequestEvent,
+    RequestMetrics,
+    route_template)
+
+
+def make_event(route='projects/{id}', elapsed=0.1, status_code=200, method='GET', retries=0):
+    return RequestEvent(method=method, path=route, route=route, version='v1',
+                        status_code=status_code, elapsed=elapsed, bytes_sent=10,
+                        bytes_received=100, retries=retries)
+
+
+@pytest.mark.parametrize('path,route', [
+    ('/projects', 'projects'),
+    ('projects/3f0c4b4e-8d4e-4a0c-9a53-2b3c1f1a1e22/datasets/'
+     'a8f3e0e5-2b6b-4f1c-8b71-1c7cbd2fa0c5/material-runs',
+     'projects/{id}/datasets/{id}/material-runs'),
+    ('/projects/3f0c4b4e-8d4e-4a0c-9a53-2b3c1f1a1e22/modules/12/versions',
+     'projects/{id}/modules/{id}/versions'),
+    ('projects/abc123/material-runs/id/456', 'projects/abc123/material-runs/id/{id}'),
+])
+def test_route_template(path, route):
+    assert route_template(path) == route
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram(precision=0.01)
+    assert histogram.quantile(0.5) is None
+
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.total == pytest.approx(500.5)
+    assert histogram.max == 1.0
+    assert histogram.quantile(0.50) == pytest.approx(0.5, rel=0.02)
+    assert histogram.quantile(0.95) == pytest.approx(0.95, rel=0.02)
+    assert histogram.quantile(0.99) == pytest.approx(0.99, rel=0.02)
+    assert histogram.quantile(1.0) <= 1.0
+
+
+def test_latency_histogram_extremes():
+    histogram = LatencyHistogram()
+    # Values under a microsecond share the lowest bucket, and none are reported above the max
+    histogram.record(0.0)
+    histogram.record(1e-9)
+    histogram.record(3600.0)
+
+    assert histogram.quantile(0.0) == pytest.approx(1e-6, rel=0.02)
+    assert histogram.quantile(0.5) == pytest.approx(1e-6, rel=0.02)
+    assert histogram.quantile(1.0) == pytest.approx(3600.0, rel=0.01)
+    assert histogram.quantile(1.0) <= 3600.0
+    assert histogram.max == 3600.0
+
+
+def test_batch_size_event():
+    event = BatchSizeEvent(object_type='material_run', previous=500, size=250,
+                           reason='too_large', count=500, bytes_sent=2 ** 22, elapsed=1.5)
+    assert repr(event) == '<BatchSizeEvent material_run 500 -> 250 (too_large)>'
+
+
+def test_request_metrics():
+    metrics = RequestMetrics()
+    metrics('not a request event')
+    for _ in range(9):
+        metrics(make_event(elapsed=0.1))
+    metrics(make_event(elapsed=2.0, status_code=500, retries=3))
+    metrics(make_event(route='users/me', elapsed=0.05))
+
+    summary = metrics.summary()
+    assert set(summary) == {('GET', 'projects/{id}'), ('GET', 'users/me')}
+    projects = summary[('GET', 'projects/{id}')]
+    assert projects['count'] == 10
+    assert projects['total_time'] == pytest.approx(2.9)
+    assert projects['p50'] == pytest.approx(0.1, rel=0.02)
+    assert projects['p99'] == pytest.approx(2.0, rel=0.02)
+    assert projects['max'] == 2.0
+    assert projects['bytes_sent'] == 100
+    assert projects['bytes_received'] == 1000
+    assert projects['retries'] == 3
+    assert projects['errors'] == 1
+
+    assert [key for key, _ in metrics.slowest()] == [('GET', 'projects/{id}'), ('GET', 'users/me')]
+    assert 'projects/{id}' in repr(make_event())
+
+    metrics.reset()
+    assert metrics.summary() == {}
@@ -1,4 +1,10 @@
 import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
 
 import jwt
 import pytest
@@ -9,7 +15,9 @@ from citrine.exceptions import (
     WorkflowConflictException,
     WorkflowNotReadyException,
     RetryableException,
-    BadRequest)
+    BadRequest,
+    GatewayTimeout,
+    PayloadTooLarge)
 
 from datetime import datetime, timedelta
 import pytz
@@ -17,7 +25,9 @@ import mock
 import requests
 import requests_mock
 from urllib.parse import urlsplit
-from citrine._session import Session
+from citrine import Citrine
+from citrine._session import Session, PoolStats
+from citrine.instrumentation import RequestMetrics
 from citrine.exceptions import UnauthorizedRefreshToken, Unauthorized, NotFound
 from tests.utils.session import make_fake_cursor_request_function
 
@@ -59,6 +69,73 @@ def test_get_refreshes_token(session: Session):
     assert datetime(2019, 3, 14) == session.access_token_expiration
 
 
+def test_concurrent_requests_share_one_refresh(session: Session):
+    session.access_token_expiration = datetime.utcnow() - timedelta(minutes=1)
+    token_refresh_response = refresh_token(datetime(2100, 3, 14, tzinfo=pytz.utc))
+
+    def slow_refresh(request, context):
+        # Give the other workers time to pile up behind the refresh in flight
+        time.sleep(0.05)
+        return token_refresh_response
+
+    with requests_mock.Mocker() as m:
+        refresh = m.post('http://citrine-testing.fake/api/v1/tokens/refresh', json=slow_refresh)
+        m.get('http://citrine-testing.fake/api/v1/foo', json={'foo': 'bar'})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: session.get_resource('/foo'), range(16)))
+
+    assert results == [{'foo': 'bar'}] * 16
+    assert refresh.call_count == 1
+    assert session.access_token == token_refresh_response['access_token']
+    assert datetime(2100, 3, 14) == session.access_token_expiration
+
+
+def test_expiring_token_refreshes_in_background(session: Session):
+    session.access_token = 'about-to-expire'
+    session.access_token_expiration = datetime.utcnow() + timedelta(seconds=30)
+    token_refresh_response = refresh_token(datetime(2100, 3, 14, tzinfo=pytz.utc))
+
+    with requests_mock.Mocker() as m:
+        refresh = m.post('http://citrine-testing.fake/api/v1/tokens/refresh',
+                         json=token_refresh_response)
+        m.get('http://citrine-testing.fake/api/v1/foo', json={'foo': 'bar'})
+
+        assert session.get_resource('/foo') == {'foo': 'bar'}
+        session._background_refresh.join(timeout=5)
+
+    assert refresh.call_count == 1
+    assert datetime(2100, 3, 14) == session.access_token_expiration
+    assert not session._refresh_lock.locked()
+
+
+def test_background_refresh_failure_is_not_raised(session: Session):
+    session.access_token = 'about-to-expire'
+    expiration = datetime.utcnow() + timedelta(seconds=30)
+    session.access_token_expiration = expiration
+
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/tokens/refresh', status_code=401)
+        m.get('http://citrine-testing.fake/api/v1/foo', json={'foo': 'bar'})
+
+        assert session.get_resource('/foo') == {'foo': 'bar'}
+        session._background_refresh.join(timeout=5)
+
+    assert session.access_token == 'about-to-expire'
+    assert session.access_token_expiration == expiration
+    assert not session._refresh_lock.locked()
+
+
+def test_background_refresh_is_single_flight(session: Session):
+    session.access_token_expiration = datetime.utcnow() + timedelta(seconds=30)
+    session._refresh_lock.acquire()
+    try:
+        session._start_background_refresh()
+        assert session._background_refresh is None
+    finally:
+        session._refresh_lock.release()
+
+
 def test_get_refresh_token_failure(session: Session):
     session.access_token_expiration = datetime.utcnow() - timedelta(minutes=1)
 
@@ -84,6 +161,16 @@ def test_get_not_found(session: Session):
             session.get_resource('/foo')
 
 
+def test_payload_too_large_and_gateway_timeout(session: Session):
+    with requests_mock.Mocker() as m:
+        m.put('http://citrine-testing.fake/api/v1/foo', status_code=413)
+        with pytest.raises(PayloadTooLarge):
+            session.put_resource('/foo', json={})
+        m.put('http://citrine-testing.fake/api/v1/foo', status_code=504)
+        with pytest.raises(GatewayTimeout):
+            session.put_resource('/foo', json={})
+
+
 class SessionTests(unittest.TestCase):
     @mock.patch.object(Session, '_refresh_access_token')
     @mock.patch.object(requests.Session, 'request')
@@ -244,6 +331,90 @@ def test_cursor_paged_resource():
     assert list(Session.cursor_paged_resource(fake_request, 'foo', forward=True, per_page=26)) == full_result_set
     assert list(Session.cursor_paged_resource(fake_request, 'foo', forward=True, per_page=40)) == full_result_set
 
+    # as should reading ahead
+    for prefetch in (1, 2, 5):
+        assert list(Session.cursor_paged_resource(fake_request, 'foo', per_page=4,
+                                                  prefetch=prefetch)) == full_result_set
+
+
+def test_cursor_paged_resource_prefetch_is_bounded():
+    full_result_set = list(range(100))
+    fake_request = make_fake_cursor_request_function(full_result_set)
+    calls = []
+
+    def counting_request(*args, **kwargs):
+        calls.append(kwargs['params'].get('cursor'))
+        return fake_request(*args, **kwargs)
+
+    results = Session.cursor_paged_resource(counting_request, 'foo', per_page=10, prefetch=2)
+    assert next(results) == 0
+    time.sleep(0.2)
+    # the page being consumed, two buffered pages, and one waiting to be buffered
+    assert len(calls) <= 4
+    results.close()
+
+
+def test_cursor_paged_resource_resumes_from_cursor():
+    full_result_set = list(range(26))
+    fake_request = make_fake_cursor_request_function(full_result_set)
+
+    results = Session.cursor_paged_resource(fake_request, 'foo', per_page=10)
+    assert results.cursor is None
+    consumed = [next(results) for _ in range(15)]
+    assert consumed == full_result_set[:15]
+    # The cursor points at the start of the page holding the last result
+    assert results.cursor == '9'
+    results.close()
+
+    resumed = Session.cursor_paged_resource(fake_request, 'foo', per_page=10,
+                                            cursor=results.cursor)
+    assert list(resumed) == full_result_set[10:]
+    assert resumed.exhausted
+
+    mapped = Session.cursor_paged_resource(fake_request, 'foo', per_page=10).map(str)
+    assert next(mapped) == '0'
+    assert mapped.cursor is None
+    assert list(mapped)[-1] == '25'
+    assert mapped.cursor == '25'
+    assert mapped.exhausted
+
+
+def test_cursor_paged_resource_checkpoint(tmp_path):
+    full_result_set = list(range(26))
+    fake_request = make_fake_cursor_request_function(full_result_set)
+    checkpoint = tmp_path / 'listing.json'
+
+    results = Session.cursor_paged_resource(fake_request, 'foo', per_page=10,
+                                            checkpoint=checkpoint, params={'name': 'x'})
+    consumed = [next(results) for _ in range(21)]
+    results.close()
+    assert json.loads(checkpoint.read_text())['cursor'] == '19'
+
+    # A later run picks up where the checkpoint left off, repeating the interrupted page
+    resumed = Session.cursor_paged_resource(fake_request, 'foo', per_page=10,
+                                            checkpoint=str(checkpoint), params={'name': 'x'})
+    assert consumed[:20] + list(resumed) == full_result_set
+    assert not checkpoint.exists()
+
+    # A checkpoint cannot be used to resume a different listing
+    interrupted = Session.cursor_paged_resource(fake_request, 'foo', per_page=10,
+                                                checkpoint=checkpoint, params={'name': 'x'})
+    list(zip(range(11), interrupted))
+    interrupted.close()
+    with pytest.raises(ValueError):
+        Session.cursor_paged_resource(fake_request, 'foo', per_page=10, checkpoint=checkpoint,
+                                      params={'name': 'y'})
+
+
+def test_cursor_paged_resource_checkpoint_of_an_empty_listing(tmp_path):
+    checkpoint = tmp_path / 'listing.json'
+    fake_request = make_fake_cursor_request_function([])
+
+    # A listing that ends on its first page never saves a checkpoint to remove
+    assert list(Session.cursor_paged_resource(fake_request, 'foo', per_page=10,
+                                              checkpoint=checkpoint)) == []
+    assert not checkpoint.exists()
+
 
 def test_bad_json_response(session: Session):
     with requests_mock.Mocker() as m:
@@ -282,3 +453,205 @@ def test_base_url_assembly():
             assert str(base.port) == scenario.get('port', default_base.port)
         else:
             assert base.port is None
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    flaky_calls = 0
+    failed_calls = 0
+
+    def do_GET(self):
+        if self.path.endswith(('/gateway-timeout', '/bad-gateway')):
+            _KeepAliveHandler.failed_calls += 1
+            self.send_response(504 if self.path.endswith('/gateway-timeout') else 502)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if self.path.endswith('/flaky'):
+            _KeepAliveHandler.flaky_calls += 1
+            if _KeepAliveHandler.flaky_calls == 1:
+                self.send_response(503)
+                self.send_header('Retry-After', '0')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+        body = json.dumps({'path': self.path}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ThreadingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def local_server():
+    server = _ThreadingServer(('127.0.0.1', 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_parameters():
+    session = Session(pool_connections=3, pool_maxsize=32, pool_block=True)
+    adapter = session.get_adapter('https://citrine-testing.fake')
+    assert adapter is session.get_adapter('http://citrine-testing.fake')
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+
+    citrine_session = Citrine(api_key='foo', host='bar', pool_maxsize=64).session
+    assert citrine_session.get_adapter('https://bar')._pool_maxsize == 64
+
+
+def test_pool_stats(local_server):
+    session = Session(refresh_token='12345', scheme='http', host='127.0.0.1',
+                      port=str(local_server.server_address[1]), pool_maxsize=4)
+    session.access_token_expiration = datetime.utcnow() + timedelta(minutes=3)
+    assert session.pool_stats() == []
+
+    for _ in range(5):
+        assert session.get_resource('/foo') == {'path': '/api/v1/foo'}
+
+    stats, = session.pool_stats()
+    assert (stats.scheme, stats.host, stats.port) == ('http', '127.0.0.1',
+                                                      local_server.server_address[1])
+    assert stats.maxsize == 4
+    assert stats.in_use == 0
+    assert stats.idle == 1
+    assert stats.num_requests == 5
+    assert stats.num_connections == 1
+    assert stats.reuse_ratio == pytest.approx(0.8)
+    assert 'reuse_ratio=0.80' in repr(stats)
+
+
+def test_gateway_timeout_after_retries(local_server):
+    session = Session(refresh_token='12345', scheme='http', host='127.0.0.1',
+                      port=str(local_server.server_address[1]))
+    session.access_token_expiration = datetime.utcnow() + timedelta(minutes=3)
+    adapter = session.get_adapter('http://127.0.0.1')
+    adapter.max_retries = adapter.max_retries.new(backoff_factor=0)
+
+    # Every retry is used up before the timeout is raised
+    _KeepAliveHandler.failed_calls = 0
+    with pytest.raises(GatewayTimeout):
+        session.get_resource('/gateway-timeout')
+    assert _KeepAliveHandler.failed_calls == 6
+
+    # Other statuses that are retried until they run out are left as they are
+    with pytest.raises(requests.exceptions.RetryError):
+        session.get_resource('/bad-gateway')
+
+
+def test_pool_stats_skips_adapters_without_pools():
+    session = Session()
+    session.mount('mock://', requests_mock.Adapter())
+    for prefix in ('http://', 'https://'):
+        del session.adapters[prefix]
+    assert session.pool_stats() == []
+
+
+def test_pool_stats_reuse_ratio_without_requests():
+    stats = PoolStats(scheme='https', host='citrine-testing.fake', port=443, maxsize=10,
+                      in_use=0, idle=0, num_connections=0, num_requests=0)
+    assert stats.reuse_ratio == 0.0
+
+
+def test_request_events(session: Session):
+    events = []
+    session.subscribe(events.append)
+
+    with requests_mock.Mocker() as m:
+        m.put('http://citrine-testing.fake/api/v1/projects/3f0c4b4e-8d4e-4a0c-9a53-2b3c1f1a1e22',
+              json={'foo': 'bar'})
+        m.get('http://citrine-testing.fake/api/v1/missing', status_code=404)
+        session.put_resource('/projects/3f0c4b4e-8d4e-4a0c-9a53-2b3c1f1a1e22', json={'a': 1})
+        with pytest.raises(NotFound):
+            session.get_resource('/missing')
+
+    put, get = events
+    assert put.method == 'PUT'
+    assert put.route == 'projects/{id}'
+    assert put.version == 'v1'
+    assert put.status_code == 200
+    assert put.elapsed >= 0
+    assert put.bytes_sent == len(json.dumps({'a': 1}))
+    assert put.bytes_received == len(json.dumps({'foo': 'bar'}))
+    assert put.retries == 0
+    assert (get.route, get.status_code) == ('missing', 404)
+
+    session.unsubscribe(events.append)
+    with requests_mock.Mocker() as m:
+        m.get('http://citrine-testing.fake/api/v1/foo', json={})
+        session.get_resource('/foo')
+    assert len(events) == 2
+
+
+def test_request_event_counts_token_retry(session: Session):
+    metrics = RequestMetrics()
+    session.subscribe(metrics)
+    token_refresh_response = refresh_token(datetime(2019, 3, 14, tzinfo=pytz.utc))
+
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/tokens/refresh', json=token_refresh_response)
+        m.register_uri('POST', 'http://citrine-testing.fake/api/v1/foo', [
+            {'status_code': 401, 'json': {'reason': 'invalid-token'}},
+            {'json': {'foo': 'bar'}}
+        ])
+        session.post_resource('/foo', json={'data': 'hi'})
+
+    assert metrics.summary()[('POST', 'foo')]['retries'] == 1
+
+
+def test_request_event_counts_text_body(session: Session):
+    events = []
+    session.subscribe(events.append)
+
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/foo', json={})
+        session.checked_post('/foo', json=None, data='caf\u00e9')
+
+    assert events[0].bytes_sent == len('caf\u00e9'.encode('utf-8'))
+
+
+def test_request_details_are_logged_at_debug_level(session: Session, caplog):
+    caplog.set_level(logging.DEBUG, logger='citrine._session')
+
+    with requests_mock.Mocker() as m:
+        m.get('http://citrine-testing.fake/api/v1/foo', json={})
+        session.get_resource('/foo', params={'page': 2})
+
+    assert 'END request details.' in caplog.text
+    assert "params: {'page': 2}" in caplog.text
+
+
+def test_subscriber_errors_are_ignored(session: Session):
+    def broken(event):
+        raise RuntimeError('oops')
+
+    session.subscribe(broken)
+    with requests_mock.Mocker() as m:
+        m.get('http://citrine-testing.fake/api/v1/foo', json={'foo': 'bar'})
+        assert session.get_resource('/foo') == {'foo': 'bar'}
+
+
+def test_request_event_counts_urllib3_retries(local_server):
+    session = Session(refresh_token='12345', scheme='http', host='127.0.0.1',
+                      port=str(local_server.server_address[1]))
+    session.access_token_expiration = datetime.utcnow() + timedelta(minutes=3)
+    events = []
+    session.subscribe(events.append)
+
+    assert session.get_resource('/flaky') == {'path': '/api/v1/flaky'}
+
+    event, = events
+    assert event.retries == 1
+    assert event.status_code == 200
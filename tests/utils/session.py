@@ -1,7 +1,8 @@
 from json import dumps
-from typing import Callable, Iterator, List
+from typing import List
 from urllib.parse import urlencode
 
+from citrine._session import Session
 from citrine.exceptions import NonRetryableHttpException
 from citrine.resources.api_error import ValidationError
 
@@ -44,6 +45,11 @@ class FakeSession:
         self.s3_use_ssl = True
         self.s3_addressing_style = 'auto'
         self.use_idempotent_dataset_put = False
+        self.history_cache = None
+        self.events = []
+
+    def publish(self, event):
+        self.events.append(event)
 
     def set_response(self, resp):
         self.responses = [resp]
@@ -101,28 +107,7 @@ class FakeSession:
             raise response
         return response
 
-    @staticmethod
-    def cursor_paged_resource(base_method: Callable[..., dict], path: str,
-                              forward: bool = True, per_page: int = 100,
-                              version: str = 'v2', **kwargs) -> Iterator[dict]:
-        """
-        Returns a flat generator of results for an API query.
-
-        Results are fetched in chunks of size `per_page` and loaded lazily.
-        """
-        params = kwargs.get('params', {})
-        params['forward'] = forward
-        params['ascending'] = forward
-        params['per_page'] = per_page
-        kwargs['params'] = params
-        while True:
-            response_json = base_method(path, version=version, **kwargs)
-            for obj in response_json['contents']:
-                yield obj
-            cursor = response_json.get('next')
-            if cursor is None:
-                break
-            params['cursor'] = cursor
+    cursor_paged_resource = staticmethod(Session.cursor_paged_resource)
 
 
 class FakePaginatedSession(FakeSession):